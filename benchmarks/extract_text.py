@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Microbenchmark for Urls_Extraction page text extraction.
+
+Compares the previous BeautifulSoup path (decompose, get_text, str(soup) +
+html2text for short pages, regex collapse, '. ' split) with the single-pass
+lxml engine in scrapers.text_extract over saved pages, and checks that both
+produce the same word counts.
+
+Pages are read from benchmarks/pages/*.html. Save BBC and Sky pages there
+(e.g. from the browser, or with --fetch for the default list), or generate
+the deterministic synthetic article page (~800 KiB) with --synthetic:
+
+    python3 benchmarks/extract_text.py --fetch
+    python3 benchmarks/extract_text.py --synthetic
+    python3 benchmarks/extract_text.py --runs 20
+"""
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from scrapers.text_extract import extract_page  # noqa: E402
+
+PAGES_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'pages')
+MAX_CHARS = 10000
+
+DEFAULT_URLS = {
+    'bbc_football.html': 'https://www.bbc.com/sport/football',
+    'bbc_football_scores.html': 'https://www.bbc.com/sport/football/scores-fixtures',
+    'bbc_champions_league.html': 'https://www.bbc.com/sport/football/champions-league',
+    'sky_football.html': 'https://www.skysports.com/football',
+    'sky_football_news.html': 'https://www.skysports.com/football/news',
+    'sky_champions_league.html': 'https://www.skysports.com/champions-league',
+}
+
+
+def legacy_extract(html: str) -> Dict:
+    """The BeautifulSoup implementation extract_domain used before"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.title.string if soup.title else ""
+    for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header']):
+        element.decompose()
+    content_text = soup.get_text(separator=' ', strip=True)
+    found_urls = set()
+    for link in soup.find_all('a', href=True):
+        if link['href'].startswith('http'):
+            found_urls.add(link['href'])
+    if len(content_text) < 200:
+        import html2text
+        h = html2text.HTML2Text()
+        h.ignore_links = True
+        h.ignore_images = True
+        content_text = h.handle(str(soup))
+    content_text = re.sub(r'\s+', ' ', content_text).strip()
+    sentences = [s.strip() for s in content_text.split('. ') if s.strip()]
+    return {'title': title, 'content': content_text[:MAX_CHARS], 'word_count': len(content_text.split()),
+            'line_count': len(sentences), 'found_urls': list(found_urls)[:100]}
+
+
+def fetch_pages() -> None:
+    import requests
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+    for name, url in DEFAULT_URLS.items():
+        try:
+            resp = requests.get(url, headers=headers, timeout=30)
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"skip {url}: {e}")
+            continue
+        with open(os.path.join(PAGES_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(resp.text)
+        print(f"saved {name} ({len(resp.text) // 1024} KiB)")
+
+
+def write_synthetic_page(directory: str) -> None:
+    """A large news-article-like page: nav/header/footer boilerplate, scripts, many paragraphs and links"""
+    os.makedirs(directory, exist_ok=True)
+    nav = ''.join(f'<li><a href="https://www.example.com/section/{i}">Section {i}</a></li>' for i in range(200))
+    script = '<script>' + 'var tracking = {"id": 12345, "tags": ["sport", "football"]};' * 200 + '</script>'
+    paragraphs = ''.join(
+        f'<p>Paragraph {i}. The match report continues with <a href="https://www.example.com/story/{i}">'
+        f'related story {i}</a> and analysis of the second half. Supporters left the ground happy. '
+        f'Manager comments followed in the press conference after the final whistle.</p>'
+        for i in range(3000))
+    html = (f'<html><head><title>Synthetic match report</title>{script}</head><body>'
+            f'<header><nav><ul>{nav}</ul></nav></header><article><h1>Match report</h1>{paragraphs}</article>'
+            f'<footer><ul>{nav}</ul></footer></body></html>')
+    path = os.path.join(directory, 'synthetic_article.html')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    print(f"saved synthetic_article.html ({len(html) // 1024} KiB)")
+
+
+def best_ms(func: Callable[[str], Dict], html: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(html)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='runs per page (best is reported)')
+    parser.add_argument('--pages', default=PAGES_DIR, help='directory of saved .html pages')
+    parser.add_argument('--fetch', action='store_true', help='download the default BBC/Sky pages first')
+    parser.add_argument('--synthetic', action='store_true', help='write the synthetic article page first')
+    args = parser.parse_args()
+
+    if args.fetch:
+        fetch_pages()
+    if args.synthetic:
+        write_synthetic_page(args.pages)
+    paths = sorted(glob.glob(os.path.join(args.pages, '*.html')))
+    if not paths:
+        print(f"No pages in {args.pages}; save BBC/Sky pages there or run with --fetch or --synthetic")
+        return 1
+
+    engines = {
+        'bs4 (legacy)': legacy_extract,
+        'lxml': lambda h: extract_page(h, max_chars=MAX_CHARS),
+        'lxml early-exit': lambda h: extract_page(h, max_chars=MAX_CHARS, count_all=False),
+    }
+    totals: Dict[str, List[float]] = {name: [] for name in engines}
+    print(f"{'page':<32} {'KiB':>6} " + ' '.join(f"{name:>16}" for name in engines) + f" {'words old/new':>16}")
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            html = f.read()
+        row = []
+        for name, func in engines.items():
+            ms = best_ms(func, html, args.runs)
+            totals[name].append(ms)
+            row.append(f"{ms:>14.2f}ms")
+        old, new = legacy_extract(html), extract_page(html, max_chars=MAX_CHARS)
+        print(f"{os.path.basename(path)[:32]:<32} {len(html) // 1024:>6} " + ' '.join(row)
+              + f" {old['word_count']:>7}/{new['word_count']:<8}")
+
+    base = statistics.mean(totals['bs4 (legacy)'])
+    print()
+    for name, values in totals.items():
+        mean = statistics.mean(values)
+        print(f"{name:<16} mean {mean:8.2f}ms/page  speedup x{base / mean if mean else 0:.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
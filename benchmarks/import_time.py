@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for the scraper entry points.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for each
+entry point, takes the best cumulative time over several runs and fails (exit 1)
+when an entry point is above its startup target.
+
+    python3 benchmarks/import_time.py
+    python3 benchmarks/import_time.py --runs 5 --top 15 --target-ms 200
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Startup budget per entry point (milliseconds, cumulative import time)
+TARGETS_MS: Dict[str, float] = {
+    'interation_scraper_fixed': 250.0,
+    'match_runner': 250.0,
+    'run_all_with_monitor': 300.0,
+    'transfermarkt_parser': 250.0,
+}
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """Return (package, self_us, cumulative_us) rows reported by -X importtime"""
+    env = dict(os.environ, SUPPRESS_CHILD_CONSOLE='1')
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            rows.append((parts[2].rstrip(), int(parts[0]), int(parts[1])))
+        except ValueError:
+            continue
+    return rows
+
+
+def direct_imports(rows: List[Tuple[str, int, int]], module: str) -> List[Tuple[str, int]]:
+    """Imports made directly by `module`, slowest first.
+
+    importtime lists children before their parent, indented two more spaces.
+    """
+    idx = next(i for i, r in enumerate(rows) if r[0].strip() == module)
+    depth = len(rows[idx][0]) - len(rows[idx][0].lstrip())
+    children = []
+    for name, _, cum in reversed(rows[:idx]):
+        indent = len(name) - len(name.lstrip())
+        if indent <= depth:
+            break
+        if indent == depth + 2:
+            children.append((name.strip(), cum))
+    return sorted(children, key=lambda r: r[1], reverse=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Measure import time of each entry point')
+    parser.add_argument('modules', nargs='*', help='Entry points to measure (default: all known)')
+    parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters per entry point (best run is kept)')
+    parser.add_argument('--target-ms', type=float, default=None, help='Override the per-entry-point target')
+    parser.add_argument('--top', type=int, default=0, help='Also list the N slowest top-level imports of the best run')
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules or list(TARGETS_MS):
+        best_rows = None
+        best_us = None
+        for _ in range(max(1, args.runs)):
+            rows = measure(module)
+            total = next((cum for name, _, cum in rows if name.strip() == module), None)
+            if total is not None and (best_us is None or total < best_us):
+                best_us, best_rows = total, rows
+        if best_us is None:
+            print(f"{module:28s} no importtime row found")
+            failed = True
+            continue
+
+        target = args.target_ms if args.target_ms is not None else TARGETS_MS.get(module, 250.0)
+        ms = best_us / 1000.0
+        ok = ms <= target
+        failed = failed or not ok
+        print(f"{module:28s} {ms:8.1f} ms  (target {target:.0f} ms)  {'OK' if ok else 'OVER'}")
+
+        if args.top:
+            for name, cum in direct_imports(best_rows, module)[:args.top]:
+                print(f"    {cum / 1000.0:8.1f} ms  {name}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Page-load benchmark for the headless-browser render profiles.
+
+Loads each URL with a fresh Selenium Chrome per profile (unblocked "full"
+first, then the blocking profiles), waits for readiness as the scrapers do,
+and reports the mean load time per profile and the saving against "full".
+
+    python3 benchmarks/page_load.py https://www.bbc.com/sport/football https://www.skysports.com/football
+    python3 benchmarks/page_load.py --profiles full text --runs 3 <urls...>
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from scrapers.driver import setup_driver  # noqa: E402
+from scrapers.readiness import ReadinessPolicy  # noqa: E402
+from scrapers.render_profile import PROFILES, load_stats  # noqa: E402
+
+DEFAULT_URLS = [
+    'https://www.bbc.com/sport/football',
+    'https://www.skysports.com/football',
+    'https://www.transfermarkt.com/kylian-mbappe/profil/spieler/342229',
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('urls', nargs='*', default=DEFAULT_URLS)
+    parser.add_argument('--profiles', nargs='+', default=['full', 'text'], choices=sorted(PROFILES))
+    parser.add_argument('--runs', type=int, default=2, help='loads per URL and profile')
+    args = parser.parse_args()
+
+    # fixed cap, no learning: both profiles get the same readiness rule
+    readiness = ReadinessPolicy(stats_path=os.devnull)
+    readiness.record = lambda *a, **k: None
+    for name in args.profiles:
+        driver = setup_driver(headless=True, render_profile=name)
+        if not driver:
+            print("Could not start Chrome")
+            return 1
+        try:
+            for url in args.urls:
+                for _ in range(args.runs):
+                    driver.delete_all_cookies()
+                    driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                    started = time.monotonic()
+                    try:
+                        driver.get(url)
+                        readiness.wait_selenium(driver, url)
+                    except Exception as e:
+                        print(f"{name}: {url} failed: {str(e)[:80]}")
+                        continue
+                    seconds = time.monotonic() - started
+                    load_stats.record(name, seconds)
+                    print(f"{name:<12} {seconds:6.2f}s  {url}")
+        finally:
+            driver.quit()
+
+    print()
+    for name, entry in load_stats.summary().items():
+        saving = f"  saving {entry['saving_pct']}% vs full" if 'saving_pct' in entry else ''
+        print(f"{name:<12} {entry['loads']:>3} loads  avg {entry['avg_s']:.2f}s{saving}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Microbenchmark for Transfermarkt page parsing.
+
+Times a full player bundle (one saved page per Transfermarkt page type)
+through the previous BeautifulSoup table walk (find_all('table'),
+find('thead'), per-row find_all(['td', 'th'])) and through the parser
+registry (scrapers.tm_parsers, compiled plans from scrapers.tm_plans), and
+counts the rows each finds.
+
+Pages are read from benchmarks/tm_pages/<page_type>.html (e.g.
+`profil.html`, `leistungsdaten.html`). Save them from the browser, or with
+--fetch for one player:
+
+    python3 benchmarks/tm_parse.py --fetch https://www.transfermarkt.com/robert-lewandowski/profil/spieler/38253
+    python3 benchmarks/tm_parse.py --runs 20
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from scrapers.tm_parsers import REGISTRY, parse_page  # noqa: E402
+
+PAGES_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'tm_pages')
+
+
+def legacy_tables(html: str) -> Dict[str, Any]:
+    """The BeautifulSoup table walk both parser layers used before"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    data: Dict[str, Any] = {}
+    tables = soup.find_all('table', class_='items') or soup.find_all('table')
+    for i, table in enumerate(tables, start=1):
+        headers = []
+        thead = table.find('thead')
+        if thead:
+            for th in thead.find_all('th'):
+                txt = th.get_text(' ', strip=True)
+                headers.append(txt if txt else f'col_{len(headers)+1}')
+        tbody = table.find('tbody') or table
+        rows = []
+        for tr in tbody.find_all('tr'):
+            cols = tr.find_all(['td', 'th'])
+            if not cols:
+                continue
+            rows.append({headers[j] if j < len(headers) else f'col_{j+1}': td.get_text(' ', strip=True)
+                         for j, td in enumerate(cols)})
+        if rows:
+            data[f'table_{i}'] = {'headers': headers, 'rows': rows}
+    return data
+
+
+def plan_parse(page_type: str) -> Callable[[str], Any]:
+    return lambda html: parse_page(page_type, html)
+
+
+def count_rows(data: Any) -> int:
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        return sum(len(v.get('rows', [])) if isinstance(v, dict) and 'rows' in v else count_rows(v)
+                   for v in data.values() if isinstance(v, (list, dict)))
+    return 0
+
+
+def fetch_pages(profile_url: str) -> None:
+    import requests
+    from scrapers.transfermarkt import TransderMarkt_Scraper
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+    for page_type in TransderMarkt_Scraper.PAGE_TYPES:
+        url = profile_url.replace('/profil/', f'/{page_type}/')
+        try:
+            resp = requests.get(url, headers=headers, timeout=30)
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"skip {url}: {e}")
+            continue
+        with open(os.path.join(PAGES_DIR, f'{page_type}.html'), 'w', encoding='utf-8') as f:
+            f.write(resp.text)
+        print(f"saved {page_type} ({len(resp.text) // 1024} KiB)")
+        time.sleep(2)
+
+
+def best_ms(func: Callable[[str], Any], html: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(html)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='runs per page (best is reported)')
+    parser.add_argument('--pages', default=PAGES_DIR, help='directory of saved <page_type>.html pages')
+    parser.add_argument('--fetch', metavar='PROFILE_URL', help='download every page type of this player first')
+    args = parser.parse_args()
+
+    if args.fetch:
+        fetch_pages(args.fetch)
+    paths = sorted(glob.glob(os.path.join(args.pages, '*.html')))
+    if not paths:
+        print(f"No pages in {args.pages}; save Transfermarkt pages there or run with --fetch")
+        return 1
+
+    totals: Dict[str, List[float]] = {'bs4 (legacy)': [], 'plans': []}
+    print(f"{'page':<28} {'KiB':>6} {'bs4 (legacy)':>14} {'plans':>12} {'rows old/new':>14}")
+    for path in paths:
+        page_type = REGISTRY.detect(path) or os.path.splitext(os.path.basename(path))[0]
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            html = f.read()
+        new = plan_parse(page_type)
+        old_ms, new_ms = best_ms(legacy_tables, html, args.runs), best_ms(new, html, args.runs)
+        totals['bs4 (legacy)'].append(old_ms)
+        totals['plans'].append(new_ms)
+        print(f"{page_type[:28]:<28} {len(html) // 1024:>6} {old_ms:>12.2f}ms {new_ms:>10.2f}ms "
+              f"{count_rows(legacy_tables(html)):>6}/{count_rows(new(html)):<7}")
+
+    base = sum(totals['bs4 (legacy)'])
+    print()
+    for name, values in totals.items():
+        print(f"{name:<14} bundle {sum(values):8.2f}ms  mean {statistics.mean(values):7.2f}ms/page  "
+              f"speedup x{base / sum(values) if sum(values) else 0:.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,11 +20,12 @@ try:
             sys.stderr = f
         except Exception:
             pass
-    import interation_scraper_fixed as isf
+    # scrapers are imported per runner below, so a process only loads its own backend
+    import scrapers  # noqa: F401
 except Exception:
     # ensure import path when executed from the same folder
     sys.path.insert(0, os.path.dirname(__file__))
-    import interation_scraper_fixed as isf
+    import scrapers  # noqa: F401
 
 LOG_FORMAT = '%(asctime)s - PID:%(process)d - %(levelname)s - %(message)s'
 DEFAULT_LOG_DIR = os.path.join(os.path.dirname(__file__), 'logs')
@@ -36,6 +37,8 @@ def configure_logging(logfile: str = None):
     # remove existing handlers
     for h in list(root.handlers):
         root.removeHandler(h)
+        # long-lived pool workers call this once per match: don't leak the previous log file
+        h.close()
 
     formatter = logging.Formatter(LOG_FORMAT)
     # add stream handler only when not suppressed by environment
@@ -59,11 +62,14 @@ logger = logging.getLogger('match_runner')
 
 
 def run_urls(path=None):
+    from scrapers.config import Config
+    from scrapers.driver import setup_driver
+    from scrapers.urls import Urls_Extraction
     logger.info('Starting URL extraction')
-    driver = isf.setup_driver()
+    driver = setup_driver()
     try:
-        urls = isf.Config().load_config(path) if path else isf.Config().load_config(os.path.join(os.path.dirname(__file__), 'config', 'urls.json'))
-        scraper = isf.Urls_Extraction()
+        urls = Config().load_config(path) if path else Config().load_config(os.path.join(os.path.dirname(__file__), 'config', 'urls.json'))
+        scraper = Urls_Extraction()
         results = scraper.execution_url_agentent(driver, urls)
         logger.info('URL extraction finished: %d items', len(results) if results else 0)
         return results
@@ -76,11 +82,14 @@ def run_urls(path=None):
 
 
 def run_news(path=None):
+    from scrapers.config import Config
+    from scrapers.driver import setup_driver
+    from scrapers.news import News_Scraper
     logger.info('Starting News scraping')
-    driver = isf.setup_driver()
+    driver = setup_driver()
     try:
-        tasks = isf.Config.load_tasks(path or os.path.join(os.path.dirname(__file__), 'config', 'tasks.json'))
-        scraper = isf.News_Scraper()
+        tasks = Config.load_tasks(path or os.path.join(os.path.dirname(__file__), 'config', 'tasks.json'))
+        scraper = News_Scraper()
         results = scraper.execution_url_agentent(driver, tasks)
         logger.info('News scraping finished: %d items', len(results) if results else 0)
         return results
@@ -93,17 +102,20 @@ def run_news(path=None):
 
 
 def run_transfermarkt(path=None):
+    from scrapers.config import Config
+    from scrapers.transfermarkt import TransderMarkt_Scraper
     logger.info('Starting Transfermarkt scraping')
-    players = isf.Config.load_player_urls(path or os.path.join(os.path.dirname(__file__), 'config', 'players.json'))
-    scraper = isf.TransderMarkt_Scraper()
+    players = Config.load_player_urls(path or os.path.join(os.path.dirname(__file__), 'config', 'players.json'))
+    scraper = TransderMarkt_Scraper()
     results = scraper.execution_url_agentent(None, players)
     logger.info('Transfermarkt scraping finished: %d players', len(results) if results else 0)
     return results
 
 
 def run_reddit(path=None):
+    from scrapers.reddit import Redit_Twitter_Scraper
     logger.info('Starting Reddit scraping')
-    scr = isf.Redit_Twitter_Scraper(keywords_file=path or os.path.join(os.path.dirname(__file__), 'config', 'comment.json'))
+    scr = Redit_Twitter_Scraper(keywords_file=path or os.path.join(os.path.dirname(__file__), 'config', 'comment.json'))
     if scr.keywords:
         results = scr.scrape_by_keywords(scr.keywords, per_keyword_limit=200)
     else:
@@ -137,16 +149,8 @@ def run_all():
     return out
 
 
-def run_match(match_id: str, matches_path: str = None) -> dict:
-    """Run scrapers for a single match identified by `match_id` from matches.json.
-    Returns the match_results dict from MatchOrchestrator.run_match_scraper.
-    """
-    # create per-process log file so errors are traceable
-    pid = os.getpid()
-    logdir = os.environ.get('MATCH_LOG_DIR', DEFAULT_LOG_DIR)
-    logfile = os.path.join(logdir, f'match_{match_id}_{pid}.log')
-    configure_logging(logfile)
-
+def load_match(match_id: str, matches_path: str = None):
+    """Find `match_id` in matches.json. Returns (match, global_settings) or (None, {})."""
     # locate matches.json by default
     if not matches_path:
         matches_path = os.path.join(os.path.dirname(__file__), 'config', 'matches.json')
@@ -158,7 +162,7 @@ def run_match(match_id: str, matches_path: str = None) -> dict:
             cfg = json.load(f)
     except Exception as e:
         logger.exception('Cannot load matches.json: %s', e)
-        return {}
+        return None, {}
 
     if isinstance(cfg, dict):
         matches = cfg.get('matches', [])
@@ -168,29 +172,49 @@ def run_match(match_id: str, matches_path: str = None) -> dict:
         global_settings = {}
     else:
         logger.error('Unexpected matches.json structure: %s', type(cfg))
-        return {}
+        return None, {}
 
-    target = None
     for m in matches:
         try:
             if m.get('match_id') == match_id:
-                target = m
-                break
+                return m, global_settings
         except Exception:
             continue
 
+    logger.error('Match id %s not found in %s', match_id, matches_path)
+    return None, global_settings
+
+
+def run_match(match_id: str, matches_path: str = None, driver=None, orchestrator=None, loaded=None) -> dict:
+    """Run scrapers for a single match identified by `match_id` from matches.json.
+    Returns the match_results dict from MatchOrchestrator.run_match_scraper.
+
+    `driver` and `orchestrator` may be supplied by a long-lived pool worker;
+    they are then reused and left open for the next match. `loaded` is the
+    (match, global_settings) pair when the caller already ran load_match.
+    """
+    # create per-process log file so errors are traceable
+    pid = os.getpid()
+    logdir = os.environ.get('MATCH_LOG_DIR', DEFAULT_LOG_DIR)
+    logfile = os.path.join(logdir, f'match_{match_id}_{pid}.log')
+    configure_logging(logfile)
+
+    target, global_settings = loaded or load_match(match_id, matches_path)
     if not target:
-        logger.error('Match id %s not found in %s', match_id, matches_path)
         return {}
 
-    # create driver and orchestrator
-    driver = None
-    try:
-        driver = isf.setup_driver()
-    except Exception:
-        driver = None
+    from scrapers.driver import setup_driver
+    from scrapers.orchestrator import MatchOrchestrator
 
-    orch = isf.MatchOrchestrator(max_workers=3, output_base_dir=global_settings.get('output_base_dir', 'match_data'))
+    # create driver and orchestrator unless the caller owns them
+    owns_driver = driver is None
+    if owns_driver:
+        try:
+            driver = setup_driver()
+        except Exception:
+            driver = None
+
+    orch = orchestrator or MatchOrchestrator(max_workers=3, output_base_dir=global_settings.get('output_base_dir', 'match_data'))
 
     try:
         result = orch.run_match_scraper(target, driver)
@@ -199,7 +223,7 @@ def run_match(match_id: str, matches_path: str = None) -> dict:
         logger.exception('Error running match %s', match_id)
         return {}
     finally:
-        if driver:
+        if driver and owns_driver:
             try:
                 driver.quit()
             except Exception:
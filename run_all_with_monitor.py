@@ -41,6 +41,7 @@ try:
 except Exception:
     PSUTIL_AVAILABLE = False
 
+import queue
 import shutil
 from collections import deque
 
@@ -204,6 +205,206 @@ def _collect_proc_stats(pid: int) -> dict:
             return {'pid': pid, 'cpu': 0.0, 'mem_mb': 0.0, 'status': 'stopped'}
 
 
+def _export_child_env(max_batches_per_match: Optional[int] = None, posts_per_batch: Optional[int] = None) -> None:
+    """Propagate batch limit and posts-per-batch to children via env vars."""
+    if max_batches_per_match is not None:
+        os.environ['MAX_BATCHES_PER_MATCH'] = str(max_batches_per_match)
+    else:
+        os.environ.pop('MAX_BATCHES_PER_MATCH', None)
+    if posts_per_batch is not None:
+        os.environ['POSTS_PER_BATCH'] = str(posts_per_batch)
+    else:
+        os.environ.pop('POSTS_PER_BATCH', None)
+    # suppress child console logging so supervisor CLI only shows the top view
+    os.environ['SUPPRESS_CHILD_CONSOLE'] = '1'
+
+
+def _worker_loop(worker_id: int, task_queue, event_queue, matches_path=None):
+    """Long-lived pool worker.
+    Imports the scrapers once, keeps its browser and scraper HTTP sessions warm,
+    and pulls match ids from `task_queue` until it receives None. A ('ready', ...)
+    event is sent once the imports are done, a ('start', ...) event before each
+    match and a ('done', ...) event after it, so the supervisor knows which match
+    a crashed worker was holding.
+    """
+    from scrapers.driver import ensure_driver_alive, setup_driver
+    from scrapers.orchestrator import MatchOrchestrator
+
+    logger.info('Worker %d started in PID %s', worker_id, multiprocessing.current_process().pid)
+    driver = None
+    orchestrators = {}
+    event_queue.put(('ready', worker_id, None))
+    try:
+        while True:
+            match_id = task_queue.get()
+            if match_id is None:
+                break
+            event_queue.put(('start', worker_id, match_id))
+            try:
+                loaded = mr.load_match(match_id, matches_path)
+                base_dir = loaded[1].get('output_base_dir', 'match_data')
+                orch = orchestrators.get(base_dir)
+                if orch is None:
+                    orch = MatchOrchestrator(max_workers=3, output_base_dir=base_dir, reuse_scrapers=True)
+                    orchestrators[base_dir] = orch
+                driver = ensure_driver_alive(driver) if driver else setup_driver()
+                mr.run_match(match_id, matches_path, driver=driver, orchestrator=orch, loaded=loaded)
+            except Exception:
+                logger.exception('Worker %d: match %s crashed', worker_id, match_id)
+            event_queue.put(('done', worker_id, match_id))
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def start_worker_pool(match_ids, path=None, restart_failed=False, max_restarts=2, workers: int = 4, max_total: Optional[int] = None, max_batches_per_match: Optional[int] = None, posts_per_batch: Optional[int] = None):
+    """Run matches on `workers` long-lived processes fed from a shared queue.
+    A worker that dies mid-match is replaced; with `restart_failed` the match it
+    was holding is re-queued up to `max_restarts` times.
+    """
+    ids = list(match_ids if max_total is None else match_ids[:max_total])
+    if not ids:
+        return
+    _export_child_env(max_batches_per_match, posts_per_batch)
+
+    task_queue = multiprocessing.Queue()
+    event_queue = multiprocessing.Queue()
+    for match_id in ids:
+        task_queue.put(match_id)
+
+    restarts = {match_id: 0 for match_id in ids}
+    # matches not yet finished ('done') or given up on
+    pending = set(ids)
+    # matches put on task_queue and not yet announced by a 'start' event
+    # (Queue.empty() is not reliable across processes)
+    queued = len(ids)
+    # workers past their imports, i.e. able to take work
+    ready = set()
+    pool = {}
+    current = {}
+    idle_crashes = 0
+    next_id = 0
+    stalled = 0
+
+    def _spawn():
+        nonlocal next_id
+        next_id += 1
+        p = multiprocessing.Process(target=_worker_loop, args=(next_id, task_queue, event_queue, path), name=f'worker-{next_id}')
+        p.start()
+        pool[next_id] = p
+        logger.info('Launched worker %d PID=%s', next_id, p.pid)
+
+    def _drain():
+        nonlocal queued
+        seen = 0
+        while True:
+            try:
+                kind, wid, match_id = event_queue.get_nowait()
+            except queue.Empty:
+                return seen
+            seen += 1
+            if kind == 'ready':
+                ready.add(wid)
+            elif kind == 'start':
+                queued -= 1
+                current[wid] = match_id
+                logger.info('Worker %d started match %s', wid, match_id)
+            else:
+                current.pop(wid, None)
+                pending.discard(match_id)
+                logger.info('Worker %d finished match %s (%d remaining)', wid, match_id, len(pending))
+
+    def _retry_or_fail(match_id):
+        nonlocal queued
+        if restart_failed and restarts[match_id] < max_restarts:
+            restarts[match_id] += 1
+            logger.info('Restarting %s (attempt %d)', match_id, restarts[match_id])
+            queued += 1
+            task_queue.put(match_id)
+        else:
+            pending.discard(match_id)
+            logger.error('Giving up on %s', match_id)
+
+    for _ in range(min(workers, len(pending))):
+        _spawn()
+
+    try:
+        while True:
+            events = _drain()
+
+            process_rows = []
+            for wid, p in list(pool.items()):
+                if p.is_alive():
+                    if PSUTIL_AVAILABLE:
+                        proc_stats = _collect_proc_detailed(p.pid)
+                        proc_stats['match_name'] = current.get(wid, 'idle')
+                        process_rows.append(proc_stats)
+                    else:
+                        stats = _collect_proc_stats(p.pid)
+                        process_rows.append({'pid': p.pid, 'name': current.get(wid, 'idle'), 'cpu': stats['cpu'], 'time': '0:00', 'threads': 0, 'mem': stats['mem_mb'], 'status': stats['status']})
+                    continue
+                pool.pop(wid)
+                ready.discard(wid)
+                # its 'start'/'done' event may still be in the pipe
+                events += _drain()
+                match_id = current.pop(wid, None)
+                if match_id is None:
+                    if p.exitcode != 0:
+                        idle_crashes += 1
+                        logger.error('Worker %d exited with code %s while idle', wid, p.exitcode)
+                    continue
+                logger.warning('Worker %d died (exit code %s) while running %s', wid, p.exitcode, match_id)
+                _retry_or_fail(match_id)
+
+            # a worker killed right after taking a match may never have announced it
+            # (event lost with its queue feeder): when matches are still counted as
+            # queued but idle ready workers take none of them for two quiet rounds in a
+            # row, every unfinished match not held by a worker is lost
+            if pending and queued > 0 and not current and not events and ready & set(pool):
+                stalled += 1
+            else:
+                stalled = 0
+            if stalled >= 2:
+                stalled = 0
+                queued = 0
+                for match_id in sorted(pending - set(current.values())):
+                    logger.warning('Match %s was taken by a worker that died before reporting it', match_id)
+                    _retry_or_fail(match_id)
+
+            outstanding = len(pending)
+            if outstanding <= 0:
+                for _ in pool:
+                    task_queue.put(None)
+                for p in pool.values():
+                    p.join(timeout=30)
+                logger.info('All match processes completed')
+                break
+            if idle_crashes > max_restarts and not pool:
+                logger.error('Workers keep crashing before taking work, giving up with %d matches left', outstanding)
+                break
+            # replace dead workers while there is still work to do
+            while len(pool) < min(workers, outstanding):
+                _spawn()
+
+            if PSUTIL_AVAILABLE:
+                _display_top(sorted(process_rows, key=lambda x: x.get('cpu', 0.0), reverse=True))
+            else:
+                logger.info('--- Workers status ---')
+                for r in process_rows:
+                    logger.info('Match:%s PID:%s CPU:%.1f%% MEM:%.1fMB STATUS:%s', r.get('name'), r.get('pid'), r.get('cpu', 0.0), r.get('mem', 0), r.get('status'))
+            time.sleep(3)
+    except KeyboardInterrupt:
+        logger.info('KeyboardInterrupt received, terminating workers...')
+        for p in pool.values():
+            try:
+                p.terminate()
+            except Exception:
+                pass
+
+
 def start_processes(scrapers, matches_cfg_path=None, path=None, restart_failed=False, max_restarts=2, max_concurrent: int = 4, max_total: Optional[int] = None, max_batches_per_match: Optional[int] = None, posts_per_batch: Optional[int] = None):
     processes = {}
     restarts = {name: 0 for name in scrapers}
@@ -218,17 +419,7 @@ def start_processes(scrapers, matches_cfg_path=None, path=None, restart_failed=F
         if max_total is not None and started_count >= max_total:
             return None
         match_id = pending.popleft()
-        # propagate batch limit and posts-per-batch to child via env vars
-        if max_batches_per_match is not None:
-            os.environ['MAX_BATCHES_PER_MATCH'] = str(max_batches_per_match)
-        else:
-            os.environ.pop('MAX_BATCHES_PER_MATCH', None)
-        if posts_per_batch is not None:
-            os.environ['POSTS_PER_BATCH'] = str(posts_per_batch)
-        else:
-            os.environ.pop('POSTS_PER_BATCH', None)
-        # suppress child console logging so supervisor CLI only shows the top view
-        os.environ['SUPPRESS_CHILD_CONSOLE'] = '1'
+        _export_child_env(max_batches_per_match, posts_per_batch)
         p = multiprocessing.Process(target=_target_wrapper, args=('run_match', match_id, path), name=f'match-{match_id}')
         p.start()
         processes[match_id] = p
@@ -313,6 +504,7 @@ def main():
     parser.add_argument('--max-total', type=int, default=None, help='Maximum total match processes to start (optional)')
     parser.add_argument('--max-batches-per-match', type=int, default=None, help='Maximum number of batches to save per match (optional)')
     parser.add_argument('--posts-per-batch', type=int, default=None, help='Number of posts per saved batch (optional)')
+    parser.add_argument('--worker-pool', action='store_true', help='Use --max-concurrent long-lived workers pulling matches from a queue instead of one process per match')
 
     args, unknown = parser.parse_known_args()
 
@@ -370,6 +562,18 @@ def main():
         chosen_path = candidate_conf
 
     logger.info('Supervisor starting for matches: %s', ','.join(match_ids))
+    if args.worker_pool:
+        start_worker_pool(
+            match_ids,
+            path=chosen_path,
+            restart_failed=args.restart_failed,
+            max_restarts=args.max_restarts,
+            workers=args.max_concurrent,
+            max_total=args.max_total,
+            max_batches_per_match=args.max_batches_per_match,
+            posts_per_batch=args.posts_per_batch,
+        )
+        return
     start_processes(
         match_ids,
         path=chosen_path,
@@ -0,0 +1,14 @@
+"""Scraper package.
+
+Each scraper lives in its own module so a process only loads what it runs:
+
+- scrapers.config        Config, BatchProcessor
+- scrapers.driver        setup_driver (Selenium)
+- scrapers.urls          Urls_Extraction
+- scrapers.news          News_Scraper
+- scrapers.transfermarkt TransderMarkt_Scraper
+- scrapers.reddit        Redit_Twitter_Scraper, RedditPost, RedditComment
+- scrapers.orchestrator  MatchOrchestrator, main_single, main_parallel
+
+Submodules are not imported here; `interation_scraper_fixed` re-exports them lazily.
+"""
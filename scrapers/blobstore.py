@@ -0,0 +1,82 @@
+"""Content-addressed, compressed store for raw page HTML.
+
+Result records keep only a reference (`sha256:<hex>`) to the page; the HTML
+itself is written once, gzip-compressed, to
+`cache/html_blobs/<hex[:2]>/<hex>.html.gz`. Identical pages fetched by several
+matches or runs share one blob.
+"""
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Optional
+
+from .common import logger
+
+REF_PREFIX = 'sha256:'
+
+
+class BlobStore:
+    """Deduplicating gzip blob store keyed by SHA-256 of the content"""
+
+    def __init__(self, root: Optional[str] = None, compresslevel: int = 6):
+        self.root = root or os.path.join(os.getcwd(), 'cache', 'html_blobs')
+        self.compresslevel = compresslevel
+        self.stats = {'written': 0, 'deduplicated': 0, 'bytes_in': 0, 'bytes_stored': 0}
+        # put() is called from pipeline worker threads
+        self._lock = threading.Lock()
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}.html.gz")
+
+    def put(self, text: str) -> Optional[str]:
+        """Store `text` (if not stored yet) and return its reference"""
+        if not text:
+            return None
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        with self._lock:
+            self.stats['bytes_in'] += len(data)
+        if os.path.exists(path):
+            with self._lock:
+                self.stats['deduplicated'] += 1
+            return REF_PREFIX + digest
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{digest[:8]}.", suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(gzip.compress(data, compresslevel=self.compresslevel))
+                # concurrent writers of the same content produce the same file
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except Exception as e:
+            logger.error(f"Error storing HTML blob {digest[:12]}: {e}")
+            return None
+        stored = os.path.getsize(path)
+        with self._lock:
+            self.stats['written'] += 1
+            self.stats['bytes_stored'] += stored
+        return REF_PREFIX + digest
+
+    def get(self, ref: Optional[str]) -> Optional[str]:
+        """HTML for a reference returned by `put`, or None when missing/unreadable"""
+        if not ref or not ref.startswith(REF_PREFIX):
+            return None
+        path = self._path(ref[len(REF_PREFIX):])
+        try:
+            with open(path, 'rb') as f:
+                return gzip.decompress(f.read()).decode('utf-8')
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading HTML blob {path}: {e}")
+            return None
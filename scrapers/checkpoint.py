@@ -0,0 +1,64 @@
+"""Resumable checkpoint journal for URL and news scraping.
+
+Each scraper of each match appends one JSON line per completed unit of work
+(a URL, a GNews keyword, a resolved Google redirect, an article) to
+`<match_dir>/checkpoints/<scraper>.jsonl`. A restarted match process replays the
+journal, skips the finished units and reuses their results. The journal is
+removed once the scraper completes, so the next full run starts fresh.
+"""
+import os
+import threading
+from typing import Any, Dict, List, Tuple
+
+from .common import logger
+from .storage import WriteAheadLog
+
+
+class CheckpointJournal:
+    """Append-only journal of completed work units for one scraper"""
+
+    def __init__(self, directory: str, scraper: str):
+        self.directory = directory
+        self.scraper = scraper
+        self.path = os.path.join(directory, f"{scraper}.jsonl")
+        # a torn last line from a killed process is dropped by the log
+        self._log = WriteAheadLog(self.path)
+        self._done: Dict[Tuple[str, str], Any] = {}
+        # pipeline stages record from several threads
+        self._lock = threading.Lock()
+        self._load()
+        if self._done:
+            logger.info(f"Resuming {scraper} from checkpoint: {len(self._done)} completed units in {self.path}")
+
+    def _load(self) -> None:
+        for entry in self._log.records():
+            try:
+                self._done[(entry['unit'], entry['key'])] = entry.get('value')
+            except (KeyError, TypeError):
+                continue
+
+    def is_done(self, unit: str, key: str) -> bool:
+        """True when `key` of the given unit type has already been completed"""
+        return (unit, key) in self._done
+
+    def get(self, unit: str, key: str, default: Any = None) -> Any:
+        """Stored result of a completed unit"""
+        return self._done.get((unit, key), default)
+
+    def items(self, unit: str) -> List[Tuple[str, Any]]:
+        """All completed (key, value) pairs of a unit type, in completion order"""
+        return [(k, v) for (u, k), v in self._done.items() if u == unit]
+
+    def record(self, unit: str, key: str, value: Any = None) -> None:
+        """Mark a unit as completed and durably append it to the journal"""
+        with self._lock:
+            self._done[(unit, key)] = value
+            try:
+                self._log.append({'unit': unit, 'key': key, 'value': value})
+            except Exception as e:
+                logger.error(f"Error writing checkpoint {self.path}: {e}")
+
+    def finish(self) -> None:
+        """The scraper completed: drop the journal so the next run starts from scratch"""
+        self._done.clear()
+        self._log.reset()
@@ -0,0 +1,68 @@
+"""Shared helpers for the scraper package: logging, lazy imports, optional backends."""
+import importlib
+import importlib.util
+import logging
+import os
+from typing import Any, Dict, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Repository root (config/, matches.json, ...)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy backends (bs4, selenium, html2text, newspaper/nltk, playwright, gnews)
+# are imported on first use so that e.g. a Reddit-only
+# process only pays for `requests`. Availability is probed without importing.
+_LAZY_MODULES: Dict[str, Any] = {}
+
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _lazy(module: str, attr: Optional[str] = None) -> Any:
+    """Import `module` on first use (cached) and optionally return one of its attributes"""
+    mod = _LAZY_MODULES.get(module)
+    if mod is None:
+        mod = importlib.import_module(module)
+        _LAZY_MODULES[module] = mod
+    return getattr(mod, attr) if attr else mod
+
+
+def _soup(html: str) -> Any:
+    """Parse HTML with BeautifulSoup (html.parser), importing bs4 lazily"""
+    return _lazy('bs4', 'BeautifulSoup')(html, 'html.parser')
+
+
+# Check for optional dependencies
+PLAYWRIGHT_AVAILABLE = _module_available('playwright')
+GNEWS_AVAILABLE = _module_available('gnews')
+
+# Helper for colored log output (green)
+def _green(msg: str) -> str:
+    return f"\033[92m{msg}\033[0m"
+
+
+_backends_reported = False
+
+
+def report_backends() -> None:
+    """Log once per process which optional backends are available (called by the scrapers that use them,
+    so importing e.g. the parser modules stays quiet)"""
+    global _backends_reported
+    if _backends_reported:
+        return
+    _backends_reported = True
+    if PLAYWRIGHT_AVAILABLE:
+        logger.info(_green("Playwright available — JS rendering enabled"))
+    else:
+        logger.warning("Playwright not available, some features disabled")
+    if GNEWS_AVAILABLE:
+        logger.info(_green("GNews available — news search enabled"))
+    else:
+        logger.warning("GNews not available, news scraping disabled")
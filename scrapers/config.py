@@ -0,0 +1,182 @@
+"""Scraper configuration and batch/progress persistence."""
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from .common import PROJECT_ROOT, logger
+from .storage import WriteAheadLog, atomic_write_json
+
+
+class Config:
+    """Configuration class for all scrapers"""
+    
+    def __init__(self):
+        self.output_directory = 'content_output'
+        self.batch_size = 100
+        # Allow overriding posts per batch via env var POSTS_PER_BATCH
+        try:
+            env_bs = os.environ.get('POSTS_PER_BATCH')
+            if env_bs is not None and str(env_bs).strip() != '':
+                self.batch_size = int(env_bs)
+        except Exception:
+            pass
+        self.delay_between_requests = 1.0
+        self.max_content_length = 10000
+        self.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        self.request_timeout = 30
+        # Limit number of batches saved per match (0 = unlimited). Can be set via env var MAX_BATCHES_PER_MATCH
+        try:
+            self.max_batches_per_match = int(os.environ.get('MAX_BATCHES_PER_MATCH', '0') or 0)
+        except Exception:
+            self.max_batches_per_match = 0
+        self._batches_written = 0
+        
+    def load_config(self, path: Optional[str] = None) -> List[Any]:
+        if not path:
+            path = os.path.join(PROJECT_ROOT, 'config', 'urls.json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"Config file not found: {path}")
+            return []
+        except Exception as e:
+            logger.error(f"Error loading config from {path}: {e}")
+            return []
+    
+    @classmethod
+    def load_tasks(cls, path: Optional[str] = None) -> List[Any]:
+        """Load tasks from JSON file"""
+        if not path:
+            path = os.path.join(PROJECT_ROOT, 'config', 'tasks.json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return []
+    
+    @classmethod
+    def load_player_urls(cls, path: Optional[str] = None) -> List[Any]:
+        """Load player URLs from JSON file"""
+        if not path:
+            path = os.path.join(PROJECT_ROOT, 'config', 'players.json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return []
+    
+    def save_batch(self, batch: List[Dict], output_dir: str, start_idx: int, end_idx: int, timestamp: int) -> None:
+        """Save a batch of results to file"""
+        os.makedirs(output_dir, exist_ok=True)
+        # Respect max batches per match setting
+        if self.max_batches_per_match and self._batches_written >= self.max_batches_per_match:
+            logger.info(f"Max batches per match reached ({self.max_batches_per_match}), skipping save for {start_idx}-{end_idx}")
+            return
+
+        filename = f"batch_{timestamp}_{start_idx:05d}-{end_idx:05d}.json"
+        filepath = os.path.join(output_dir, filename)
+        
+        try:
+            atomic_write_json(filepath, batch)
+            logger.info(f"Saved batch {start_idx}-{end_idx} to {filepath}")
+            # increment counter after successful save
+            try:
+                self._batches_written += 1
+            except Exception:
+                pass
+        except Exception as e:
+            logger.error(f"Error saving batch: {e}")
+    
+    def generate_report(self, result: Dict, stats: Dict) -> None:
+        """Update statistics based on result"""
+        if not isinstance(result, dict):
+            return
+        if result.get('success'):
+            stats['success'] = stats.get('success', 0) + 1
+            stats['total_words'] = stats.get('total_words', 0) + result.get('word_count', 0)
+            stats['total_lines'] = stats.get('total_lines', 0) + result.get('line_count', 0)
+        else:
+            stats['failed'] = stats.get('failed', 0) + 1
+
+
+class BatchProcessor:
+    """Handles batch processing and progress tracking"""
+    
+    SNAPSHOT_EVERY = 50
+    
+    def __init__(self, batch_size: int = 100, output_dir: str = "output"):
+        self.batch_size = batch_size
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self.progress_file = os.path.join(output_dir, "progress.json")
+        # Every save_progress is appended to the WAL; the snapshot is only
+        # rewritten every SNAPSHOT_EVERY records, so recovery reads at most one
+        # snapshot and the last WAL record
+        self.progress_wal = WriteAheadLog(os.path.join(output_dir, "progress.wal"))
+        
+    def load_progress(self) -> Dict:
+        """Load progress: newest WAL record, else the snapshot file"""
+        progress = self.progress_wal.last()
+        if isinstance(progress, dict):
+            return progress
+        if os.path.exists(self.progress_file):
+            try:
+                with open(self.progress_file, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Unreadable progress file {self.progress_file}, starting over: {e}")
+        return {
+            "last_after": None,
+            "current_batch": 1,
+            "completed_batches": [],
+            "pages_fetched": 0,
+            "posts_collected": 0,
+            "comments_collected": 0
+        }
+    
+    def save_progress(self, progress: Dict) -> None:
+        """Durably record progress (WAL append, periodic atomic snapshot)"""
+        try:
+            self.progress_wal.append(progress)
+            if self.progress_wal.count >= self.SNAPSHOT_EVERY:
+                atomic_write_json(self.progress_file, progress)
+                self.progress_wal.reset()
+        except Exception as e:
+            logger.error(f"Error saving progress: {e}")
+    
+    def process_batch(self, items: List, batch_num: int, fetch_comments: bool = True) -> Dict[str, int]:
+        """Process a batch of items"""
+        if not items:
+            return {"posts": 0, "comments": 0}
+        
+        # Save batch to file
+        timestamp = int(time.time())
+        filename = f"batch_{batch_num:04d}_{timestamp}.json"
+        filepath = os.path.join(self.output_dir, filename)
+        
+        # Convert items to dict if they have to_dict method
+        batch_data = []
+        for item in items:
+            if hasattr(item, 'to_dict'):
+                batch_data.append(item.to_dict())
+            else:
+                batch_data.append(item)
+        
+        atomic_write_json(filepath, batch_data)
+        
+        logger.info(f"Saved batch {batch_num} with {len(items)} items to {filepath}")
+        
+        return {
+            "posts": len(items),
+            "comments": sum(getattr(item, 'num_comments', 0) for item in items if hasattr(item, 'num_comments'))
+        }
+    
+    def save_stats(self, stats: Dict) -> None:
+        """Save statistics to file"""
+        stats_file = os.path.join(self.output_dir, "stats.json")
+        try:
+            atomic_write_json(stats_file, stats)
+        except Exception as e:
+            logger.error(f"Error saving stats: {e}")
@@ -0,0 +1,47 @@
+"""Selenium WebDriver setup."""
+from typing import Any
+
+from .common import _lazy, logger
+from .config import Config
+from .render_profile import DEFAULT_PROFILE, apply_to_selenium, get_profile
+
+
+def setup_driver(headless: bool = True, render_profile: str = DEFAULT_PROFILE) -> Any:
+    """Setup Selenium WebDriver (downloads restricted by the render profile)"""
+    webdriver = _lazy('selenium.webdriver')
+    chrome_options = webdriver.ChromeOptions()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument(f"user-agent={Config().browser_user_agent}")
+    prefs = get_profile(render_profile).chrome_prefs()
+    if prefs:
+        chrome_options.add_experimental_option("prefs", prefs)
+    
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(30)
+        # Chrome prefs are fixed from here on (see apply_to_selenium)
+        driver._created_profile = get_profile(render_profile).name
+        apply_to_selenium(driver, render_profile)
+        return driver
+    except Exception as e:
+        logger.error(f"Error setting up driver: {e}")
+        return None
+
+
+def ensure_driver_alive(driver: Any, render_profile: str = DEFAULT_PROFILE) -> Any:
+    """Return `driver` when it still responds, otherwise quit it and start a new one"""
+    try:
+        driver.current_url
+        return driver
+    except Exception:
+        logger.warning("Driver died, restarting...")
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        return setup_driver(render_profile=render_profile)
@@ -0,0 +1,133 @@
+"""Concurrent GNews query planning.
+
+A news task is expanded into a keyword x country x language grid. The feed
+queries run on a small thread pool paced by the shared news.google.com token
+bucket (scrapers.ratelimit), and the per-keyword results are merged
+round-robin across countries/languages with URL and title dedup. Keywords
+with a failed query are reported, so callers don't checkpoint partial results.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .common import _lazy, logger
+from .ratelimit import HostRateLimiter, shared_limiter
+
+GNEWS_URL = 'https://news.google.com/rss'
+
+
+class NewsQuery(NamedTuple):
+    keyword: str
+    country: str
+    language: str
+
+
+def plan_queries(keywords: Iterable[str], countries: Iterable[str], languages: Iterable[str]) -> List[NewsQuery]:
+    """Expand keywords into the keyword x country x language grid (deduplicated, in order)"""
+    countries = list(dict.fromkeys(countries)) or ['US']
+    languages = list(dict.fromkeys(languages)) or ['en']
+    return [NewsQuery(k, c, l)
+            for k in dict.fromkeys(keywords)
+            for c in countries
+            for l in languages]
+
+
+def _title_key(title: Optional[str]) -> str:
+    return ' '.join((title or '').lower().split())
+
+
+def merge_results(per_query: List[List[Dict]]) -> List[Dict]:
+    """Interleave result lists, dropping repeated URLs and titles"""
+    merged: List[Dict] = []
+    seen_urls = set()
+    seen_titles = set()
+    for rank in range(max((len(r) for r in per_query), default=0)):
+        for results in per_query:
+            if rank >= len(results):
+                continue
+            item = results[rank]
+            url = item.get('url')
+            title = _title_key(item.get('title'))
+            if (url and url in seen_urls) or (title and title in seen_titles):
+                continue
+            if url:
+                seen_urls.add(url)
+            if title:
+                seen_titles.add(title)
+            merged.append(item)
+    return merged
+
+
+class GNewsQueryPlanner:
+    """Runs a keyword x country x language grid of GNews searches concurrently"""
+
+    def __init__(self, countries: List[str], languages: List[str], max_results: int = 20,
+                 start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                 max_workers: int = 4, rate_limiter: Optional[HostRateLimiter] = None):
+        self.countries = countries
+        self.languages = languages
+        self.max_results = max_results
+        self.start_date = start_date
+        self.end_date = end_date
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or shared_limiter()
+        self.stats = {'queries': 0, 'failed': 0, 'results': 0, 'duplicates': 0}
+        # _run executes on worker threads, search() on pipeline threads
+        self._stats_lock = threading.Lock()
+
+    def _run(self, query: NewsQuery) -> Optional[List[Dict]]:
+        """Results of one query, or None when it failed"""
+        self.rate_limiter.acquire(GNEWS_URL)
+        try:
+            # one client per query: GNews keeps per-search state on the instance
+            news_api = _lazy('gnews', 'GNews')(
+                language=query.language,
+                country=query.country,
+                max_results=self.max_results,
+                start_date=self.start_date,
+                end_date=self.end_date
+            )
+            results = news_api.get_news(query.keyword) or []
+            self.rate_limiter.feedback(GNEWS_URL, None)
+        except Exception as e:
+            logger.error(f"GNews query failed ({query.keyword!r}, {query.country}/{query.language}): {str(e)[:80]}")
+            with self._stats_lock:
+                self.stats['failed'] += 1
+            return None
+        for item in results:
+            item['query_country'] = query.country
+            item['query_language'] = query.language
+        return results
+
+    def search(self, keywords: List[str]) -> Dict[str, List[Dict]]:
+        """Search all keywords; returns {keyword: merged, deduplicated results}"""
+        return self.search_with_failures(keywords)[0]
+
+    def search_with_failures(self, keywords: List[str]) -> Tuple[Dict[str, List[Dict]], Set[str]]:
+        """Search all keywords; returns ({keyword: merged results}, keywords with at least one failed query)"""
+        queries = plan_queries(keywords, self.countries, self.languages)
+        if not queries:
+            return {}, set()
+        logger.info(f"GNews: {len(queries)} queries ({len(set(q.keyword for q in queries))} keywords x "
+                    f"{len(set(q.country for q in queries))} countries x {len(set(q.language for q in queries))} languages)")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as pool:
+            results = list(pool.map(self._run, queries))
+
+        by_keyword: Dict[str, List[List[Dict]]] = {}
+        failed: Set[str] = set()
+        for query, items in zip(queries, results):
+            if items is None:
+                failed.add(query.keyword)
+                items = []
+            by_keyword.setdefault(query.keyword, []).append(items)
+        merged = {}
+        with self._stats_lock:
+            for keyword, lists in by_keyword.items():
+                merged[keyword] = merge_results(lists)
+                total = sum(len(items) for items in lists)
+                self.stats['results'] += len(merged[keyword])
+                self.stats['duplicates'] += total - len(merged[keyword])
+            self.stats['queries'] += len(queries)
+            logger.info(f"GNews query stats: {self.stats}")
+        return merged, failed
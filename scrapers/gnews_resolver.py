@@ -0,0 +1,215 @@
+"""Resolve Google News redirect URLs to publisher URLs without a browser.
+
+Resolution order for each URL:
+
+1. persistent cache (`cache/gnews_resolved.json`, shared by all matches and runs)
+2. offline decode of the base64 article id (older CBMi... ids embed the URL)
+3. plain HTTP, concurrently: redirects, URL attributes in the returned page, and
+   the batchexecute endpoint for newer "AU_yqL" ids
+4. the caller's browser fallback (Selenium), serially, as a last resort
+"""
+import base64
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlparse
+from typing import Callable, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .common import logger
+from .ratelimit import shared_limiter
+from .storage import atomic_write_json
+
+_ARTICLE_ID_PREFIX = b'\x08\x13\x22'
+_SIGNATURE_RE = re.compile(r'data-n-a-sg="([^"]+)"')
+_TIMESTAMP_RE = re.compile(r'data-n-a-ts="([^"]+)"')
+_PAGE_URL_RES = (
+    re.compile(r'data-n-au="(https?://[^"]+)"'),
+    re.compile(r'<meta[^>]+http-equiv="refresh"[^>]+url=([^"\'>]+)', re.I),
+    re.compile(r'<a[^>]+href="(https?://(?![^"]*google\.)[^"]+)"', re.I),
+)
+_BATCHEXECUTE_URL = "https://news.google.com/_/DotsSplashUi/data/batchexecute"
+
+
+def is_google_url(url: str) -> bool:
+    """True for Google (news/consent) hosts, i.e. not yet resolved"""
+    netloc = urlparse(url or '').netloc.lower()
+    return netloc == 'google.com' or netloc.endswith('.google.com')
+
+
+def article_id(google_url: str) -> Optional[str]:
+    """The base64 article id of a news.google.com/(rss/)articles|read/<id> URL"""
+    parts = [p for p in urlparse(google_url).path.split('/') if p]
+    if len(parts) >= 2 and parts[-2] in ('articles', 'read'):
+        return parts[-1]
+    return None
+
+
+def decode_offline(google_url: str) -> Optional[str]:
+    """Decode the publisher URL embedded in an (old-style) article id, or None"""
+    aid = article_id(google_url)
+    if not aid:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(aid + '=' * (-len(aid) % 4))
+    except (ValueError, TypeError):
+        return None
+    if not raw.startswith(_ARTICLE_ID_PREFIX):
+        return None
+    raw = raw[len(_ARTICLE_ID_PREFIX):]
+    # protobuf varint length, then the URL bytes
+    length, shift, pos = 0, 0, 0
+    while pos < len(raw):
+        byte = raw[pos]
+        length |= (byte & 0x7F) << shift
+        pos += 1
+        if not byte & 0x80:
+            break
+        shift += 7
+    url = raw[pos:pos + length].decode('utf-8', errors='ignore')
+    # newer ids carry an opaque "AU_yqL..." token that needs the online endpoint
+    return url if url.startswith(('http://', 'https://')) else None
+
+
+class GoogleNewsResolver:
+    """Concurrent, cached Google News URL resolver"""
+
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    }
+
+    def __init__(self, cache_path: Optional[str] = None, max_workers: int = 8, timeout: int = 15):
+        self.cache_path = cache_path or os.path.join(os.getcwd(), 'cache', 'gnews_resolved.json')
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._lock = threading.Lock()
+        self.rate_limiter = shared_limiter()
+        self._cache: Dict[str, str] = self._load_cache()
+        self.stats = {'cache': 0, 'offline': 0, 'http': 0, 'browser': 0, 'failed': 0}
+
+    def _load_cache(self) -> Dict[str, str]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable GNews URL cache {self.cache_path}: {e}")
+            return {}
+
+    def _save_cache(self) -> None:
+        # merge with entries other processes wrote since we loaded
+        with self._lock:
+            merged = self._load_cache()
+            merged.update(self._cache)
+            self._cache = merged
+            try:
+                atomic_write_json(self.cache_path, merged, indent=None)
+            except Exception as e:
+                logger.error(f"Error saving GNews URL cache: {e}")
+
+    def _cache_key(self, google_url: str) -> str:
+        return article_id(google_url) or google_url
+
+    def resolve_http(self, google_url: str) -> Optional[str]:
+        """Resolve over plain HTTP (redirects, page attributes, batchexecute)"""
+        try:
+            resp = self.rate_limiter.get(self.session, google_url, timeout=self.timeout, allow_redirects=True)
+        except requests.RequestException as e:
+            logger.debug(f"GNews HTTP resolve failed for {google_url}: {e}")
+            return None
+        if resp.url and not is_google_url(resp.url):
+            return resp.url
+        html = resp.text or ''
+        aid = article_id(google_url)
+        sig = _SIGNATURE_RE.search(html)
+        ts = _TIMESTAMP_RE.search(html)
+        if aid and sig and ts:
+            url = self._batchexecute(aid, ts.group(1), sig.group(1))
+            if url:
+                return url
+        for pattern in _PAGE_URL_RES:
+            m = pattern.search(html)
+            if m and not is_google_url(m.group(1)):
+                return m.group(1)
+        return None
+
+    def _batchexecute(self, aid: str, timestamp: str, signature: str) -> Optional[str]:
+        payload = [
+            "Fbv4je",
+            f'["garturlreq",[["X","X",["X","X"],null,null,1,1,"US:en",null,1,null,null,null,null,null,0,1],'
+            f'"X","X",1,[1,1,1],1,1,null,0,0,null,0],"{aid}",{timestamp},"{signature}"]',
+        ]
+        try:
+            resp = self.rate_limiter.request(
+                self.session, 'POST', _BATCHEXECUTE_URL,
+                headers={"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"},
+                data=f"f.req={quote(json.dumps([[payload]]))}",
+                timeout=self.timeout,
+            )
+            body = resp.text.split('\n\n', 1)[-1]
+            url = json.loads(json.loads(body)[0][2])[1]
+            return url if isinstance(url, str) and url.startswith('http') else None
+        except Exception as e:
+            logger.debug(f"GNews batchexecute failed for {aid}: {e}")
+            return None
+
+    def resolve_many(self, google_urls: Iterable[str],
+                     browser_fallback: Optional[Callable[[str], str]] = None) -> Dict[str, str]:
+        """Resolve URLs; returns {google_url: real_url} for every URL that resolved"""
+        resolved: Dict[str, str] = {}
+        learned: Dict[str, str] = {}
+        todo = []
+        for url in dict.fromkeys(u for u in google_urls if u):
+            if not is_google_url(url):
+                resolved[url] = url
+                continue
+            cached = self._cache.get(self._cache_key(url))
+            if cached:
+                resolved[url] = cached
+                self.stats['cache'] += 1
+                continue
+            decoded = decode_offline(url)
+            if decoded:
+                resolved[url] = decoded
+                self.stats['offline'] += 1
+                continue
+            todo.append(url)
+
+        if todo:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(todo))) as pool:
+                for url, real in zip(todo, pool.map(self.resolve_http, todo)):
+                    if real:
+                        resolved[url] = learned[url] = real
+                        self.stats['http'] += 1
+
+        for url in todo:
+            if url in resolved:
+                continue
+            real = browser_fallback(url) if browser_fallback else None
+            if real and not is_google_url(real):
+                resolved[url] = learned[url] = real
+                self.stats['browser'] += 1
+            else:
+                self.stats['failed'] += 1
+
+        # offline-decodable ids are cheap to recompute; only network results are cached
+        if learned:
+            self._cache.update({self._cache_key(u): r for u, r in learned.items()})
+            self._save_cache()
+        logger.info(f"GNews URL resolution: {self.stats}")
+        return resolved
+
+    def resolve(self, google_url: str, browser_fallback: Optional[Callable[[str], str]] = None) -> str:
+        """Resolve one URL; returns the input unchanged when it cannot be resolved"""
+        return self.resolve_many([google_url], browser_fallback).get(google_url, google_url)
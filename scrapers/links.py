@@ -0,0 +1,119 @@
+"""Streaming link extraction shared by every scraper.
+
+Links are taken from an already parsed lxml tree and each anchor goes through
+one pass as it is met: resolve against the page URL, canonicalize (lowercase
+scheme and host, default port, fragment and tracking parameters such as
+`utm_*`, `fbclid` or `gclid` dropped), filter (non-http schemes, media files,
+an optional `allow` predicate), dedup on the canonical URL, and stop as soon
+as the cap is reached. `Urls_Extraction.extract_domain` (through
+scrapers.text_extract), the news article links, `transfermarkt_parser` and
+the Transfermarkt scraper all use it.
+"""
+from typing import Any, Callable, Iterator, List, Optional, Set
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+SKIP_PREFIXES = ('#', 'javascript:', 'mailto:', 'tel:', 'data:')
+MEDIA_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.pdf', '.mp4', '.mp3')
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'gclsrc', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', 'ref_src', 'ref_url', 'cmpid', 'ocid', 'xtor', 'spm',
+])
+# utm_* (analytics), at_* (BBC), ns_* (comScore)
+TRACKING_PREFIXES = ('utm_', 'at_', 'ns_')
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+
+def _is_tracking(param: str) -> bool:
+    key = param.split('=', 1)[0].lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(href: Optional[str], base_url: Optional[str] = None) -> Optional[str]:
+    """Absolute canonical http(s) URL for an href, or None when it is not a followable link.
+
+    Without `base_url` relative hrefs are dropped.
+    """
+    href = (href or '').strip()
+    if not href or href.lower().startswith(SKIP_PREFIXES):
+        return None
+    full = urljoin(base_url, href) if base_url else href
+    try:
+        parts = urlsplit(full)
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https') or not parts.netloc:
+        return None
+    netloc = parts.netloc.lower()
+    if netloc.endswith(_DEFAULT_PORTS[scheme]):
+        netloc = netloc[:-len(_DEFAULT_PORTS[scheme])]
+    # filter the raw query so kept parameters keep their original encoding
+    query = '&'.join(p for p in parts.query.split('&') if p and not _is_tracking(p))
+    return urlunsplit((scheme, netloc, parts.path or '/', query, ''))
+
+
+def is_media(url: str) -> bool:
+    return urlsplit(url).path.lower().endswith(MEDIA_EXTENSIONS)
+
+
+def _anchor_text(el: Any) -> str:
+    return ' '.join(' '.join(el.itertext()).split())
+
+
+class LinkCollector:
+    """Resolves, canonicalizes, filters and dedups links as they are added, up to `limit`"""
+
+    def __init__(self, base_url: Optional[str] = None, limit: Optional[int] = 100,
+                 allow: Optional[Callable[[str], bool]] = None, skip_media: bool = False,
+                 with_text: bool = False):
+        self.base_url = base_url
+        self.limit = limit
+        self.allow = allow
+        self.skip_media = skip_media
+        # links as {'href', 'text'} instead of plain URLs
+        self.with_text = with_text
+        self.links: List[Any] = []
+        self._seen: Set[str] = set()
+
+    @property
+    def full(self) -> bool:
+        return self.limit is not None and len(self.links) >= self.limit
+
+    def add(self, href: Optional[str], anchor: Any = None) -> bool:
+        """Add one href (with its anchor element for the link text); returns whether it was kept"""
+        if self.full or not href:
+            return False
+        url = canonicalize_url(href, self.base_url)
+        if not url or url in self._seen:
+            return False
+        self._seen.add(url)
+        if (self.skip_media and is_media(url)) or (self.allow and not self.allow(url)):
+            return False
+        if self.with_text:
+            self.links.append({'href': url, 'text': _anchor_text(anchor) if anchor is not None else ''})
+        else:
+            self.links.append(url)
+        return True
+
+
+def iter_links(doc: Any, base_url: Optional[str] = None, **options: Any) -> Iterator[Any]:
+    """Canonical links of a parsed tree in document order, as they are found (no cap)"""
+    collector = LinkCollector(base_url, limit=None, **options)
+    if doc is None:
+        return
+    for a in doc.iter('a'):
+        if collector.add(a.get('href'), a):
+            yield collector.links[-1]
+
+
+def extract_links(doc: Any, base_url: Optional[str] = None, limit: Optional[int] = 100,
+                  **options: Any) -> List[Any]:
+    """Up to `limit` canonical links of a parsed tree; the walk stops at the cap"""
+    collector = LinkCollector(base_url, limit=limit, **options)
+    if doc is None:
+        return collector.links
+    for a in doc.iter('a'):
+        collector.add(a.get('href'), a)
+        if collector.full:
+            break
+    return collector.links
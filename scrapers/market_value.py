@@ -0,0 +1,264 @@
+"""Market-value history extraction.
+
+Transfermarkt ships the market-value chart either inline, as a Highcharts
+series (a JavaScript object literal: `'data':[{'y':..., 'x':..., 'verein':
+..., 'age':..., 'mw':..., 'datum_mw':...}]`), or through the JSON endpoint
+`/ceapi/marketValueDevelopment/graph/<id>` (`{"list":[{...}]}`). The payload
+is located with plain substring search and a single bracket-matching pass
+(string-aware, no regex, no backtracking), converted to JSON in one more
+linear pass when it is a JS literal, and decoded into a `MarketValueSeries`:
+parallel arrays of ISO dates, EUR values, ages and dictionary-encoded clubs.
+"""
+import json
+import re
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+GRAPH_API_URL = "https://www.transfermarkt.com/ceapi/marketValueDevelopment/graph/{player_id}"
+
+# key that opens the point list, in the order they are tried
+_PAYLOAD_KEYS = ("'data':[", '"data":[', '"list":[', "data: [", "'data': [")
+
+_MULTIPLIERS = {
+    'bn': 1_000_000_000, 'mrd': 1_000_000_000,
+    'm': 1_000_000, 'mio': 1_000_000,
+    'k': 1_000, 'th': 1_000, 'tsd': 1_000,
+}
+_AMOUNT = re.compile(r'(\d+(?:[.,]\d+)?)\s*(bn|mrd|mio|m|th|tsd|k)?', re.I)
+# "1.500.000 €", "1,500,000": thousands separators, no unit
+_GROUPED = re.compile(r'\d{1,3}(?:[.,]\d{3})+(?![\d.,]|\s*(?:bn|mrd|mio|m|th|tsd|k)\b)', re.I)
+# "€1,500k", "€2,500Th.": comma thousands separators before an English unit
+# (German "1,500 Mio." keeps its decimal comma)
+_GROUPED_UNIT = re.compile(r'(\d{1,3}(?:,\d{3})+)(?![\d.,])\s*(bn|m|th|k)\b', re.I)
+
+
+def parse_eur(text: Optional[str]) -> Optional[int]:
+    """EUR amount from a Transfermarkt value string ("€80.00m", "500 Tsd. €", "1.500.000 €", "€1,500k", "-")"""
+    if not text:
+        return None
+    text = text.replace('\xa0', ' ')
+    match = _AMOUNT.search(text)
+    if not match:
+        return None
+    grouped = _GROUPED.match(text, match.start())
+    if grouped:
+        return int(re.sub(r'[.,]', '', grouped.group(0)))
+    grouped = _GROUPED_UNIT.match(text, match.start())
+    if grouped:
+        return int(grouped.group(1).replace(',', '')) * _MULTIPLIERS[grouped.group(2).lower()]
+    number = float(match.group(1).replace(',', '.'))
+    unit = (match.group(2) or '').lower()
+    return int(round(number * _MULTIPLIERS.get(unit, 1)))
+
+
+def _find_array(text: str, start: int) -> Optional[str]:
+    """The balanced `[...]` starting at text[start] (quote-aware), or None"""
+    depth = 0
+    quote = None
+    i = start
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if quote:
+            if c == '\\':
+                i += 2
+                continue
+            if c == quote:
+                quote = None
+        elif c in '"\'':
+            quote = c
+        elif c in '[{':
+            depth += 1
+        elif c in ']}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+        i += 1
+    return None
+
+
+def _js_to_json(text: str) -> str:
+    """Single-quoted strings -> JSON strings, bare keys quoted, trailing commas dropped"""
+    out: List[str] = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c in '"\'':
+            j = i + 1
+            buf: List[str] = []
+            while j < n and text[j] != c:
+                if text[j] == '\\' and j + 1 < n:
+                    nxt = text[j + 1]
+                    # \' is only an escape in JS; in JSON the quote needs none
+                    buf.append(nxt if nxt == "'" else text[j:j + 2])
+                    j += 2
+                    continue
+                if text[j] == '"':
+                    buf.append('\\"')
+                else:
+                    buf.append(text[j])
+                j += 1
+            out.append('"' + ''.join(buf) + '"')
+            i = j + 1
+        elif c.isalpha() or c == '_':
+            j = i
+            while j < n and (text[j].isalnum() or text[j] == '_'):
+                j += 1
+            word = text[i:j]
+            k = j
+            while k < n and text[k] in ' \t\r\n':
+                k += 1
+            if k < n and text[k] == ':' and word not in ('true', 'false', 'null'):
+                out.append(f'"{word}"')
+            else:
+                out.append(word)
+            i = j
+        elif c == ',':
+            k = i + 1
+            while k < n and text[k] in ' \t\r\n':
+                k += 1
+            if k < n and text[k] in ']}':
+                i += 1
+                continue
+            out.append(c)
+            i += 1
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out)
+
+
+def _point_date(point: Dict[str, Any]) -> Optional[str]:
+    label = point.get('datum_mw') or point.get('date')
+    if label:
+        for fmt in ('%b %d, %Y', '%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d'):
+            try:
+                return datetime.strptime(str(label).strip(), fmt).date().isoformat()
+            except ValueError:
+                continue
+    x = point.get('x')
+    if isinstance(x, (int, float)):
+        # x is midnight Central European time; +12h lands on the right UTC day
+        return datetime.fromtimestamp(x / 1000 + 43200, tz=timezone.utc).date().isoformat()
+    return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class MarketValueSeries:
+    """Market-value history as parallel arrays (dates ascending)"""
+
+    __slots__ = ('dates', 'values', 'ages', 'clubs', 'club_idx')
+
+    def __init__(self):
+        self.dates: List[str] = []
+        self.values = array('q')  # EUR, -1 = unknown
+        self.ages: List[Optional[int]] = []
+        self.clubs: List[str] = []
+        self.club_idx = array('h')  # index into clubs, -1 = unknown
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def append(self, date: str, value: Optional[int], club: Optional[str], age: Optional[int]) -> None:
+        self.dates.append(date)
+        self.values.append(value if value is not None else -1)
+        self.ages.append(age)
+        if club:
+            if club not in self.clubs:
+                self.clubs.append(club)
+            self.club_idx.append(self.clubs.index(club))
+        else:
+            self.club_idx.append(-1)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Dict[str, Any]]) -> 'MarketValueSeries':
+        """Decode chart/API points (y or mw, x or datum_mw, verein, age), sorted by date"""
+        rows = []
+        for point in points:
+            if not isinstance(point, dict):
+                continue
+            date = _point_date(point)
+            if not date:
+                continue
+            value = point.get('y')
+            value = int(value) if isinstance(value, (int, float)) else parse_eur(point.get('mw') or point.get('market_value'))
+            club = point.get('verein') or point.get('club') or None
+            rows.append((date, value, club, _to_int(point.get('age'))))
+        series = cls()
+        for row in sorted(rows, key=lambda r: r[0]):
+            series.append(*row)
+        return series
+
+    def value_at(self, date: str) -> Optional[int]:
+        """Latest known value on or before an ISO date"""
+        i = bisect_right(self.dates, date) - 1
+        if i < 0 or self.values[i] < 0:
+            return None
+        return self.values[i]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'dates': self.dates,
+            'values_eur': [v if v >= 0 else None for v in self.values],
+            'ages': self.ages,
+            'clubs': self.clubs,
+            'club_idx': list(self.club_idx)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MarketValueSeries':
+        series = cls()
+        series.dates = list(data.get('dates') or [])
+        series.values = array('q', [v if v is not None else -1 for v in data.get('values_eur') or []])
+        series.ages = list(data.get('ages') or [])
+        series.clubs = list(data.get('clubs') or [])
+        series.club_idx = array('h', data.get('club_idx') or [])
+        return series
+
+
+def find_chart_points(text: str) -> Optional[List[Dict[str, Any]]]:
+    """Chart points from page HTML/script text or the graph API JSON, or None"""
+    for key in _PAYLOAD_KEYS:
+        pos = text.find(key)
+        while pos != -1:
+            raw = _find_array(text, pos + len(key) - 1)
+            if raw and '{' in raw:
+                for candidate in (raw, _js_to_json(raw)):
+                    try:
+                        points = json.loads(candidate)
+                    except ValueError:
+                        continue
+                    if points and isinstance(points, list) and isinstance(points[0], dict) \
+                            and ('y' in points[0] or 'mw' in points[0]):
+                        return points
+            pos = text.find(key, pos + 1)
+    return None
+
+
+def extract_market_value_series(text: str) -> Optional[MarketValueSeries]:
+    """Market-value series from a page or API payload, or None when there is no chart data"""
+    points = find_chart_points(text or '')
+    if not points:
+        return None
+    series = MarketValueSeries.from_points(points)
+    return series if len(series) else None
+
+
+def load_player_series(player_docs: Iterable[Dict[str, Any]]) -> Dict[str, MarketValueSeries]:
+    """{player_id: series} from stored player documents (pages.marktwertverlauf.series)"""
+    out: Dict[str, MarketValueSeries] = {}
+    for doc in player_docs:
+        page = (doc.get('pages') or {}).get('marktwertverlauf') or {}
+        data = page.get('series') if isinstance(page, dict) else None
+        if isinstance(data, dict) and data.get('dates'):
+            out[str(doc.get('player_id'))] = MarketValueSeries.from_dict(data)
+    return out
@@ -0,0 +1,102 @@
+"""Near-duplicate article detection (MinHash over word shingles + LSH banding).
+
+Syndicated copies of the same story (agency wires, re-titled reposts) share
+most of their text. Each article gets a MinHash signature of its word 5-gram
+shingles; signatures are bucketed per band so a lookup only compares against
+articles that collide in at least one band, then the estimated Jaccard
+similarity decides whether it joins an existing cluster.
+"""
+import hashlib
+import random
+import re
+from typing import Dict, List, Optional, Tuple
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _shingle_hashes(text: str, size: int) -> set:
+    words = _WORD_RE.findall((text or '').lower())
+    if len(words) < size:
+        grams = {' '.join(words)} if words else set()
+    else:
+        grams = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return {int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=4).digest(), 'little') for g in grams}
+
+
+class NearDuplicateIndex:
+    """LSH index of article MinHash signatures; groups near-duplicates into clusters"""
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16, shingle_size: int = 5):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        # fixed seed: signatures are comparable across runs and processes
+        rng = random.Random(1)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self.clusters: Dict[str, List[str]] = {}
+        self._cluster_of: Dict[str, str] = {}
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of the text, or None when it has no words"""
+        shingles = _shingle_hashes(text, self.shingle_size)
+        if not shingles:
+            return None
+        return tuple(
+            min(((a * s + b) % _MERSENNE_PRIME) & _MAX_HASH for s in shingles)
+            for a, b in self._perms
+        )
+
+    @staticmethod
+    def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    def _band_keys(self, sig: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, sig[band * self.rows:(band + 1) * self.rows]
+
+    def query(self, sig: Tuple[int, ...]) -> Optional[Tuple[str, float]]:
+        """Best matching indexed key at or above the threshold, with its similarity"""
+        candidates = set()
+        for band_key in self._band_keys(sig):
+            candidates.update(self._buckets.get(band_key, ()))
+        best = None
+        for key in candidates:
+            score = self.similarity(sig, self._signatures[key])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+    def add(self, key: str, sig: Tuple[int, ...]) -> None:
+        self._signatures[key] = sig
+        for band_key in self._band_keys(sig):
+            self._buckets.setdefault(band_key, []).append(key)
+
+    def check_and_add(self, key: str, text: str) -> Optional[Tuple[str, float]]:
+        """Index an article; returns (cluster_id, similarity) when it is a near-duplicate.
+
+        The cluster id is the key of the first article seen of that story. Unique
+        articles are indexed and start their own cluster.
+        """
+        sig = self.signature(text)
+        if sig is None:
+            return None
+        match = self.query(sig)
+        if match:
+            cluster_id = self._cluster_of.get(match[0], match[0])
+            self.clusters[cluster_id].append(key)
+            self._cluster_of[key] = cluster_id
+            return cluster_id, match[1]
+        self.add(key, sig)
+        self.clusters[key] = [key]
+        self._cluster_of[key] = key
+        return None
@@ -0,0 +1,535 @@
+"""Google News search and article extraction."""
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from .blobstore import BlobStore
+from .checkpoint import CheckpointJournal
+from .common import GNEWS_AVAILABLE, PLAYWRIGHT_AVAILABLE, _green, _lazy, logger, report_backends
+from .config import Config
+from .gnews_planner import GNewsQueryPlanner
+from .gnews_resolver import GoogleNewsResolver, is_google_url
+from .links import extract_links
+from .near_dup import NearDuplicateIndex
+from .pipeline import Pipeline, Stage
+from .ratelimit import shared_limiter
+from .render_profile import DEFAULT_PROFILE, apply_to_selenium
+from .storage import atomic_write_json
+from .driver import setup_driver
+from .urls import Urls_Extraction
+
+
+def resolve_pending(journal: CheckpointJournal, resolver: GoogleNewsResolver, google_urls: List[str],
+                    browser_fallback: Optional[Any] = None) -> None:
+    """Resolve the Google News URLs not journaled yet and journal the ones that resolved.
+
+    Failed resolutions are not journaled, so a resumed run tries them again.
+    """
+    pending = [url for url in google_urls if not journal.is_done('resolved', url)]
+    if not pending:
+        return
+    resolved = resolver.resolve_many(pending, browser_fallback=browser_fallback)
+    for google_url in pending:
+        if google_url in resolved:
+            journal.record('resolved', google_url, resolved[google_url])
+
+
+class News_Scraper:
+    """Scrapes news articles using GNews"""
+    
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    
+    def __init__(self, use_playwright: bool = True, use_selenium: bool = True, delay: float = 1.0,
+                 store_html: bool = True, render_profile: str = DEFAULT_PROFILE):
+        report_backends()
+        self.conf = Config()
+        # What the browser may download (see scrapers.render_profile)
+        self.render_profile = render_profile
+        self.use_playwright = use_playwright and PLAYWRIGHT_AVAILABLE
+        self.use_selenium = use_selenium
+        self.delay = delay
+        self.store_html = store_html
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        # Additional defaults
+        self.timeout = 30
+        self.max_retries = 3
+        # add referer to help avoid simple blocking
+        try:
+            self.session.headers.update({'Referer': 'https://www.transfermarkt.com/'})
+        except Exception:
+            pass
+        # Use datetime objects for GNews compatibility
+        self.start_date = datetime(2023, 1, 1)
+        self.end_date = datetime(2024, 12, 31)
+        self.max_results_per_keyword = 20
+        self.languages = ['fr']
+        self.countries = ['US', 'FR', 'DE', 'ES', 'IT']
+        self.labels = ['france', 'usa', 'germany', 'spain', 'italy']
+        # Concurrent GNews feed queries (paced by the shared news.google.com bucket)
+        self.query_workers = 4
+        # Shared per-host token buckets for article downloads
+        self.rate_limiter = shared_limiter()
+        # Estimated Jaccard similarity above which an article counts as a near-duplicate
+        self.near_duplicate_threshold = 0.8
+        # Worker threads per news pipeline stage and the bounded queue size between
+        # stages (enrichment shares the one Selenium driver, so it stays at 1)
+        self.stage_workers = {'search': 2, 'resolve': 2, 'fetch': 4, 'extract': 2, 'enrich': 1}
+        self.stage_queue_size = 16
+        self.pipeline_stats: Dict[str, Dict] = {}
+        # Optional per-match journal (set by MatchOrchestrator); a default one
+        # under the output directory is used otherwise
+        self.checkpoint: Optional[CheckpointJournal] = None
+        # Browserless Google News redirect resolution (Selenium only as last resort)
+        self.url_resolver = GoogleNewsResolver()
+        # Compressed, content-addressed store for raw article HTML (shared across runs)
+        self.html_store = BlobStore()
+        # newspaper configuration, created on first article (see _article_config)
+        self._newspaper_config = None
+        # Informational logs in green when optional features are active for this instance
+        try:
+            if self.use_playwright:
+                logger.info(_green("News_Scraper: Playwright enabled for JS rendering"))
+        except Exception:
+            pass
+        try:
+            if GNEWS_AVAILABLE:
+                logger.info(_green("News_Scraper: GNews available and will be used"))
+        except Exception:
+            pass
+    
+    def resolve_real_url(self, driver: Any, google_url: str) -> str:
+        """Resolve Google redirect URL to actual URL by loading it in the browser (last resort)"""
+        try:
+            apply_to_selenium(driver, self.render_profile)
+            driver.get(google_url)
+            for _ in range(10):
+                current_url = driver.current_url
+                if "google.com" not in current_url and "consent.google.com" not in current_url:
+                    return current_url
+                time.sleep(0.5)
+            return driver.current_url
+        except:
+            return google_url
+    
+    def query_planner(self) -> GNewsQueryPlanner:
+        """Planner over this scraper's countries and languages"""
+        return GNewsQueryPlanner(
+            countries=self.countries,
+            languages=self.languages,
+            max_results=self.max_results_per_keyword,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            max_workers=self.query_workers,
+            rate_limiter=self.rate_limiter
+        )
+
+    def _article_config(self) -> Any:
+        """newspaper configuration, built once per scraper"""
+        if self._newspaper_config is None:
+            config = _lazy('newspaper', 'Config')()
+            config.browser_user_agent = self.HEADERS['User-Agent']
+            config.request_timeout = self.timeout
+            config.fetch_images = False
+            self._newspaper_config = config
+        return self._newspaper_config
+
+    def _parse_article(self, url: str, html: Optional[str] = None) -> Any:
+        """Parse an article with newspaper; `html` skips newspaper's own download"""
+        article = _lazy('newspaper', 'Article')(url, config=self._article_config())
+        article.download(input_html=html)
+        article.parse()
+        return article
+
+    def _extract_links(self, base_url: str, doc: Any) -> List[str]:
+        """Canonical, deduplicated page links (max 50, no media files) from an already parsed lxml tree"""
+        return extract_links(doc, base_url, limit=50, skip_media=True)
+
+    def download_article(self, url: str) -> Optional[str]:
+        """Fetch an article page with the scraper session"""
+        try:
+            resp = self.rate_limiter.get(self.session, url, timeout=self.timeout)
+            if not resp.ok:
+                logger.error(f"Error fetching {url}: HTTP {resp.status_code}")
+                return None
+            return resp.text
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+
+    def extract_article(self, url: str, html: str) -> Tuple[Optional[str], List[str]]:
+        """Article text and found links from downloaded HTML.
+
+        The HTML is handed to newspaper and its parsed DOM is reused for the
+        link extraction, so the page is parsed a single time.
+        """
+        try:
+            article = self._parse_article(url, html)
+        except Exception as e:
+            logger.error(f"Error extracting content from {url}: {e}")
+            return None, []
+        try:
+            found_urls = self._extract_links(url, getattr(article, 'doc', None))
+        except Exception:
+            # ignore link-extraction failures
+            found_urls = []
+        return article.text, found_urls
+
+    def fetch_article(self, url: str) -> Tuple[Optional[str], List[str], Optional[str]]:
+        """Download an article once; returns (text, found_urls, html)"""
+        html = self.download_article(url)
+        if html is None:
+            return None, [], None
+        text, found_urls = self.extract_article(url, html)
+        return text, found_urls, html
+
+    def load_html(self, record: Dict) -> Optional[str]:
+        """Raw HTML of a news record, read back from the blob store"""
+        return self.html_store.get(record.get('html_ref'))
+
+    def get_content_from_url(self, url: str, html: Optional[str] = None) -> Optional[str]:
+        """Extract article content using newspaper (downloads only when `html` is not given)"""
+        try:
+            return self._parse_article(url, html).text
+        except Exception as e:
+            logger.error(f"Error extracting content from {url}: {e}")
+            return None
+    
+    def execution_url_agentent(self, driver: Any, tasks: List[Dict], finish_checkpoint: bool = True) -> List[Dict]:
+        """Execute news scraping based on tasks (search, resolve, fetch, extract, write).
+
+        Completed keyword searches, resolved Google redirects and articles are
+        journaled in `self.checkpoint`, so a restarted run skips them. With
+        `finish_checkpoint=False` the journal is kept for a follow-up stage.
+        """
+        return self.run_pipeline(driver, tasks, enrich=False, finish_checkpoint=finish_checkpoint)['articles']
+
+    def run_pipeline(self, driver: Any, tasks: List[Dict], enrich: bool = False,
+                     finish_checkpoint: bool = True) -> Dict[str, List[Dict]]:
+        """Stream tasks through the news stages connected by bounded queues.
+
+        search -> resolve -> fetch -> extract [-> enrich] -> write; worker counts
+        per stage come from `self.stage_workers`. Returns {'articles': [...],
+        'enhanced': [...]} and leaves the per-stage counters in `self.pipeline_stats`.
+        """
+        if not GNEWS_AVAILABLE:
+            logger.error("GNews not available, cannot scrape news")
+            return {'articles': [], 'enhanced': []}
+
+        stats = {'success': 0, 'failed': 0, 'total_words': 0, 'total_lines': 0}
+        output_dir = self.conf.output_directory
+        timestamp = int(time.time())
+        all_data: List[Dict] = []
+        enhanced_results: List[Dict] = []
+        total_count = 0
+
+        if self.checkpoint is None:
+            self.checkpoint = CheckpointJournal(os.path.join(output_dir, 'checkpoints'), 'news')
+        journal = self.checkpoint
+
+        # search/resolve workers share the dedup sets; the Selenium driver is
+        # used by the resolve fallback and by enrichment, one caller at a time
+        state_lock = threading.Lock()
+        driver_lock = threading.Lock()
+        seen_titles = set()
+        seen_urls = set()
+        seen_articles = set()
+        planner = self.query_planner()
+        url_extractor = Urls_Extraction(render_profile=self.render_profile) if enrich else None
+        # Near-duplicate stories (wire copies, re-titled reposts) are not enriched;
+        # they are listed under the first article of their cluster instead
+        dedup_index = NearDuplicateIndex(threshold=self.near_duplicate_threshold)
+        cluster_members: Dict[str, List[Dict]] = {}
+        dropped = 0
+
+        try:
+            logger.info(_green("News_Scraper: using GNews for keyword searches"))
+        except Exception:
+            pass
+
+        owns_driver = not driver
+        if not driver:
+            driver = setup_driver(render_profile=self.render_profile)
+
+        def search(job):
+            label, keyword = job
+            keyword_key = f"{label}:{keyword}"
+            if journal.is_done('keyword', keyword_key):
+                logger.info(f"Keyword already searched, restoring from checkpoint: {keyword}")
+                results = journal.get('keyword', keyword_key) or []
+            else:
+                logger.info(f"Searching for keyword: {keyword}")
+                found, failed = planner.search_with_failures([keyword])
+                results = found.get(keyword, [])
+                # partial results after a failed query (outage, 429s) are used but
+                # not checkpointed, so a resumed run searches the keyword again
+                if keyword in failed:
+                    logger.warning(f"Not checkpointing keyword {keyword!r}: some GNews queries failed")
+                else:
+                    journal.record('keyword', keyword_key, results)
+            fresh = []
+            with state_lock:
+                for item in results:
+                    if not isinstance(item, dict) or not item.get('url'):
+                        continue
+                    title = item.get('title')
+                    if title in seen_titles or item['url'] in seen_urls:
+                        continue
+                    seen_titles.add(title)
+                    seen_urls.add(item['url'])
+                    fresh.append(dict(item, source_label=label))
+            if fresh:
+                yield fresh
+
+        def browser_fallback(google_url: str) -> str:
+            with driver_lock:
+                return self.resolve_real_url(driver, google_url)
+
+        def resolve(batch):
+            # cache/offline decode/concurrent HTTP, the browser only for leftovers
+            resolve_pending(journal, self.url_resolver, [item['url'] for item in batch],
+                            browser_fallback if driver else None)
+            for item in batch:
+                real_url = journal.get('resolved', item['url'], item['url'])
+                if is_google_url(real_url):
+                    continue
+                with state_lock:
+                    # different Google links can lead to the same article
+                    if real_url in seen_articles:
+                        continue
+                    seen_articles.add(real_url)
+                job = {'item': item, 'url': real_url, 'html': None, 'record': None, 'restored': False}
+                if journal.is_done('article', real_url):
+                    job['record'] = journal.get('article', real_url)
+                    job['restored'] = True
+                    if not job['record']:
+                        continue
+                yield job
+
+        def fetch(job):
+            if not job['restored']:
+                job['html'] = self.download_article(job['url'])
+                if job['html'] is None:
+                    # timeouts, resets, 5xx: not journaled, retried on restart
+                    return
+            yield job
+
+        def extract(job):
+            if job['restored']:
+                yield job
+                return
+            real_url, item = job['url'], job['item']
+            full_text, found_urls = self.extract_article(real_url, job['html'])
+            if not full_text or len(full_text) <= 200:
+                # too short / not extractable: don't download it again after a restart
+                journal.record('article', real_url, None)
+                return
+            title = item.get('title') or ''
+            job['record'] = {
+                'url': real_url,
+                'title': title[:200],
+                'domain': item.get('publisher', {}).get('title', ''),
+                'date': item.get('published date', ''),
+                'source_label': item.get('source_label', 'unknown'),
+                'publisher': item.get('publisher', {}).get('title', ''),
+                'country': item.get('query_country'),
+                'language': item.get('query_language'),
+                'content': full_text,
+                'word_count': len(full_text.split()),
+                'line_count': len(full_text.split('. ')),
+                'found_urls': found_urls,
+                # raw HTML lives in the blob store; the record only references it
+                'html_ref': self.html_store.put(job['html']) if self.store_html else None,
+                'success': True
+            }
+            job['html'] = None
+            journal.record('article', real_url, job['record'])
+            yield job
+
+        def enrich_stage(job):
+            nonlocal dropped
+            record = job['record']
+            url = record.get('url')
+            with state_lock:
+                match = dedup_index.check_and_add(url, record.get('content', ''))
+                duplicate = bool(match and match[0] in cluster_members)
+                if duplicate:
+                    cluster_id, score = match
+                    dropped += 1
+                    cluster_members[cluster_id].append({
+                        'url': url,
+                        'title': record.get('title'),
+                        'publisher': record.get('publisher'),
+                        'similarity': round(score, 3)
+                    })
+                else:
+                    cluster_members[url] = []
+            if duplicate:
+                logger.info(f"Skipping near-duplicate ({score:.2f}) of {cluster_id[:80]}: {record.get('title', '')[:60]}")
+                job['enhanced'] = None
+                yield job
+                return
+
+            # Use the universal scraper method (unless enriched before a restart)
+            enhanced_item = journal.get('enriched', url)
+            if enhanced_item is None:
+                logger.info(f"Enriching news article: {record.get('title', '')[:80]}...")
+                with driver_lock:
+                    enhanced_item = url_extractor.scrape_found_urls_universal(
+                        driver=driver,
+                        source_item=record,
+                        max_depth=1,
+                        max_urls=20  # Limit to 20 URLs per news article
+                    )
+                journal.record('enriched', url, enhanced_item)
+            enhanced_item = dict(enhanced_item)
+            enhanced_item['cluster_id'] = url
+            # shared list: near-duplicates found later still land in the final output
+            enhanced_item['near_duplicates'] = cluster_members[url]
+            job['enhanced'] = enhanced_item
+            yield job
+
+        def write(job):
+            """Add an article to the results, updating stats and saving batches"""
+            nonlocal total_count
+            record = job['record']
+            all_data.append(record)
+            total_count += 1
+            logger.info(f"[{total_count}] {record.get('source_label')}: {record.get('title', '')[:50]}...")
+
+            self.conf.generate_report({'success': True, 'word_count': record.get('word_count', 0),
+                                      'line_count': record.get('line_count', 0)}, stats)
+
+            # Save batch if needed
+            if self.conf.batch_size > 0 and total_count % self.conf.batch_size == 0:
+                start_idx = total_count - self.conf.batch_size + 1
+                batch = all_data[-self.conf.batch_size:]
+                self.conf.save_batch(batch, output_dir, start_idx, total_count, timestamp)
+
+            if job.get('enhanced'):
+                enhanced_results.append(job['enhanced'])
+                n = len(enhanced_results)
+                if n % 10 == 0:
+                    self.save_enhanced_news_batch(enhanced_results[-10:], n-9, n)
+            return ()
+
+        workers = self.stage_workers
+        stages = [
+            Stage('search', search, workers.get('search', 1)),
+            Stage('resolve', resolve, workers.get('resolve', 1)),
+            Stage('fetch', fetch, workers.get('fetch', 1)),
+            Stage('extract', extract, workers.get('extract', 1)),
+        ]
+        if enrich:
+            stages.append(Stage('enrich', enrich_stage, workers.get('enrich', 1)))
+        # results lists and batch numbering are owned by a single writer
+        stages.append(Stage('write', write, 1))
+        pipeline = Pipeline(stages, queue_size=self.stage_queue_size, name='news')
+        jobs = ((task.get('label', 'unknown'), keyword) for task in tasks for keyword in task.get('keywords', []))
+
+        try:
+            self.pipeline_stats = pipeline.run(jobs)
+
+            # Save remaining data
+            if all_data and self.conf.batch_size > 0 and len(all_data) % self.conf.batch_size != 0:
+                remaining = all_data[-(len(all_data) % self.conf.batch_size):]
+                start_idx = total_count - len(remaining) + 1
+                self.conf.save_batch(remaining, output_dir, start_idx, total_count, timestamp)
+
+            logger.info(f"News scraping complete: {len(all_data)} articles collected")
+            if self.store_html:
+                logger.info(f"HTML blob store: {self.html_store.stats}")
+            if enrich:
+                if dropped:
+                    logger.info(f"Near-duplicate detection: {dropped} of {len(all_data)} articles not enriched")
+                if all_data:
+                    self.save_all_enhanced_news(enhanced_results)
+            if finish_checkpoint:
+                journal.finish()
+                self.checkpoint = None
+
+        finally:
+            if driver and owns_driver:
+                try:
+                    driver.quit()
+                except:
+                    pass
+
+        return {'articles': all_data, 'enhanced': enhanced_results}
+
+    def scrape_news_with_found_urls(self, driver: Any, tasks: List[Dict], recursive_scrape: bool = True) -> List[Dict]:
+        """
+        Enhanced news scraper that also scrapes found URLs from news articles
+
+        Articles are enriched as soon as they are extracted (see `run_pipeline`).
+
+        Args:
+            driver: Selenium WebDriver instance
+            tasks: List of news scraping tasks
+            recursive_scrape: Whether to recursively scrape found URLs
+
+        Returns:
+            List[Dict]: Enhanced news results with nested scraped URLs
+        """
+        if not GNEWS_AVAILABLE:
+            logger.error("GNews not available, cannot scrape news")
+            return []
+
+        if not recursive_scrape:
+            return self.execution_url_agentent(driver, tasks)
+
+        logger.info(f"\n{'='*60}")
+        logger.info("SCRAPING NEWS AND RECURSIVELY SCRAPING FOUND URLS")
+        logger.info(f"{'='*60}")
+        return self.run_pipeline(driver, tasks, enrich=True)['enhanced']
+
+    def save_enhanced_news_batch(self, batch: List[Dict], start_idx: int, end_idx: int) -> None:
+        """Save a batch of enhanced news results"""
+        timestamp = int(time.time())
+        filename = f"enhanced_news_batch_{timestamp}_{start_idx:04d}-{end_idx:04d}.json"
+        filepath = os.path.join(self.conf.output_directory, filename)
+        try:
+            atomic_write_json(filepath, batch)
+            logger.info(f"Saved enhanced news batch {start_idx}-{end_idx} to {filename}")
+        except Exception as e:
+            logger.error(f"Error saving enhanced news batch: {e}")
+
+    def save_all_enhanced_news(self, enhanced_results: List[Dict]) -> None:
+        """Save all enhanced news results with metadata"""
+        timestamp = int(time.time())
+        filename = f"all_enhanced_news_{timestamp}.json"
+        filepath = os.path.join(self.conf.output_directory, filename)
+
+        # Calculate statistics
+        total_main_articles = len(enhanced_results)
+        total_scraped_urls = sum(len(item.get('scraped_urls', [])) for item in enhanced_results)
+        total_successful = sum(
+            item.get('scraping_stats', {}).get('successful', 0)
+            for item in enhanced_results if 'scraping_stats' in item
+        )
+        total_near_duplicates = sum(len(item.get('near_duplicates', [])) for item in enhanced_results)
+
+        output_data = {
+            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "statistics": {
+                "total_main_articles": total_main_articles,
+                "total_scraped_urls": total_scraped_urls,
+                "total_successful_scrapes": total_successful,
+                "near_duplicates_skipped": total_near_duplicates,
+                "average_urls_per_article": round(total_scraped_urls / total_main_articles, 2) if total_main_articles > 0 else 0
+            },
+            "results": enhanced_results
+        }
+
+        try:
+            atomic_write_json(filepath, output_data)
+            logger.info(f"All enhanced news saved to {filename}")
+            logger.info(f"Statistics: {total_main_articles} articles, {total_scraped_urls} scraped URLs, {total_successful} successful")
+        except Exception as e:
+            logger.error(f"Error saving all enhanced news: {e}")
@@ -0,0 +1,512 @@
+"""Multi-match orchestration and the legacy single-run entry points."""
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from .checkpoint import CheckpointJournal
+from .common import GNEWS_AVAILABLE, PROJECT_ROOT, _green, logger, report_backends
+from .config import Config
+from .driver import setup_driver
+from .storage import atomic_write_json
+from .news import News_Scraper
+from .player_index import shared_index
+from .reddit import Redit_Twitter_Scraper
+from .transfermarkt import TransderMarkt_Scraper
+from .urls import Urls_Extraction
+
+
+class MatchOrchestrator:
+    """Orchestrates multiple match scrapers with parallel execution"""
+    
+    def __init__(self, max_workers: int = 3, output_base_dir: str = "match_data", reuse_scrapers: bool = False):
+        report_backends()
+        self.max_workers = max_workers
+        self.output_base_dir = output_base_dir
+        os.makedirs(output_base_dir, exist_ok=True)
+        self.config = Config()
+        # When enabled (single-threaded pool workers), scraper instances and
+        # their HTTP sessions are kept warm across matches
+        self.reuse_scrapers = reuse_scrapers
+        self._scrapers: Dict[str, Any] = {}
+        self.player_index = shared_index()
+        
+    def _get_scraper(self, cls: Any, **kwargs) -> Any:
+        """Return a scraper instance, reusing a cached one when reuse_scrapers is set"""
+        if not self.reuse_scrapers:
+            return cls(**kwargs)
+        scraper = self._scrapers.get(cls.__name__)
+        if scraper is None:
+            scraper = cls(**kwargs)
+            self._scrapers[cls.__name__] = scraper
+        else:
+            # Fresh per-match config so batch limits/counters don't leak between matches
+            scraper.conf = Config()
+        return scraper
+    
+    def load_matches(self, path: str = None) -> List[Dict]:
+        """Load match configurations from JSON file"""
+        # Try explicit path first, then common locations
+        candidates: List[str] = []
+        if path:
+            candidates.append(path)
+        base = PROJECT_ROOT
+        candidates.extend([
+            os.path.join(base, 'config', 'matches.json'),
+            os.path.join(base, 'conf', 'matches.json'),
+            os.path.join(base, 'matches.json')
+        ])
+
+        for p in candidates:
+            try:
+                if not p:
+                    continue
+                if os.path.exists(p):
+                    with open(p, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    try:
+                        logger.info(_green(f"Loaded matches from: {p}"))
+                    except Exception:
+                        logger.info(f"Loaded matches from: {p}")
+
+                    # Normalize possible formats (list or dict with 'matches')
+                    if isinstance(data, dict):
+                        if 'matches' in data and isinstance(data['matches'], list):
+                            return data['matches']
+                        # single-match dict -> wrap
+                        return [data]
+                    if isinstance(data, list):
+                        return data
+            except Exception as e:
+                logger.error(f"Error loading matches from {p}: {e}")
+
+        logger.error(f"No matches file found. Checked: {candidates}")
+        return []
+    
+    def create_match_configs(self, match: Dict) -> Tuple[Dict, Dict, Dict, Dict]:
+        """Create scraper-specific configs for a match"""
+        
+        # Create match-specific output directory
+        match_dir = os.path.join(self.output_base_dir, match['match_id'])
+        os.makedirs(match_dir, exist_ok=True)
+        
+        # 1. URLs config for this match
+        urls_config = []
+        for url in match.get('urls', []):
+            urls_config.append({
+                "url": url,
+                "category": f"match_{match['match_id']}"
+            })
+        
+        # Add team URLs
+        for team in [match['teams']['home'], match['teams']['away']]:
+            urls_config.extend([
+                {"url": f"https://www.bbc.com/sport/football/teams/{team.lower().replace(' ', '-')}", 
+                 "category": f"team_{match['match_id']}"},
+                {"url": f"https://www.skysports.com/{team.lower().replace(' ', '-')}", 
+                 "category": f"team_{match['match_id']}"}
+            ])
+        
+        # 2. Tasks config for this match
+        tasks_config = [{
+            "label": f"match_report_{match['match_id']}",
+            "keywords": match.get('search_keywords', []),
+            "language": "en",
+            "max_results": 30
+        }]
+        
+        # 3. Players config for this match
+        # Names resolve through the local index fed by every scraped Transfermarkt page
+        players_config = []
+        key_players = match.get('key_players', [])
+        for i, player_name in enumerate(key_players):
+            club = match['teams']['home'] if i < 5 else match['teams']['away']
+            player = self.player_index.lookup(player_name, club)
+            if not player:
+                logger.warning(f"No Transfermarkt ID known for '{player_name}' ({club}), skipping")
+                continue
+            players_config.append({
+                "url": player['url'],
+                "name": player_name,
+                "club": club
+            })
+        
+        # 4. Comments config for this match
+        comments_config = {
+            "keywords": match.get('search_keywords', []) + [f"{match['teams']['home']} {match['teams']['away']}"],
+            "subreddits": match.get('subreddits', ['soccer', 'football']),
+            "match_specific": {
+                "team1": match['teams']['home'],
+                "team2": match['teams']['away'],
+                "date": match['date'],
+                "competition": match['competition']
+            },
+            "include_comments": True,
+            "max_comments_per_post": 100
+        }
+        
+        return urls_config, tasks_config, players_config, comments_config
+    
+    def run_match_scraper(self, match: Dict, driver: Any) -> Dict:
+        """Run all scrapers for a single match"""
+        match_id = match['match_id']
+        logger.info(f"\n{'='*70}")
+        logger.info(f"STARTING SCRAPING FOR MATCH: {match['name']} ({match_id})")
+        logger.info(f"{'='*70}")
+        
+        # Create match-specific configs
+        urls_config, tasks_config, players_config, comments_config = self.create_match_configs(match)
+        
+        # Create match-specific output directory
+        match_output_dir = os.path.join(self.output_base_dir, match_id)
+        original_output_dir = self.config.output_directory
+        self.config.output_directory = match_output_dir  # Temporarily override
+        
+        match_results = {
+            'match_id': match_id,
+            'match_name': match['name'],
+            'date': match['date'],
+            'competition': match['competition'],
+            'teams': match['teams'],
+            'scraped_at': datetime.utcnow().isoformat() + 'Z',
+            'url_scraping': [],
+            'news_scraping': [],
+            'player_scraping': [],
+            'reddit_scraping': {'posts': 0, 'comments': 0}
+        }
+        
+        try:
+            # 1. URL Extraction
+            if urls_config:
+                logger.info(f"\n--- URL Extraction for {match_id} ---")
+                url_scraper = self._get_scraper(Urls_Extraction)
+                # Per-match journal so a restarted match skips finished URLs
+                url_scraper.checkpoint = CheckpointJournal(os.path.join(match_output_dir, 'checkpoints'), 'urls')
+                url_results = url_scraper.execution_url_agentent(driver, urls_config)
+                match_results['url_scraping'] = url_results
+                
+                # Save match-specific URL results
+                self.save_match_results(url_results, match_id, 'urls')
+            
+            # 2. News Scraping
+            if tasks_config and GNEWS_AVAILABLE:
+                logger.info(f"\n--- News Scraping for {match_id} ---")
+                news_scraper = self._get_scraper(News_Scraper)
+                news_scraper.checkpoint = CheckpointJournal(os.path.join(match_output_dir, 'checkpoints'), 'news')
+                # Override GNews dates to focus on match date
+                match_date = datetime.strptime(match['date'], '%Y-%m-%d')
+                news_scraper.start_date = match_date - timedelta(days=1)
+                news_scraper.end_date = match_date + timedelta(days=2)
+                
+                news_results = news_scraper.scrape_news_with_found_urls(driver, tasks_config, recursive_scrape=True)
+                match_results['news_scraping'] = news_results
+                self.save_match_results(news_results, match_id, 'news')
+            
+            # 3. Transfermarkt Scraping (for key players)
+            if players_config:
+                logger.info(f"\n--- Player Data Scraping for {match_id} ---")
+                try:
+                    names = [p.get('name') for p in players_config]
+                    logger.info(_green(f"Transfermarkt: scraping players: {', '.join([n for n in names if n])}"))
+                except Exception:
+                    pass
+                player_scraper = self._get_scraper(TransderMarkt_Scraper, delay=2.0)  # Slower for player data
+                player_results = player_scraper.execution_url_agentent(driver, players_config)
+                match_results['player_scraping'] = player_results
+                self.save_match_results(player_results, match_id, 'players')
+            
+            # 4. Reddit Scraping
+            if comments_config:
+                logger.info(f"\n--- Reddit Scraping for {match_id} ---")
+                # Save comments config temporarily
+                temp_config_path = os.path.join(match_output_dir, f"comment_{match_id}.json")
+                atomic_write_json(temp_config_path, comments_config, indent=None, ensure_ascii=True)
+                
+                reddit_scraper = self._get_scraper(Redit_Twitter_Scraper)
+                reddit_scraper.load_comment_config(temp_config_path)
+                reddit_scraper.subreddits = comments_config['subreddits']
+                try:
+                    k = comments_config.get('keywords', [])
+                    s = comments_config.get('subreddits', [])
+                    logger.info(_green(f"Reddit: using keywords={k} subreddits={s}"))
+                except Exception:
+                    pass
+                
+                # Scrape by keywords
+                posts = reddit_scraper.scrape_by_keywords(per_keyword_limit=50)
+                match_results['reddit_scraping']['posts'] = len(posts)
+                match_results['reddit_scraping']['comments'] = sum(p.num_comments for p in posts)
+                
+                self.save_match_results([p.to_dict() for p in posts], match_id, 'reddit')
+            
+            # Save complete match results
+            self.save_match_results(match_results, match_id, 'complete')
+            
+        except Exception as e:
+            logger.error(f"Error scraping match {match_id}: {e}")
+            match_results['error'] = str(e)
+        
+        # Restore original output directory
+        self.config.output_directory = original_output_dir
+        
+        logger.info(f"\n{'='*70}")
+        logger.info(f"COMPLETED MATCH: {match['name']}")
+        logger.info(f"Results saved to: {match_output_dir}")
+        logger.info(f"{'='*70}")
+        
+        return match_results
+    
+    def save_match_results(self, data: Any, match_id: str, data_type: str) -> None:
+        """Save match-specific results"""
+        match_dir = os.path.join(self.output_base_dir, match_id)
+        os.makedirs(match_dir, exist_ok=True)
+        
+        timestamp = int(time.time())
+        filename = f"{data_type}_{match_id}_{timestamp}.json"
+        filepath = os.path.join(match_dir, filename)
+        
+        try:
+            atomic_write_json(filepath, data)
+            logger.info(f"Saved {data_type} data to {filepath}")
+        except Exception as e:
+            logger.error(f"Error saving {data_type} data: {e}")
+    
+    def run_parallel_matches(self, matches: List[Dict]) -> List[Dict]:
+        """Run multiple matches in parallel using threading"""
+        import threading
+        from queue import Queue
+        
+        results = []
+        results_lock = threading.Lock()
+        
+        def worker(match: Dict, worker_id: int):
+            """Worker thread function"""
+            logger.info(f"Worker {worker_id} starting match: {match['name']}")
+            
+            # Create a new driver for this thread
+            driver = setup_driver()
+            if not driver:
+                logger.error(f"Worker {worker_id} failed to create driver")
+                return
+            
+            try:
+                match_result = self.run_match_scraper(match, driver)
+                with results_lock:
+                    results.append(match_result)
+            finally:
+                driver.quit()
+        
+        # Create and start threads
+        threads = []
+        for i, match in enumerate(matches):
+            if not match.get('active', True):
+                logger.info(f"Skipping inactive match: {match['name']}")
+                continue
+                
+            thread = threading.Thread(target=worker, args=(match, i+1))
+            threads.append(thread)
+            thread.start()
+            
+            # Limit concurrent threads
+            if len(threads) >= self.max_workers:
+                for t in threads:
+                    t.join()
+                threads = []
+        
+        # Wait for remaining threads
+        for thread in threads:
+            thread.join()
+        
+        return results
+    
+    def run_sequential_matches(self, matches: List[Dict]) -> List[Dict]:
+        """Run multiple matches sequentially"""
+        results = []
+        driver = setup_driver()
+        
+        if not driver:
+            logger.error("Failed to create driver")
+            return results
+        
+        try:
+            for match in matches:
+                if not match.get('active', True):
+                    logger.info(f"Skipping inactive match: {match['name']}")
+                    continue
+                    
+                # no fixed pause between matches: requests are paced per host
+                match_result = self.run_match_scraper(match, driver)
+                results.append(match_result)
+        finally:
+            driver.quit()
+        
+        return results
+    
+    def generate_master_report(self, all_results: List[Dict]) -> None:
+        """Generate a master report for all matches"""
+        report = {
+            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "total_matches": len(all_results),
+            "matches": []
+        }
+        
+        for result in all_results:
+            match_summary = {
+                "match_id": result['match_id'],
+                "match_name": result['match_name'],
+                "date": result['date'],
+                "competition": result['competition'],
+                "teams": result['teams'],
+                "stats": {
+                    "urls_scraped": len(result.get('url_scraping', [])),
+                    "news_articles": len(result.get('news_scraping', [])),
+                    "players_processed": len(result.get('player_scraping', [])),
+                    "reddit_posts": result.get('reddit_scraping', {}).get('posts', 0),
+                    "reddit_comments": result.get('reddit_scraping', {}).get('comments', 0)
+                },
+                "output_directory": os.path.join(self.output_base_dir, result['match_id'])
+            }
+            report['matches'].append(match_summary)
+        
+        # Save master report
+        report_path = os.path.join(self.output_base_dir, f"master_report_{int(time.time())}.json")
+        atomic_write_json(report_path, report, ensure_ascii=True)
+        
+        logger.info(f"\n{'='*70}")
+        logger.info("MASTER REPORT GENERATED")
+        logger.info(f"Total matches processed: {len(all_results)}")
+        for match in report['matches']:
+            logger.info(f"  - {match['match_name']}: {match['stats']['urls_scraped']} URLs, {match['stats']['news_articles']} articles, {match['stats']['reddit_posts']} posts")
+        logger.info(f"Report saved to: {report_path}")
+        logger.info(f"{'='*70}")
+
+
+def main_single() -> None:
+    """Main function to orchestrate all scrapers"""
+    logger.info("Starting main scraping process...")
+    
+    # Setup driver
+    driver = setup_driver()
+    
+    # Create config instance
+    config = Config()
+    
+    # 1. URL Extraction
+    logger.info("\n" + "="*60)
+    logger.info("STEP 1: URL Extraction")
+    logger.info("="*60)
+    
+    scraper1 = Urls_Extraction()
+    path = os.path.join(PROJECT_ROOT, "config", "urls.json")
+    urls_data = config.load_config(path)
+    
+    if urls_data:
+        results1 = scraper1.execution_url_agentent(driver, urls_data)
+        logger.info(f"URL Extraction complete: {len(results1)} items processed")
+    else:
+        logger.warning("No URL data found, skipping URL extraction")
+    
+    # 2. News Scraping
+    logger.info("\n" + "="*60)
+    logger.info("STEP 2: News Scraping")
+    logger.info("="*60)
+    
+    scraper2 = News_Scraper()
+    tasks_path = os.path.join(PROJECT_ROOT, "config", "tasks.json")
+    tasks = Config.load_tasks(tasks_path)
+    
+    if tasks:
+        results2 = scraper2.execution_url_agentent(driver, tasks)
+        logger.info(f"News scraping complete: {len(results2)} articles collected")
+    else:
+        logger.warning("No tasks found, skipping news scraping")
+    
+    # 3. Transfermarkt Scraping
+    logger.info("\n" + "="*60)
+    logger.info("STEP 3: Transfermarkt Scraping")
+    logger.info("="*60)
+    
+    players_path = os.path.join(PROJECT_ROOT, "config", "players.json")
+    players = Config.load_player_urls(players_path)
+    
+    if players:
+        scraper3 = TransderMarkt_Scraper()
+        results3 = scraper3.execution_url_agentent(driver, players)
+        logger.info(f"Transfermarkt scraping complete: {len(results3)} players processed")
+    else:
+        logger.warning("No player URLs found, skipping Transfermarkt scraping")
+    
+    # 4. Reddit Scraping
+    logger.info("\n" + "="*60)
+    logger.info("STEP 4: Reddit Scraping")
+    logger.info("="*60)
+    
+    # Load external comment.json (keywords/subreddits) if present
+    comment_path = os.path.join(PROJECT_ROOT, "config", "comment.json")
+    reddit_scraper = Redit_Twitter_Scraper(keywords_file=comment_path)
+
+    # If keywords are provided, perform keyword-based search; otherwise fallback to subreddit scraping
+    if reddit_scraper.keywords:
+        reddit_scraper.scrape_by_keywords()
+    else:
+        reddit_scraper.scrape_soccer_10000_pages()
+    
+    # 5. Twitter Scraping (optional)
+    logger.info("\n" + "="*60)
+    logger.info("STEP 5: Twitter Scraping (via Nitter)")
+    logger.info("="*60)
+    
+    # Example queries - these should come from config in production
+    twitter_queries = ["soccer", "football", "worldcup"]
+    twitter_results = reddit_scraper.twitter_scraper(twitter_queries)
+    logger.info(f"Twitter scraping complete: {len(twitter_results)} tweets collected")
+    
+    # Clean up
+    if driver:
+        try:
+            driver.quit()
+        except:
+            pass
+    
+    logger.info("\n" + "="*60)
+    logger.info("ALL SCRAPING COMPLETE!")
+    logger.info("="*60)
+
+
+def main_parallel() -> None:
+    """Main function to run multiple match scrapers in parallel"""
+    logger.info("="*70)
+    logger.info("MULTI-MATCH SCRAPING ORCHESTRATOR STARTING")
+    logger.info("="*70)
+    
+    # Create orchestrator
+    orchestrator = MatchOrchestrator(max_workers=3, output_base_dir="match_data")
+    
+    # Load matches
+    matches = orchestrator.load_matches()
+    
+    if not matches:
+        logger.error("No matches found to scrape")
+        return
+    
+    logger.info(f"Loaded {len(matches)} matches:")
+    for match in matches:
+        logger.info(f"  - {match['name']} ({match['date']}) - {'ACTIVE' if match.get('active', True) else 'INACTIVE'}")
+    
+    # Choose execution mode
+    use_parallel = True  # Set to False for sequential execution
+    
+    if use_parallel:
+        logger.info("\nRunning in PARALLEL mode")
+        all_results = orchestrator.run_parallel_matches(matches)
+    else:
+        logger.info("\nRunning in SEQUENTIAL mode")
+        all_results = orchestrator.run_sequential_matches(matches)
+    
+    # Generate master report
+    orchestrator.generate_master_report(all_results)
+    
+    logger.info("\n" + "="*70)
+    logger.info("ALL MATCH SCRAPING COMPLETE!")
+    logger.info("="*70)
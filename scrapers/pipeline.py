@@ -0,0 +1,118 @@
+"""Bounded-queue stage pipeline.
+
+Stages are connected by bounded queues and run their own worker threads, so
+a slow stage blocks its producers (backpressure) instead of buffering
+everything, and downstream work starts as soon as the first item is ready.
+Each stage records throughput and latency counters.
+"""
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .common import logger
+
+_DONE = object()
+
+
+class Stage:
+    """One pipeline step: `func(item)` returns an iterable of outputs (or None)"""
+
+    def __init__(self, name: str, func: Callable[[Any], Optional[Iterable[Any]]], workers: int = 1):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.stats = {'in': 0, 'out': 0, 'errors': 0, 'busy_s': 0.0, 'wait_s': 0.0, 'max_ms': 0.0}
+        self._lock = threading.Lock()
+
+    def _count(self, outputs: int, busy: float, wait: float, failed: bool) -> None:
+        with self._lock:
+            self.stats['in'] += 1
+            self.stats['out'] += outputs
+            self.stats['errors'] += int(failed)
+            self.stats['busy_s'] += busy
+            self.stats['wait_s'] += wait
+            self.stats['max_ms'] = max(self.stats['max_ms'], busy * 1000)
+
+    def summary(self, wall_s: float) -> Dict[str, Any]:
+        """Counters plus items/s over the pipeline wall time and mean latencies"""
+        s = dict(self.stats)
+        n = s['in'] or 1
+        s['workers'] = self.workers
+        s['per_s'] = round(s['in'] / wall_s, 2) if wall_s > 0 else 0.0
+        s['avg_ms'] = round(s['busy_s'] * 1000 / n, 1)
+        s['avg_wait_ms'] = round(s['wait_s'] * 1000 / n, 1)
+        s['max_ms'] = round(s['max_ms'], 1)
+        s['busy_s'] = round(s['busy_s'], 2)
+        s['wait_s'] = round(s['wait_s'], 2)
+        return s
+
+
+class Pipeline:
+    """Runs stages concurrently with a bounded queue in front of each stage"""
+
+    def __init__(self, stages: List[Stage], queue_size: int = 16, name: str = 'pipeline'):
+        self.stages = stages
+        self.name = name
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self._alive = [s.workers for s in stages]
+        self._alive_lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def _worker(self, index: int) -> None:
+        stage = self.stages[index]
+        inbox = self.queues[index]
+        outbox = self.queues[index + 1] if index + 1 < len(self.queues) else None
+        while True:
+            entry = inbox.get()
+            if entry is _DONE:
+                break
+            enqueued_at, item = entry
+            started = time.monotonic()
+            outputs = 0
+            failed = False
+            try:
+                for out in stage.func(item) or ():
+                    outputs += 1
+                    if outbox is not None:
+                        # blocks while the next stage is saturated
+                        outbox.put((time.monotonic(), out))
+            except Exception as e:
+                failed = True
+                logger.error(f"{self.name} stage '{stage.name}' failed: {str(e)[:120]}")
+            stage._count(outputs, time.monotonic() - started, started - enqueued_at, failed)
+        # the last worker of a stage closes the next stage
+        with self._alive_lock:
+            self._alive[index] -= 1
+            last = self._alive[index] == 0
+        if last and outbox is not None:
+            for _ in range(self.stages[index + 1].workers):
+                outbox.put(_DONE)
+
+    def run(self, items: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """Feed `items` into the first stage and block until every stage drained"""
+        started = time.monotonic()
+        threads = []
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                t = threading.Thread(target=self._worker, args=(index,),
+                                     name=f"{self.name}-{stage.name}-{n}", daemon=True)
+                t.start()
+                threads.append(t)
+        try:
+            for item in items:
+                self.queues[0].put((time.monotonic(), item))
+        finally:
+            for _ in range(self.stages[0].workers):
+                self.queues[0].put(_DONE)
+        for t in threads:
+            t.join()
+        wall = time.monotonic() - started
+        self.stats = {stage.name: stage.summary(wall) for stage in self.stages}
+        self.stats['_total'] = {'wall_s': round(wall, 2)}
+        for name, s in self.stats.items():
+            if name != '_total':
+                logger.info(f"{self.name} {name:<8} in={s['in']} out={s['out']} err={s['errors']} "
+                            f"workers={s['workers']} {s['per_s']}/s avg={s['avg_ms']}ms "
+                            f"max={s['max_ms']}ms wait={s['avg_wait_ms']}ms")
+        return self.stats
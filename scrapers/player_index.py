@@ -0,0 +1,238 @@
+"""Local Transfermarkt player search index (name -> player ID).
+
+Every scraped Transfermarkt page feeds the index: the profile gives the
+player's own name and club, and every `/<slug>/profil/spieler/<id>` link
+(squad lists, teammates, transfers, news) gives an ID with its anchor text and
+slug. Lookups are accent- and case-insensitive: an exact alias match first,
+then whole-word containment (every query word in the alias, a lone word only
+as the surname, e.g. "Lewandowski"), then a strict character-trigram Dice
+score. The expected club only breaks ties; weaker matches are logged, not
+returned. Everything is in memory, so a lookup takes microseconds and sends no
+search requests. The index lives in `transfermarkt_data/data/player_index.json`.
+"""
+import json
+import os
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .common import logger
+from .storage import atomic_write_json
+from .text_extract import parse_html
+
+PROFILE_LINK = re.compile(r'/([^/?#]+)/profil/spieler/(\d+)')
+PROFILE_URL = "https://www.transfermarkt.com/{slug}/profil/spieler/{player_id}"
+
+# Known players, so match configs resolve before anything was scraped
+SEED_PLAYERS = [
+    ('38253', 'robert-lewandowski', 'Robert Lewandowski', 'FC Barcelona'),
+    ('937958', 'lamine-yamal', 'Lamine Yamal', 'FC Barcelona'),
+    ('683840', 'pedri', 'Pedri', 'FC Barcelona'),
+    ('520624', 'bruno-guimaraes', 'Bruno Guimarães', 'Newcastle United'),
+    ('349066', 'alexander-isak', 'Alexander Isak', 'Newcastle United'),
+]
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, accents stripped, punctuation and hyphens as single spaces"""
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(re.sub(r'[^0-9a-z]+', ' ', stripped.lower()).split())
+
+
+def _trigrams(norm: str) -> Set[str]:
+    padded = f"  {norm} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIndex:
+    """Fuzzy name -> Transfermarkt player lookup, fed from scraped pages"""
+
+    def __init__(self, path: Optional[str] = None, min_score: float = 0.7, min_single_score: float = 0.85):
+        self.path = path or os.path.join(os.getcwd(), 'transfermarkt_data', 'data', 'player_index.json')
+        self.min_score = min_score
+        # one-word queries ("Pedro") are close to many names ("Pedri"): stricter
+        self.min_single_score = min_single_score
+        self._lock = threading.Lock()
+        self.players: Dict[str, Dict[str, Any]] = {}
+        self._aliases: List[Tuple[str, str, Set[str]]] = []  # (normalized alias, player_id, trigrams)
+        self._exact: Dict[str, Set[str]] = {}
+        self._grams: Dict[str, List[int]] = {}
+        self._dirty = False
+        for player_id, slug, name, club in SEED_PLAYERS:
+            self.add(player_id, slug, name, club)
+        for player_id, entry in self._load().items():
+            for name in entry.get('names') or []:
+                self.add(player_id, entry.get('slug'), name, entry.get('club'))
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('players', {}) if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable player index {self.path}: {e}")
+            return {}
+
+    def _add_alias(self, norm: str, player_id: str) -> None:
+        if player_id in self._exact.get(norm, ()):
+            return
+        self._exact.setdefault(norm, set()).add(player_id)
+        grams = _trigrams(norm)
+        alias_id = len(self._aliases)
+        self._aliases.append((norm, player_id, grams))
+        for gram in grams:
+            self._grams.setdefault(gram, []).append(alias_id)
+
+    def add(self, player_id: str, slug: Optional[str] = None, name: Optional[str] = None,
+            club: Optional[str] = None) -> None:
+        """Record a player (and its name/slug as aliases)"""
+        if not player_id:
+            return
+        with self._lock:
+            entry = self.players.setdefault(player_id, {'slug': slug, 'names': [], 'club': None})
+            if slug and not entry.get('slug'):
+                entry['slug'] = slug
+            if club and club != entry.get('club'):
+                entry['club'] = club
+                self._dirty = True
+            for alias in (name, slug.replace('-', ' ') if slug else None):
+                norm = normalize_name(alias or '')
+                if len(norm) < 3 or norm.isdigit():
+                    continue
+                if alias not in entry['names']:
+                    entry['names'].append(alias)
+                    self._dirty = True
+                self._add_alias(norm, player_id)
+
+    def add_from_html(self, html: Any) -> int:
+        """Index every player profile link on a Transfermarkt page (HTML or parsed tree); returns links seen"""
+        try:
+            doc = parse_html(html) if isinstance(html, (str, bytes)) else html
+        except Exception as e:
+            logger.debug(f"Player index: could not parse page: {e}")
+            return 0
+        seen = 0
+        for a in doc.iter('a'):
+            match = PROFILE_LINK.search(a.get('href') or '')
+            if not match:
+                continue
+            seen += 1
+            text = ' '.join((a.text_content() or a.get('title') or '').split())
+            # image links and "full profile" style buttons: the slug alone is the name
+            if len(text.split()) > 5:
+                text = ''
+            self.add(match.group(2), match.group(1), text or None)
+        return seen
+
+    def _score(self, query: str) -> Dict[str, Tuple[bool, float]]:
+        """Per player: whether an alias contains the query as whole words, and the best trigram Dice score.
+
+        The caller holds `_lock`.
+        """
+        grams = _trigrams(query)
+        overlap: Dict[int, int] = {}
+        for gram in grams:
+            for alias_id in self._grams.get(gram, ()):
+                overlap[alias_id] = overlap.get(alias_id, 0) + 1
+        words = query.split()
+        scores: Dict[str, Tuple[bool, float]] = {}
+        for alias_id, common in overlap.items():
+            norm, player_id, alias_grams = self._aliases[alias_id]
+            alias_words = norm.split()
+            # one word must be the surname: "Lewandowski" yes, "Robert" or "Bruno" no
+            contained = set(words) <= set(alias_words) if len(words) > 1 else words[0] == alias_words[-1]
+            dice = 2 * common / (len(grams) + len(alias_grams))
+            best = scores.get(player_id, (False, 0.0))
+            scores[player_id] = (best[0] or contained, max(best[1], dice))
+        return scores
+
+    def _club_matches(self, player_id: str, club_norm: str) -> bool:
+        entry_club = normalize_name(self.players[player_id].get('club') or '')
+        return bool(club_norm and entry_club and (club_norm in entry_club or entry_club in club_norm))
+
+    def lookup(self, name: str, club: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Best match for a player name: {player_id, slug, name, club, url, score}, or None.
+
+        An exact alias, then whole-word containment, then a trigram Dice score of at
+        least `min_score` (`min_single_score` for one-word queries). The club only
+        breaks ties; it never lifts a weak match over the threshold.
+        """
+        query = normalize_name(name)
+        if not query:
+            return None
+        # add() runs on other pipeline threads and mutates the alias tables
+        with self._lock:
+            return self._lookup(query, name, club)
+
+    def _lookup(self, query: str, name: str, club: Optional[str]) -> Optional[Dict[str, Any]]:
+        """`lookup` for a normalized query; the caller holds `_lock`"""
+        exact = self._exact.get(query)
+        if exact:
+            candidates = {pid: 1.0 for pid in exact}
+        else:
+            scores = self._score(query)
+            candidates = {pid: 0.9 for pid, (contained, _) in scores.items() if contained}
+            if not candidates:
+                threshold = self.min_single_score if len(query.split()) == 1 else self.min_score
+                candidates = {pid: dice for pid, (_, dice) in scores.items() if dice >= threshold}
+                if not candidates:
+                    if scores:
+                        best_id, (_, best) = max(scores.items(), key=lambda item: item[1][1])
+                        logger.info(f"Player index: no confident match for '{name}' "
+                                    f"(closest {best_id}, score {best:.2f} < {threshold})")
+                    return None
+        top = max(candidates.values())
+        tied = [pid for pid, score in candidates.items() if score >= top - 0.01]
+        if len(tied) > 1:
+            # several players share the name: the club decides
+            club_norm = normalize_name(club or '')
+            tied = [pid for pid in tied if self._club_matches(pid, club_norm)]
+            if len(tied) != 1:
+                # e.g. "Silva" with several Silvas and no club to tell them apart
+                logger.debug(f"Player index: '{name}' is ambiguous ({', '.join(sorted(candidates))})")
+                return None
+        player_id = tied[0]
+        score = candidates[player_id]
+        entry = self.players[player_id]
+        slug = entry.get('slug') or normalize_name(entry['names'][0]).replace(' ', '-')
+        return {
+            'player_id': player_id,
+            'slug': slug,
+            'name': entry['names'][0] if entry['names'] else name,
+            'club': entry.get('club'),
+            'url': PROFILE_URL.format(slug=slug, player_id=player_id),
+            'score': round(score, 3)
+        }
+
+    def save(self) -> None:
+        """Persist new players/aliases, merged with what other processes added"""
+        if not self._dirty:
+            return
+        with self._lock:
+            try:
+                merged = self._load()
+                for player_id, entry in self.players.items():
+                    stored = merged.setdefault(player_id, {'slug': entry.get('slug'), 'names': [], 'club': None})
+                    stored['slug'] = stored.get('slug') or entry.get('slug')
+                    stored['club'] = entry.get('club') or stored.get('club')
+                    stored['names'] = list(dict.fromkeys((stored.get('names') or []) + entry['names']))
+                atomic_write_json(self.path, {'players': merged}, indent=None)
+                self._dirty = False
+            except Exception as e:
+                logger.error(f"Error saving player index: {e}")
+
+
+_shared: Optional[PlayerIndex] = None
+
+
+def shared_index() -> PlayerIndex:
+    """Process-wide index"""
+    global _shared
+    if _shared is None:
+        _shared = PlayerIndex()
+    return _shared
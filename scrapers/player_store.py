@@ -0,0 +1,101 @@
+"""Shared Transfermarkt player store with per-player locking.
+
+All match processes write player documents to the same directory
+(`transfermarkt_data/data/players`). Before a player is scraped its lock
+(`.locks/<player_id>.lock`, fcntl plus a thread lock, as in scrapers.ratelimit)
+is taken; a process that finds the lock held waits for the running scrape and
+then re-reads the stored document, so the incremental refresh sees fresh pages
+and nothing is fetched twice.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from .common import logger
+from .storage import atomic_write_json
+
+try:
+    import fcntl
+except ImportError:  # Windows: thread lock only
+    fcntl = None
+
+
+class PlayerStore:
+    """Player JSON documents shared across scrapers, threads and processes"""
+
+    def __init__(self, directory: str, lock_timeout: float = 900.0, poll: float = 0.5):
+        self.directory = directory
+        self.lock_directory = os.path.join(directory, '.locks')
+        self.lock_timeout = lock_timeout
+        self.poll = poll
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {'locked': 0, 'waited': 0, 'waited_s': 0.0, 'timeouts': 0}
+        os.makedirs(self.lock_directory, exist_ok=True)
+
+    def path(self, slug: str, player_id: str) -> str:
+        """Path of a player's stored JSON document"""
+        return os.path.join(self.directory, f"{slug}_{player_id}.json")
+
+    def save(self, player_data: Dict[str, Any], slug: str, player_id: str) -> str:
+        filepath = self.path(slug, player_id)
+        atomic_write_json(filepath, player_data)
+        return filepath
+
+    def saved_since(self, slug: str, player_id: str, since: float) -> bool:
+        """Whether the player's document was written at or after `since` (epoch seconds)"""
+        try:
+            return os.path.getmtime(self.path(slug, player_id)) >= since
+        except OSError:
+            return False
+
+    def _thread_lock(self, player_id: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(player_id, threading.Lock())
+
+    @contextmanager
+    def lock(self, player_id: str, label: Optional[str] = None) -> Iterator[None]:
+        """Hold a player's scrape lock; waits (up to lock_timeout) while another scrape runs"""
+        label = label or player_id
+        started = time.monotonic()
+        thread_lock = self._thread_lock(player_id)
+        if not thread_lock.acquire(blocking=False):
+            logger.info(f"Waiting for running scrape of {label} in this process")
+            thread_lock.acquire()
+        try:
+            with open(os.path.join(self.lock_directory, f"{player_id}.lock"), 'a+') as f:
+                locked = self._flock(f, label, started)
+                try:
+                    waited = time.monotonic() - started
+                    self.stats['locked'] += 1
+                    if waited > self.poll:
+                        self.stats['waited'] += 1
+                        self.stats['waited_s'] += waited
+                        logger.info(f"Got the lock on {label} after {waited:.1f}s; re-reading its stored data")
+                    yield
+                finally:
+                    if locked and fcntl:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        finally:
+            thread_lock.release()
+
+    def _flock(self, f: Any, label: str, started: float) -> bool:
+        if not fcntl:
+            return False
+        announced = False
+        while True:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except (BlockingIOError, PermissionError):
+                if time.monotonic() - started > self.lock_timeout:
+                    # a hung process must not stall every match: scrape without the lock
+                    self.stats['timeouts'] += 1
+                    logger.warning(f"Gave up waiting for the lock on {label} after {self.lock_timeout:.0f}s")
+                    return False
+                if not announced:
+                    logger.info(f"{label} is being scraped by another process, waiting")
+                    announced = True
+                time.sleep(self.poll)
@@ -0,0 +1,197 @@
+"""Per-host adaptive rate limiting shared by all scrapers.
+
+Every host gets a token bucket whose state lives in
+`cache/ratelimit/<host>.json`. Access is serialized with an fcntl file lock
+(plus a thread lock), so threads, pool workers and match subprocesses all
+draw from the same bucket. The rate adapts: 429/503 responses halve it and
+honour `Retry-After`; a streak of successful responses raises it step by step
+up to the host's maximum, so each site runs as fast as it tolerates. A rate
+cut below the host's configured rate recovers towards it with time (half of
+the gap every `recover_half_life` seconds), so one throttling episode does not
+slow every later run.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from .common import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: thread lock only, state file still shared
+    fcntl = None
+
+# host suffix -> (initial requests/s, max requests/s)
+HOST_RATES: Dict[str, Tuple[float, float]] = {
+    'transfermarkt.com': (0.5, 2.0),
+    'transfermarkt.fr': (0.5, 2.0),
+    'transfermarkt.de': (0.5, 2.0),
+    'reddit.com': (0.5, 1.0),
+    'news.google.com': (2.0, 4.0),
+}
+DEFAULT_RATE: Tuple[float, float] = (1.0, 4.0)
+THROTTLE_STATUSES = (429, 503)
+
+
+def _host(url: str) -> str:
+    return urlparse(url or '').netloc.lower().split(':')[0] or 'unknown'
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """Token bucket per host, adaptive on throttling, shared across processes"""
+
+    def __init__(self, state_dir: Optional[str] = None, burst: float = 2.0, min_rate: float = 0.05,
+                 increase_after: int = 10, host_rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 recover_half_life: float = 600.0):
+        self.state_dir = state_dir or os.path.join(os.getcwd(), 'cache', 'ratelimit')
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase_after = increase_after
+        self.recover_half_life = recover_half_life
+        self.host_rates = dict(HOST_RATES)
+        self.host_rates.update(host_rates or {})
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {'acquired': 0, 'waited_s': 0.0, 'throttled': 0}
+
+    def configure(self, host: str, rate: float, max_rate: Optional[float] = None) -> None:
+        """Initial (and max) requests/s for a host suffix; learned state takes precedence"""
+        current = self.host_rates.get(host, DEFAULT_RATE)
+        self.host_rates[host] = (rate, max(max_rate or current[1], rate))
+
+    def _limits(self, host: str) -> Tuple[float, float]:
+        for suffix, limits in self.host_rates.items():
+            if host == suffix or host.endswith('.' + suffix):
+                return limits
+        return DEFAULT_RATE
+
+    def _thread_lock(self, host: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(host, threading.Lock())
+
+    @contextmanager
+    def _state(self, host: str) -> Iterator[Dict[str, Any]]:
+        """Locked read-modify-write of a host's bucket state"""
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = os.path.join(self.state_dir, f"{host}.json")
+        with self._thread_lock(host):
+            with open(path, 'a+', encoding='utf-8') as f:
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read() or '{}')
+                    except ValueError:
+                        state = {}
+                    if not state:
+                        rate, _ = self._limits(host)
+                        state = {'rate': rate, 'tokens': self.burst, 'updated': time.time(),
+                                 'blocked_until': 0.0, 'ok_streak': 0}
+                    self._recover(host, state)
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    if fcntl:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _recover(self, host: str, state: Dict[str, Any]) -> None:
+        """Move a throttled rate back towards the configured one for the time since it was last adjusted"""
+        now = time.time()
+        # no recovery while a Retry-After pause is running
+        since = max(state.get('rate_at', state['updated']), state['blocked_until'])
+        state['rate_at'] = max(since, now)
+        configured, _ = self._limits(host)
+        if state['rate'] >= configured or now <= since:
+            return
+        gap = (configured - state['rate']) * 0.5 ** ((now - since) / self.recover_half_life)
+        state['rate'] = configured - gap
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to `url`'s host is allowed; returns seconds waited"""
+        host = _host(url)
+        waited = 0.0
+        while True:
+            with self._state(host) as state:
+                now = time.time()
+                if now < state['blocked_until']:
+                    wait = state['blocked_until'] - now
+                else:
+                    elapsed = max(0.0, now - state['updated'])
+                    state['tokens'] = min(self.burst, state['tokens'] + elapsed * state['rate'])
+                    state['updated'] = now
+                    if state['tokens'] >= 1:
+                        state['tokens'] -= 1
+                        self.stats['acquired'] += 1
+                        self.stats['waited_s'] += waited
+                        return waited
+                    wait = (1 - state['tokens']) / state['rate']
+            # re-check after a bounded nap: another process may change the state
+            nap = min(wait, 5.0)
+            time.sleep(nap)
+            waited += nap
+
+    def feedback(self, url: str, status: Optional[int], headers: Optional[Dict[str, str]] = None) -> None:
+        """Adapt the host's rate to a response status (None = browser load, counts as success)"""
+        host = _host(url)
+        _, max_rate = self._limits(host)
+        with self._state(host) as state:
+            if status in THROTTLE_STATUSES:
+                retry_after = parse_retry_after((headers or {}).get('Retry-After'))
+                state['rate'] = max(self.min_rate, state['rate'] / 2)
+                state['tokens'] = 0.0
+                state['ok_streak'] = 0
+                pause = retry_after if retry_after is not None else 1 / state['rate']
+                state['blocked_until'] = max(state['blocked_until'], time.time() + pause)
+                # refill only starts once the pause is over
+                state['updated'] = state['blocked_until']
+                self.stats['throttled'] += 1
+                logger.warning(f"{host} throttled ({status}): pausing {pause:.1f}s, rate now {state['rate']:.2f}/s")
+            elif status is None or status < 400:
+                state['ok_streak'] += 1
+                if state['ok_streak'] >= self.increase_after and state['rate'] < max_rate:
+                    state['rate'] = min(max_rate, state['rate'] * 1.25)
+                    state['ok_streak'] = 0
+
+    def get(self, session: Any, url: str, **kwargs: Any) -> Any:
+        """`session.get` paced by the host bucket; the response status feeds the rate"""
+        return self.request(session, 'GET', url, **kwargs)
+
+    def request(self, session: Any, method: str, url: str, **kwargs: Any) -> Any:
+        self.acquire(url)
+        response = session.request(method, url, **kwargs)
+        self.feedback(url, getattr(response, 'status_code', None), getattr(response, 'headers', None))
+        return response
+
+
+_shared: Optional[HostRateLimiter] = None
+
+
+def shared_limiter() -> HostRateLimiter:
+    """Process-wide limiter (buckets are shared with other processes through the state files)"""
+    global _shared
+    if _shared is None:
+        _shared = HostRateLimiter()
+    return _shared
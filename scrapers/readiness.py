@@ -0,0 +1,175 @@
+"""Readiness-based waits for browser fetches (instead of a fixed sleep).
+
+After navigation a page counts as ready once `document.readyState` is
+"complete" and either the domain's CSS selector is present or the DOM and the
+network are quiet (element count, text length and resource count unchanged
+for `quiet` seconds). Waits never exceed the cap. Observed time-to-ready is
+kept per domain in `cache/readiness.json` (moving average); a domain's wait
+cap shrinks towards a few times its usual time-to-ready, so fast sites stop
+paying for slow ones, and domains that never settle fall back to `min_cap`.
+Observations are kept in memory and written every `save_every` observations,
+at `log_summary` and at exit.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from .common import logger
+from .storage import atomic_write_json
+
+# Content containers that mean "rendered" on sites we scrape a lot
+DEFAULT_SELECTORS = {
+    'www.transfermarkt.com': 'main .data-header, main .responsive-table',
+    'www.transfermarkt.fr': 'main .data-header, main .responsive-table',
+    'www.bbc.com': '#main-content article, #main-content [data-testid]',
+    'www.bbc.co.uk': '#main-content article, #main-content [data-testid]',
+    'www.skysports.com': '.sdc-article-body, .sdc-site-layout main',
+}
+
+# readyState, element count, visible text length, loaded resources
+_SNAPSHOT_JS = (
+    "[document.readyState, document.getElementsByTagName('*').length, "
+    "document.body ? document.body.innerText.length : 0, "
+    "performance.getEntriesByType('resource').length]"
+)
+
+
+def _domain(url: str) -> str:
+    return urlparse(url or '').netloc.lower()
+
+
+class ReadinessPolicy:
+    """Waits for browser pages to be ready and learns per-domain time-to-ready"""
+
+    def __init__(self, stats_path: Optional[str] = None, cap: float = 8.0, min_cap: float = 2.0,
+                 quiet: float = 0.5, poll: float = 0.1, selectors: Optional[Dict[str, str]] = None,
+                 save_every: int = 25):
+        self.stats_path = stats_path or os.path.join(os.getcwd(), 'cache', 'readiness.json')
+        self.cap = cap
+        self.min_cap = min_cap
+        self.quiet = quiet
+        self.poll = poll
+        self.selectors = dict(DEFAULT_SELECTORS)
+        self.selectors.update(selectors or {})
+        self.save_every = save_every
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = self._load()
+        self._unsaved = 0
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable readiness stats {self.stats_path}: {e}")
+            return {}
+
+    def cap_for(self, url: str) -> float:
+        """Wait cap for a URL: 3x the domain's usual time-to-ready, within [min_cap, cap]"""
+        entry = self._stats.get(_domain(url))
+        if not entry or entry.get('count', 0) < 3:
+            return self.cap
+        if entry.get('timeouts', 0) * 2 > entry['count']:
+            # never settles (live tickers, rotating ads): waiting longer doesn't help
+            return self.min_cap
+        return max(self.min_cap, min(self.cap, 3 * entry['avg']))
+
+    def record(self, url: str, seconds: float, timed_out: bool) -> None:
+        """Fold one observation into the domain average (persisted every `save_every` observations)"""
+        domain = _domain(url)
+        if not domain:
+            return
+        with self._lock:
+            entry = self._stats.setdefault(domain, {'avg': seconds, 'count': 0, 'timeouts': 0})
+            entry['count'] += 1
+            entry['timeouts'] += int(timed_out)
+            # a timed-out wait says "at least the cap": pull the average up faster
+            weight = 0.5 if timed_out else 0.2
+            entry['avg'] = round((1 - weight) * entry['avg'] + weight * seconds, 3)
+            self._unsaved += 1
+            due = self._unsaved >= self.save_every
+        if due:
+            self.save()
+
+    def save(self) -> None:
+        """Write unsaved observations, merged with what other processes wrote"""
+        with self._lock:
+            if not self._unsaved:
+                return
+            try:
+                merged = self._load()
+                merged.update(self._stats)
+                self._stats = merged
+                atomic_write_json(self.stats_path, merged, indent=None)
+                self._unsaved = 0
+            except Exception as e:
+                logger.debug(f"Error saving readiness stats: {e}")
+
+    def log_summary(self) -> None:
+        with self._lock:
+            observed = sum(int(e.get('count', 0)) for e in self._stats.values())
+        logger.info(f"Readiness: {len(self._stats)} domains, {observed} page loads observed")
+        self.save()
+
+    def _wait(self, probe: Any, has_selector: Any, url: str) -> float:
+        cap = self.cap_for(url)
+        selector = self.selectors.get(_domain(url))
+        start = time.monotonic()
+        last = None
+        stable_since = start
+        timed_out = True
+        while time.monotonic() - start < cap:
+            try:
+                snapshot = list(probe() or [])
+                if snapshot and snapshot[0] == 'complete':
+                    if selector and has_selector(selector):
+                        timed_out = False
+                        break
+                    now = time.monotonic()
+                    if snapshot != last:
+                        last, stable_since = snapshot, now
+                    elif now - stable_since >= self.quiet:
+                        timed_out = False
+                        break
+            except Exception as e:
+                # page still navigating / script not injectable yet
+                logger.debug(f"Readiness probe failed for {url[:80]}: {e}")
+            time.sleep(self.poll)
+        waited = time.monotonic() - start
+        self.record(url, waited, timed_out)
+        return waited
+
+    def wait_selenium(self, driver: Any, url: str) -> float:
+        """Block until a Selenium page is ready (or the cap); returns the seconds waited"""
+        return self._wait(
+            lambda: driver.execute_script(f"return {_SNAPSHOT_JS};"),
+            lambda sel: driver.execute_script("return document.querySelector(arguments[0]) !== null;", sel),
+            url
+        )
+
+    def wait_playwright(self, page: Any, url: str) -> float:
+        """Block until a Playwright page is ready (or the cap); returns the seconds waited"""
+        return self._wait(
+            lambda: page.evaluate(f"() => {_SNAPSHOT_JS}"),
+            lambda sel: page.evaluate("(sel) => document.querySelector(sel) !== null", sel),
+            url
+        )
+
+
+_shared: Optional[ReadinessPolicy] = None
+
+
+def shared_policy() -> ReadinessPolicy:
+    """Process-wide policy, so every scraper learns from the same observations"""
+    global _shared
+    if _shared is None:
+        _shared = ReadinessPolicy()
+        atexit.register(_shared.save)
+    return _shared
@@ -0,0 +1,491 @@
+"""Reddit (public JSON API) and Twitter (Nitter) scraper."""
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict
+
+import requests
+
+from .common import _soup, logger
+from .config import BatchProcessor, Config
+from .ratelimit import shared_limiter
+
+
+@dataclass
+class RedditComment:
+    """Reddit comment data class"""
+    comment_id: str
+    author: str
+    body: str
+    score: int
+    created_utc: float
+    parent_id: str
+    permalink: str
+    is_submitter: bool
+    depth: int = 0
+    parent_body: str = ""
+    post_title: str = ""
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary"""
+        data = asdict(self)
+        data['created_time'] = datetime.fromtimestamp(self.created_utc).strftime('%Y-%m-%d %H:%M:%S')
+        return data
+
+
+@dataclass
+class RedditPost:
+    """Reddit post data class"""
+    post_id: str
+    title: str
+    author: str
+    selftext: str
+    url: str
+    permalink: str
+    score: int
+    num_comments: int
+    created_utc: float
+    subreddit: str
+    flair: Optional[str]
+    comments: List[RedditComment] = None
+    
+    def __post_init__(self):
+        if self.comments is None:
+            self.comments = []
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary"""
+        data = asdict(self)
+        data['created_time'] = datetime.fromtimestamp(self.created_utc).strftime('%Y-%m-%d %H:%M:%S')
+        data['comments'] = [c.to_dict() for c in self.comments]
+        return data
+
+
+class Redit_Twitter_Scraper:
+    """Scrapes Reddit and Twitter (via Nitter). Supports keyword-driven searches from external config."""
+    
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    
+    BASE_URL = "https://www.reddit.com"
+    
+    def __init__(self, delay: float = 2.0, keywords_file: Optional[str] = None):
+        self.conf = Config()
+        self.delay = delay
+        self.target_pages = 10000
+        self.posts_per_page = 100
+        self.subreddit = "soccer"
+        self.sort = "new"
+        self.time_filter = "all"
+        self.fetch_comments = True
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        # Shared per-host token buckets; `delay` is the initial spacing for Reddit
+        self.rate_limiter = shared_limiter()
+        if delay and delay > 0:
+            self.rate_limiter.configure('reddit.com', 1.0 / delay)
+        # External keyword/subreddit lists
+        self.keywords: List[str] = []
+        self.subreddits: List[str] = []
+        if keywords_file:
+            try:
+                self.load_comment_config(keywords_file)
+            except Exception:
+                logger.warning(f"Could not load keywords from {keywords_file}")
+        
+        # Twitter/Nitter configuration
+        self.nitter_instances = [
+            "https://nitter.privacydev.net",
+            "https://nitter.tiekoetter.com",
+            "https://nitter.woodland.cafe",
+            "https://nitter.fdn.fr",
+            "https://nitter.kavin.rocks",
+            "https://nitter.unixfox.eu",
+            "https://nitter.cz",
+            "https://nitter.projectsegfau.lt",
+            "https://nitter.nl",
+            "https://nitter.it"
+        ]
+        self.current_instance = 0
+        self.timeout = 10
+        self.max_workers = 3
+        
+        # Event keywords for categorization
+        self.event_keywords = {
+            'goal': ['goal', 'but', 'score', 'scored'],
+            'match': ['match', 'game', 'vs', 'against'],
+            'controversy': ['controversy', 'protest', 'scandal', 'dispute'],
+            'penalty': ['penalty', 'pénalty', 'pk'],
+            'save': ['save', 'arrêt', 'saved'],
+            'celebration': ['celebration', 'celebrate', 'célébration'],
+            'injury': ['injury', 'blessure', 'injured'],
+            'red_card': ['red card', 'carton rouge', 'expelled'],
+            'final': ['final', 'finale'],
+            'semifinal': ['semifinal', 'semi-final', 'demi-finale']
+        }
+        
+        self.team_data = {}
+    
+    def get_subreddit_posts(self, subreddit: str = "soccer", sort: str = "new", 
+                            limit: int = 100, time_filter: str = "all", 
+                            after: Optional[str] = None) -> Tuple[List[RedditPost], Optional[str]]:
+        """Get posts from subreddit"""
+        url = f"{self.BASE_URL}/r/{subreddit}/{sort}.json"
+        params = {
+            'limit': min(limit, 100),
+            'raw_json': 1
+        }
+        
+        if after:
+            params['after'] = after
+        if time_filter and sort == 'top':
+            params['t'] = time_filter
+        
+        try:
+            response = self.rate_limiter.get(self.session, url, params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            
+            posts = []
+            for item in data['data']['children']:
+                post_data = item['data']
+                
+                post = RedditPost(
+                    post_id=post_data['id'],
+                    title=post_data['title'],
+                    author=post_data.get('author', '[deleted]'),
+                    selftext=post_data.get('selftext', ''),
+                    url=post_data.get('url', ''),
+                    permalink=post_data['permalink'],
+                    score=post_data['score'],
+                    num_comments=post_data['num_comments'],
+                    created_utc=post_data['created_utc'],
+                    subreddit=post_data['subreddit'],
+                    flair=post_data.get('link_flair_text')
+                )
+                posts.append(post)
+            
+            next_after = data['data'].get('after')
+            return posts, next_after
+            
+        except Exception as e:
+            logger.error(f"Error fetching subreddit posts: {e}")
+            return [], None
+    
+    def get_post_comments(self, post: RedditPost, limit: int = 100) -> List[RedditComment]:
+        """Get comments for a post"""
+        url = f"{self.BASE_URL}{post.permalink}.json"
+        params = {
+            'limit': limit,
+            'raw_json': 1,
+            'depth': 10
+        }
+        
+        comments = []
+        try:
+            response = self.rate_limiter.get(self.session, url, params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            
+            if len(data) > 1:
+                comments_data = data[1]['data']['children']
+                
+                def extract_comments(comment_list, depth=0):
+                    for comment_item in comment_list:
+                        if comment_item['kind'] == 't1':
+                            comment_data = comment_item['data']
+                            
+                            comment = RedditComment(
+                                comment_id=comment_data['id'],
+                                author=comment_data.get('author', '[deleted]'),
+                                body=comment_data.get('body', ''),
+                                score=comment_data['score'],
+                                created_utc=comment_data['created_utc'],
+                                parent_id=comment_data['parent_id'],
+                                permalink=comment_data['permalink'],
+                                is_submitter=comment_data.get('is_submitter', False),
+                                depth=depth,
+                                parent_body='',
+                                post_title=post.title
+                            )
+                            comments.append(comment)
+                            
+                            # Process replies
+                            if 'replies' in comment_data and comment_data['replies']:
+                                if isinstance(comment_data['replies'], dict):
+                                    replies = comment_data['replies']['data']['children']
+                                    extract_comments(replies, depth + 1)
+                
+                extract_comments(comments_data)
+        
+        except Exception as e:
+            logger.error(f"Error fetching comments for post {post.post_id}: {e}")
+        
+        return comments
+    
+    def scrape_reddit_pages(self, num_pages: int = 10) -> List[RedditPost]:
+        """Scrape multiple pages of Reddit posts"""
+        all_posts = []
+        after = None
+        posts_per_page = 100
+        total_pages = min(num_pages, self.target_pages // posts_per_page)
+        
+        logger.info(f"Scraping {total_pages} pages from r/{self.subreddit}")
+        
+        for page in range(total_pages):
+            logger.info(f"Fetching page {page + 1}/{total_pages} (after: {after})")
+            
+            posts, next_after = self.get_subreddit_posts(
+                subreddit=self.subreddit,
+                sort=self.sort,
+                limit=posts_per_page,
+                time_filter=self.time_filter,
+                after=after
+            )
+            
+            if not posts:
+                logger.warning("No posts received, stopping")
+                break
+            
+            if self.fetch_comments:
+                logger.info(f"Fetching comments for {len(posts)} posts...")
+                for i, post in enumerate(posts, 1):
+                    if i % 10 == 0:
+                        logger.info(f"  Processed {i}/{len(posts)} posts")
+                    post.comments = self.get_post_comments(post)
+            
+            all_posts.extend(posts)
+            after = next_after
+            
+            if not after:
+                logger.info("No more pages available")
+                break
+        
+        logger.info(f"Scraped {len(all_posts)} posts with comments")
+        return all_posts
+
+    def load_comment_config(self, path: str) -> None:
+        """Load keywords and optional subreddits from a JSON config file.
+
+        Expected format: {"keywords": [...], "subreddits": [...]}
+        """
+        try:
+            if not os.path.exists(path):
+                logger.warning(f"Comment config not found: {path}")
+                return
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                kws = data.get('keywords') or data.get('key_words') or data.get('keyWords')
+                subs = data.get('subreddits') or data.get('subreddits_list') or data.get('subreddit')
+                if isinstance(kws, list):
+                    self.keywords = [str(k).strip() for k in kws if k]
+                if isinstance(subs, list):
+                    self.subreddits = [str(s).strip() for s in subs if s]
+                logger.info(f"Loaded {len(self.keywords)} keywords and {len(self.subreddits)} subreddits from {path}")
+        except Exception as e:
+            logger.error(f"Error loading comment config: {e}")
+
+    def get_search_posts(self, keyword: str, limit: int = 100) -> Tuple[List[RedditPost], Optional[str]]:
+        """Search Reddit globally for a keyword using the public search endpoint."""
+        url = f"{self.BASE_URL}/search.json"
+        params = {
+            'q': keyword,
+            'limit': min(limit, 100),
+            'sort': self.sort,
+            't': self.time_filter,
+            'raw_json': 1
+        }
+
+        try:
+            response = self.rate_limiter.get(self.session, url, params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            posts = []
+            for item in data.get('data', {}).get('children', []):
+                post_data = item.get('data', {})
+                try:
+                    post = RedditPost(
+                        post_id=post_data.get('id', ''),
+                        title=post_data.get('title', ''),
+                        author=post_data.get('author', '[deleted]'),
+                        selftext=post_data.get('selftext', ''),
+                        url=post_data.get('url', ''),
+                        permalink=post_data.get('permalink', ''),
+                        score=post_data.get('score', 0),
+                        num_comments=post_data.get('num_comments', 0),
+                        created_utc=post_data.get('created_utc', 0),
+                        subreddit=post_data.get('subreddit', ''),
+                        flair=post_data.get('link_flair_text')
+                    )
+                    posts.append(post)
+                except Exception:
+                    continue
+
+            next_after = data.get('data', {}).get('after')
+            return posts, next_after
+        except Exception as e:
+            logger.error(f"Error searching posts for '{keyword}': {e}")
+            return [], None
+
+    def scrape_by_keywords(self, keywords: List[str] = None, per_keyword_limit: int = 100) -> List[RedditPost]:
+        """Scrape Reddit posts by keyword list. Fetch comments if enabled."""
+        if keywords is None:
+            keywords = self.keywords
+        if not keywords:
+            logger.warning("No keywords provided for scrape_by_keywords")
+            return []
+
+        all_posts: List[RedditPost] = []
+        processor = BatchProcessor(batch_size=self.conf.batch_size, output_dir="reddit_data")
+        batch = []
+        batch_num = 1
+
+        for kw in keywords:
+            logger.info(f"Searching Reddit for keyword: {kw}")
+            posts, _ = self.get_search_posts(kw, limit=per_keyword_limit)
+            if not posts:
+                logger.info(f"No posts found for keyword: {kw}")
+                continue
+
+            if self.fetch_comments:
+                for i, post in enumerate(posts, 1):
+                    post.comments = self.get_post_comments(post)
+
+            batch.extend(posts)
+            all_posts.extend(posts)
+
+            # Save batches periodically
+            if len(batch) >= processor.batch_size:
+                processor.process_batch(batch, batch_num, fetch_comments=self.fetch_comments)
+                batch = []
+                batch_num += 1
+
+        if batch:
+            processor.process_batch(batch, batch_num, fetch_comments=self.fetch_comments)
+
+        logger.info(f"Keyword-based scraping complete: {len(all_posts)} posts collected")
+        return all_posts
+    
+    def scrape_soccer_10000_pages(self) -> None:
+        """Scrape 10000 pages of soccer content (main method)"""
+        logger.info("Starting Reddit scraper for soccer content...")
+        
+        processor = BatchProcessor(batch_size=self.conf.batch_size, output_dir="reddit_data")
+        progress = processor.load_progress()
+        
+        current_after = progress["last_after"]
+        current_batch = progress["current_batch"]
+        
+        posts_per_page = 100
+        pages_per_batch = 10
+        num_batches = self.target_pages // pages_per_batch
+        
+        logger.info(f"Target: {self.target_pages} pages, {num_batches} batches")
+        
+        while current_batch <= num_batches:
+            if current_batch in progress["completed_batches"]:
+                logger.info(f"Batch {current_batch} already completed, skipping")
+                current_batch += 1
+                continue
+            
+            logger.info(f"\n{'='*60}")
+            logger.info(f"STARTING BATCH {current_batch}/{num_batches}")
+            logger.info(f"{'='*60}")
+            
+            batch_posts = []
+            pages_in_batch = 0
+            
+            while pages_in_batch < pages_per_batch:
+                remaining = pages_per_batch - pages_in_batch
+                limit = min(posts_per_page, remaining * posts_per_page)
+                
+                logger.info(f"Fetching page {progress['pages_fetched'] + 1} (after: {current_after})")
+                
+                posts, next_after = self.get_subreddit_posts(
+                    subreddit=self.subreddit,
+                    sort=self.sort,
+                    limit=limit,
+                    time_filter=self.time_filter,
+                    after=current_after
+                )
+                
+                if not posts:
+                    logger.warning("No posts received, stopping batch")
+                    break
+                
+                batch_posts.extend(posts)
+                pages_in_batch += 1
+                progress["pages_fetched"] += 1
+                current_after = next_after
+                
+                progress["last_after"] = current_after
+                processor.save_progress(progress)
+                
+                if not current_after:
+                    logger.info("No more pages available (after=None)")
+                    break
+            
+            if batch_posts:
+                # Fetch comments if enabled
+                if self.fetch_comments:
+                    logger.info(f"Fetching comments for {len(batch_posts)} posts...")
+                    for i, post in enumerate(batch_posts, 1):
+                        if i % 10 == 0:
+                            logger.info(f"  Processed {i}/{len(batch_posts)} posts")
+                        post.comments = self.get_post_comments(post)
+                
+                stats = processor.process_batch(batch_posts, current_batch, self.fetch_comments)
+                progress["posts_collected"] += stats["posts"]
+                progress["comments_collected"] += stats.get("comments", 0)
+                progress["completed_batches"].append(current_batch)
+                progress["current_batch"] = current_batch + 1
+                progress["last_after"] = current_after
+                processor.save_progress(progress)
+                
+                logger.info(f"Batch {current_batch} complete: {stats['posts']} posts, {stats.get('comments', 0)} comments")
+            
+            current_batch += 1
+            
+        
+        logger.info("Reddit scraping complete!")
+    
+    def twitter_scraper(self, queries: List[str] = None) -> List[Dict]:
+        """Scrape Twitter via Nitter instances"""
+        if not queries:
+            return []
+        
+        results = []
+        
+        for query in queries:
+            for instance in self.nitter_instances:
+                try:
+                    url = f"{instance}/search?f=tweets&q={requests.utils.quote(query)}"
+                    
+                    response = self.rate_limiter.get(self.session, url, timeout=self.timeout)
+                    
+                    if response.status_code == 200:
+                        soup = _soup(response.text)
+                        
+                        tweets = []
+                        for tweet_div in soup.find_all('div', class_='timeline-item'):
+                            content = tweet_div.find('div', class_='tweet-content')
+                            if content:
+                                tweet_text = content.get_text(strip=True)
+                                tweets.append({
+                                    'text': tweet_text,
+                                    'query': query,
+                                    'source': instance
+                                })
+                        
+                        results.extend(tweets)
+                        logger.info(f"Found {len(tweets)} tweets for query '{query}' on {instance}")
+                        break  # Success, move to next query
+                    
+                except Exception as e:
+                    logger.warning(f"Error with {instance} for query '{query}': {e}")
+                    continue
+        
+        return results
@@ -0,0 +1,176 @@
+"""Rendering profiles: what headless browsers may download.
+
+We only read text and links, so the default "text" profile blocks images,
+media, fonts and known ad/analytics hosts. Selenium gets Chrome prefs at
+start-up plus CDP `Network.setBlockedURLs`; only the URL blocklist can be
+switched per scraper on a shared driver, the prefs stay those of the profile
+the driver was created with. Playwright pages get request interception. Page-load times are
+recorded per profile so the savings against the unblocked "full" profile can
+be reported.
+"""
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from .common import logger
+
+AD_TRACKER_DOMAINS = [
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com', 'google-analytics.com',
+    'googletagmanager.com', 'googletagservices.com', 'adservice.google.com', 'amazon-adsystem.com',
+    'adnxs.com', 'criteo.com', 'criteo.net', 'taboola.com', 'outbrain.com', 'scorecardresearch.com',
+    'chartbeat.com', 'chartbeat.net', 'quantserve.com', 'hotjar.com', 'facebook.net', 'connect.facebook.net',
+    'optimizely.com', 'moatads.com', 'rubiconproject.com', 'pubmatic.com', 'casalemedia.com',
+    'teads.tv', 'smartadserver.com', 'yieldmo.com', 'permutive.com', 'cdn.cookielaw.org',
+]
+
+IMAGE_EXTENSIONS = ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp']
+MEDIA_EXTENSIONS = ['mp4', 'webm', 'm3u8', 'ts', 'mp3', 'ogg', 'wav', 'mov']
+FONT_EXTENSIONS = ['woff', 'woff2', 'ttf', 'otf', 'eot']
+
+
+class RenderProfile:
+    """Resource classes a headless browser should not download"""
+
+    def __init__(self, name: str, block_images: bool = True, block_media: bool = True,
+                 block_fonts: bool = True, block_trackers: bool = True,
+                 extra_domains: Optional[List[str]] = None):
+        self.name = name
+        self.block_images = block_images
+        self.block_media = block_media
+        self.block_fonts = block_fonts
+        self.block_trackers = block_trackers
+        self.blocked_domains = (AD_TRACKER_DOMAINS if block_trackers else []) + list(extra_domains or [])
+
+    @property
+    def blocks_anything(self) -> bool:
+        return self.block_images or self.block_media or self.block_fonts or bool(self.blocked_domains)
+
+    def resource_types(self) -> set:
+        """Playwright request.resource_type values to abort"""
+        types = set()
+        if self.block_images:
+            types.add('image')
+        if self.block_media:
+            types.add('media')
+        if self.block_fonts:
+            types.add('font')
+        return types
+
+    def url_patterns(self) -> List[str]:
+        """Wildcard patterns for CDP Network.setBlockedURLs"""
+        extensions = ((IMAGE_EXTENSIONS if self.block_images else [])
+                      + (MEDIA_EXTENSIONS if self.block_media else [])
+                      + (FONT_EXTENSIONS if self.block_fonts else []))
+        patterns = [f"*.{ext}" for ext in extensions] + [f"*.{ext}?*" for ext in extensions]
+        patterns += [f"*{domain}*" for domain in self.blocked_domains]
+        return patterns
+
+    def chrome_prefs(self) -> Dict[str, int]:
+        """Chrome content settings (2 = block) applied when the driver starts"""
+        prefs = {}
+        if self.block_images:
+            prefs['profile.managed_default_content_settings.images'] = 2
+        return prefs
+
+    def blocks_host(self, url: str) -> bool:
+        host = urlparse(url).netloc.lower()
+        return any(host == d or host.endswith('.' + d) for d in self.blocked_domains)
+
+
+PROFILES: Dict[str, RenderProfile] = {
+    'text': RenderProfile('text'),
+    'no-trackers': RenderProfile('no-trackers', block_images=False, block_media=False, block_fonts=False),
+    'full': RenderProfile('full', block_images=False, block_media=False, block_fonts=False, block_trackers=False),
+}
+DEFAULT_PROFILE = 'text'
+
+
+def get_profile(name: Optional[str]) -> RenderProfile:
+    """Profile by name (unknown names fall back to the default with a warning)"""
+    if name in PROFILES:
+        return PROFILES[name]
+    if name:
+        logger.warning(f"Unknown render profile '{name}', using '{DEFAULT_PROFILE}'")
+    return PROFILES[DEFAULT_PROFILE]
+
+
+def apply_to_selenium(driver: Any, name: Optional[str]) -> None:
+    """Switch a (possibly shared) Chrome driver to a profile's CDP URL blocklist.
+
+    Chrome prefs cannot change after start-up: a mismatch against the profile
+    the driver was created with is logged.
+    """
+    profile = get_profile(name)
+    if getattr(driver, '_render_profile', None) == profile.name:
+        return
+    created = getattr(driver, '_created_profile', None)
+    if created and get_profile(created).chrome_prefs() != profile.chrome_prefs():
+        logger.warning(f"Driver created with render profile '{created}' keeps its Chrome prefs "
+                       f"(images {'blocked' if get_profile(created).block_images else 'allowed'}); "
+                       f"only the URL blocklist of '{profile.name}' applies")
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': profile.url_patterns()})
+        driver._render_profile = profile.name
+    except Exception as e:
+        # non-Chrome drivers have no CDP; prefs (if any) still apply
+        logger.debug(f"Could not apply render profile '{profile.name}': {e}")
+
+
+def apply_to_playwright(page: Any, name: Optional[str]) -> None:
+    """Abort blocked resource types and hosts through Playwright request interception"""
+    profile = get_profile(name)
+    if not profile.blocks_anything:
+        return
+    types = profile.resource_types()
+
+    def handle(route, request):
+        if request.resource_type in types or profile.blocks_host(request.url):
+            load_stats.count_blocked(profile.name)
+            return route.abort()
+        return route.continue_()
+
+    page.route('**/*', handle)
+
+
+class LoadStats:
+    """Page-load time and blocked-request counters per profile"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.profiles: Dict[str, Dict[str, float]] = {}
+
+    def _entry(self, name: str) -> Dict[str, float]:
+        return self.profiles.setdefault(name, {'loads': 0, 'seconds': 0.0, 'blocked': 0})
+
+    def record(self, name: Optional[str], seconds: float) -> None:
+        with self._lock:
+            entry = self._entry(get_profile(name).name)
+            entry['loads'] += 1
+            entry['seconds'] += seconds
+
+    def count_blocked(self, name: str) -> None:
+        with self._lock:
+            self._entry(name)['blocked'] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Average load seconds per profile and the saving against 'full' when measured"""
+        out = {}
+        with self._lock:
+            for name, entry in self.profiles.items():
+                avg = entry['seconds'] / entry['loads'] if entry['loads'] else 0.0
+                out[name] = {'loads': entry['loads'], 'avg_s': round(avg, 3), 'blocked': entry['blocked']}
+        full = out.get('full', {}).get('avg_s')
+        for name, entry in out.items():
+            if full and name != 'full':
+                entry['saving_pct'] = round(100 * (full - entry['avg_s']) / full, 1)
+        return out
+
+    def log_summary(self) -> None:
+        for name, entry in self.summary().items():
+            saving = f", {entry['saving_pct']}% faster than full" if 'saving_pct' in entry else ''
+            logger.info(f"Render profile '{name}': {entry['loads']} page loads, avg {entry['avg_s']}s, "
+                        f"{entry['blocked']} requests blocked{saving}")
+
+
+load_stats = LoadStats()
@@ -0,0 +1,120 @@
+"""Crash-safe file writes.
+
+`atomic_write_json` writes to a temp file in the target directory, fsyncs it and
+renames it over the target, so a kill mid-write (e.g. the supervisor's
+terminate() on Ctrl-C) leaves either the old or the new file, never a truncated
+one. `WriteAheadLog` is an append-only JSON-lines log used for progress state.
+"""
+import json
+import os
+import tempfile
+from typing import Any, List, Optional
+
+from .common import logger
+
+
+def _fsync_dir(directory: str) -> None:
+    """Persist a rename by syncing the containing directory (no-op where unsupported)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2, ensure_ascii: bool = False) -> None:
+    """Write JSON to `path` with write-to-temp + fsync + rename semantics"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=ensure_ascii, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+class WriteAheadLog:
+    """Append-only log of JSON records, one per line, each fsync'ed before returning"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                # cut a torn trailing record so the next append starts on a fresh line
+                valid = data[:data.rfind(b'\n') + 1]
+                if len(valid) != len(data):
+                    with open(path, 'r+b') as f:
+                        f.truncate(len(valid))
+                self.count = valid.count(b'\n')
+            except OSError:
+                self.count = 0
+
+    def append(self, record: Any) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.count += 1
+
+    def records(self) -> List[Any]:
+        """All complete records in append order"""
+        if not os.path.exists(self.path):
+            return []
+        out = []
+        try:
+            with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        break
+                    try:
+                        out.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError as e:
+            logger.error(f"Error reading write-ahead log {self.path}: {e}")
+        return out
+
+    def last(self) -> Optional[Any]:
+        """Last complete record (a torn trailing line from a kill is ignored)"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                lines = f.read().split(b'\n')
+        except OSError as e:
+            logger.error(f"Error reading write-ahead log {self.path}: {e}")
+            return None
+        # everything after the final newline is an incomplete write
+        for line in reversed(lines[:-1]):
+            try:
+                return json.loads(line.decode('utf-8'))
+            except ValueError:
+                continue
+        return None
+
+    def reset(self) -> None:
+        """Drop all records (called after they were folded into a snapshot)"""
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            logger.error(f"Error resetting write-ahead log {self.path}: {e}")
+        self.count = 0
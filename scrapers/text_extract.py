@@ -0,0 +1,99 @@
+"""Single-pass page text extraction on lxml.
+
+One walk over the parsed tree skips boilerplate subtrees (script, style, nav,
+header, footer, ...), appends text until the length cap is reached, counts
+words and sentences as it goes and collects canonical links (scrapers.links)
+on the way. This replaces the BeautifulSoup decompose / get_text / regex
+collapse / split sequence.
+"""
+from typing import Any, Dict, List, Optional
+
+from .common import _lazy
+from .links import LinkCollector
+
+BOILERPLATE_TAGS = frozenset(['script', 'style', 'nav', 'footer', 'header', 'noscript', 'template'])
+
+
+def parse_html(html: str) -> Any:
+    """lxml tree of an HTML page (str or bytes)"""
+    lxml_html = _lazy('lxml.html')
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # str input with an XML encoding declaration
+        return lxml_html.fromstring(html.encode('utf-8'))
+
+
+def extract_page(html: str, max_chars: int = 10000, max_links: int = 100,
+                 count_all: bool = True, base_url: Optional[str] = None) -> Dict[str, Any]:
+    """Title, capped content, word/sentence counts and http(s) links of a page.
+
+    Text is collected only up to `max_chars`. With `count_all` words and
+    sentences (". " boundaries) are counted over the whole visible text, as
+    before; without it text handling stops as soon as the text cap is reached,
+    so the counts cover the page up to that point only, while links are still
+    collected over the whole page (up to `max_links`). With
+    `base_url` relative links are resolved against it; without, only absolute
+    http(s) links are kept.
+    """
+    doc = parse_html(html)
+    title_el = doc.find('.//title')
+    title = (title_el.text_content() or '').strip() if title_el is not None else ''
+
+    parts: List[str] = []
+    size = 0
+    word_count = 0
+    sentence_breaks = 0
+    last_word = ''
+    links = LinkCollector(base_url, limit=max_links)
+
+    def add_text(text: str) -> None:
+        nonlocal size, word_count, sentence_breaks, last_word
+        if not count_all and size >= max_chars:
+            return
+        words = text.split()
+        if not words:
+            return
+        # a ". " boundary is a word ending in "." that is followed by another word
+        if last_word.endswith('.'):
+            sentence_breaks += 1
+        sentence_breaks += sum(1 for w in words[:-1] if w.endswith('.'))
+        word_count += len(words)
+        last_word = words[-1]
+        if size < max_chars:
+            chunk = ' '.join(words)
+            parts.append(chunk)
+            size += len(chunk) + 1
+
+    # explicit stack walk: (element, closing); a closing entry emits the tail,
+    # which is sibling text and survives removal of the element itself
+    stack = [(doc, False)]
+    while stack:
+        el, closing = stack.pop()
+        if closing:
+            if el.tail:
+                add_text(el.tail)
+        else:
+            tag = el.tag
+            if not isinstance(tag, str) or tag in BOILERPLATE_TAGS:
+                # comments / processing instructions / boilerplate: skip the subtree
+                if el.tail:
+                    add_text(el.tail)
+            else:
+                if tag == 'a' and not links.full:
+                    links.add(el.get('href'))
+                if el.text:
+                    add_text(el.text)
+                stack.append((el, True))
+                stack.extend((child, False) for child in reversed(el))
+        if not count_all and size >= max_chars and links.full:
+            break
+
+    content = ' '.join(parts)[:max_chars]
+    return {
+        'title': title,
+        'content': content,
+        'word_count': word_count,
+        'line_count': sentence_breaks + 1 if word_count else 0,
+        'found_urls': links.links,
+    }
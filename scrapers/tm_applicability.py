@@ -0,0 +1,188 @@
+"""Learned applicability of Transfermarkt page types.
+
+Most of the 20 page types are empty or redirect for most players (coach
+performance, debuts, penalty goals for goalkeepers, ...). After each fetch the
+outcome is recorded per player and per player group (role from the profile +
+whether the player is a current international), in
+`transfermarkt_data/data/page_applicability.json`. Before a player's pages are
+fetched the plan skips page types that:
+
+- were empty for this player on the last scrape (until `recheck_days` pass),
+- the profile rules out (no national team -> no `nationalmannschaft`),
+- were almost never useful for the player's group over enough observations.
+
+A small exploration rate keeps re-checking skipped types so the learned rates
+don't freeze.
+"""
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .common import logger
+from .storage import atomic_write_json
+
+USEFUL, EMPTY, MISSING = 'useful', 'empty', 'missing'
+
+ALWAYS_FETCH = ('profil',)
+NATIONAL_TEAM_PAGES = ('nationalmannschaft',)
+
+ROLE_KEYWORDS = {
+    'goalkeeper': ('goalkeeper', 'gardien', 'torwart', 'keeper'),
+    'defender': ('defender', 'défenseur', 'defense', 'défense', 'back', 'abwehr', 'verteidiger'),
+    'midfield': ('midfield', 'milieu', 'mittelfeld'),
+    'attack': ('attack', 'forward', 'striker', 'winger', 'attaquant', 'ailier', 'avant-centre', 'sturm'),
+}
+# not plain 'national': that also matches the nationality row every profile has
+NATIONAL_TEAM_KEYWORDS = ('international', 'sélection', 'nationalspieler', 'länderspiele', 'caps')
+
+# profile/found_urls bookkeeping keys that don't count as extracted data
+_META_KEYS = {'found_urls', 'url', 'error', 'html_saved', 'page_type', 'skipped'}
+
+
+def profile_hints(profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Role and national-team status from a parsed profile page (None = unknown)"""
+    hints: Dict[str, Any] = {'role': None, 'national_team': None}
+    if not isinstance(profile, dict) or profile.get('error'):
+        return hints
+    info = profile.get('basic_info') or {}
+    position = profile.get('position') or ''
+    for key, value in info.items():
+        if key.lower().startswith(('position', 'poste')):
+            position = position or str(value)
+    position = position.lower()
+    for role, keywords in ROLE_KEYWORDS.items():
+        if any(k in position for k in keywords):
+            hints['role'] = role
+            break
+    if info:
+        # the header only lists caps / current international for national-team players
+        hints['national_team'] = any(any(k in key.lower() for k in NATIONAL_TEAM_KEYWORDS) for key in info)
+    return hints
+
+
+def is_useful(page_data: Any) -> bool:
+    """Whether a parsed page carries any data beyond bookkeeping fields"""
+    if isinstance(page_data, dict):
+        if page_data.get('error') or page_data.get('skipped'):
+            return False
+        return any(v for k, v in page_data.items() if k not in _META_KEYS)
+    return bool(page_data)
+
+
+def _group(hints: Dict[str, Any]) -> str:
+    national = {True: 'intl', False: 'club'}.get(hints.get('national_team'), 'any')
+    return f"{hints.get('role') or 'any'}|{national}"
+
+
+class PageApplicability:
+    """Per-player and per-group record of which page types return data"""
+
+    def __init__(self, path: str, min_observations: int = 8, min_useful_rate: float = 0.1,
+                 recheck_days: float = 30.0, explore: float = 0.05):
+        self.path = path
+        self.min_observations = min_observations
+        self.min_useful_rate = min_useful_rate
+        self.recheck = recheck_days * 86400
+        self.explore = explore
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Any]] = self._load()
+        # changes since the last load/save, merged into what other processes wrote
+        self._players_delta: Dict[str, Dict[str, Any]] = {}
+        self._groups_delta: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.stats: Dict[str, Any] = {'planned': 0, 'skipped': 0, 'reasons': {}}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                data.setdefault('players', {})
+                data.setdefault('groups', {})
+                return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable page applicability index {self.path}: {e}")
+        return {'players': {}, 'groups': {}}
+
+    def _skip_reason(self, player_id: str, page_type: str, hints: Dict[str, Any]) -> Optional[str]:
+        if page_type in ALWAYS_FETCH:
+            return None
+        seen = self._data['players'].get(player_id, {}).get(page_type)
+        if seen and seen['outcome'] == USEFUL:
+            return None
+        if seen and seen['outcome'] == EMPTY and time.time() - seen['at'] < self.recheck:
+            return 'empty last time'
+        if page_type in NATIONAL_TEAM_PAGES and hints.get('national_team') is False:
+            return 'no national team'
+        counts = self._data['groups'].get(_group(hints), {}).get(page_type)
+        if counts and counts['total'] >= self.min_observations \
+                and counts['useful'] / counts['total'] < self.min_useful_rate:
+            return f"rarely useful for {_group(hints)}"
+        return None
+
+    def plan(self, player_id: str, page_types: Iterable[str],
+             hints: Dict[str, Any]) -> Tuple[List[str], Dict[str, str]]:
+        """Split page types into (to fetch, {skipped page type: reason})"""
+        fetch: List[str] = []
+        skipped: Dict[str, str] = {}
+        for page_type in page_types:
+            reason = self._skip_reason(player_id, page_type, hints)
+            if reason and random.random() < self.explore:
+                reason = None
+            if reason:
+                skipped[page_type] = reason
+                self.stats['reasons'][reason] = self.stats['reasons'].get(reason, 0) + 1
+            else:
+                fetch.append(page_type)
+        self.stats['planned'] += len(fetch) + len(skipped)
+        self.stats['skipped'] += len(skipped)
+        return fetch, skipped
+
+    def record(self, player_id: str, page_type: str, outcome: str, hints: Dict[str, Any]) -> None:
+        """Fold one page outcome (useful / empty / missing) into the player and group records"""
+        if page_type in ALWAYS_FETCH:
+            return
+        entry = {'outcome': outcome, 'at': int(time.time())}
+        useful = int(outcome == USEFUL)
+        with self._lock:
+            self._data['players'].setdefault(player_id, {})[page_type] = entry
+            self._players_delta.setdefault(player_id, {})[page_type] = entry
+            for groups in (self._data['groups'], self._groups_delta):
+                counts = groups.setdefault(_group(hints), {}).setdefault(page_type, {'useful': 0, 'total': 0})
+                counts['total'] += 1
+                counts['useful'] += useful
+
+    def save(self) -> None:
+        """Persist this process's changes on top of what other processes wrote meanwhile"""
+        with self._lock:
+            try:
+                merged = self._load()
+                # per player and page type: the most recent outcome wins
+                for player_id, pages in self._players_delta.items():
+                    stored = merged['players'].setdefault(player_id, {})
+                    for page_type, entry in pages.items():
+                        if entry['at'] >= (stored.get(page_type) or {}).get('at', 0):
+                            stored[page_type] = entry
+                # group tallies: add this process's observations since the last save
+                for group, pages in self._groups_delta.items():
+                    stored = merged['groups'].setdefault(group, {})
+                    for page_type, delta in pages.items():
+                        counts = stored.setdefault(page_type, {'useful': 0, 'total': 0})
+                        counts['useful'] += delta['useful']
+                        counts['total'] += delta['total']
+                atomic_write_json(self.path, merged, indent=None)
+                self._data = merged
+                self._players_delta = {}
+                self._groups_delta = {}
+            except Exception as e:
+                logger.error(f"Error saving page applicability index: {e}")
+
+    def skip_rate(self) -> float:
+        return self.stats['skipped'] / self.stats['planned'] if self.stats['planned'] else 0.0
+
+    def log_summary(self) -> None:
+        logger.info(f"Page applicability: skipped {self.stats['skipped']}/{self.stats['planned']} page fetches "
+                    f"({100 * self.skip_rate():.1f}%), reasons: {self.stats['reasons']}")
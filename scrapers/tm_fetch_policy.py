@@ -0,0 +1,124 @@
+"""Retry policy for Transfermarkt page fetches.
+
+Fetch outcomes are classified before deciding what to do next:
+
+- ok         page with content
+- missing    permanent: 404/410, a "page not found" title or heading, or a
+             redirect away from the requested page type. Never retried,
+             remembered in the negative cache so later runs skip it.
+- transient  timeouts, connection errors, 408/425/429/5xx and any other
+             non-4xx status: retried with jittered exponential backoff
+- blocked    401/403 (bot protection) and every other 4xx (400, 405, 422,
+             451, ...): not retried over HTTP, the browser fallback may still
+             get through
+Only missing pages go into the negative cache.
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from .common import logger
+from .storage import atomic_write_json
+
+OK, MISSING, TRANSIENT, BLOCKED = 'ok', 'missing', 'transient', 'blocked'
+# skipped without a request: already in the negative cache
+KNOWN_MISSING = 'known_missing'
+
+PERMANENT_STATUSES = (404, 410)
+TRANSIENT_STATUSES = (408, 425, 429)
+INVALID_INDICATORS = (
+    'player not found',
+    'seite nicht gefunden',
+    'page not found',
+    'player nicht gefunden'
+)
+_HEADINGS = re.compile(r'<(title|h1)\b[^>]*>(.*?)</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r'<[^>]+>')
+
+
+def _headings(body: str) -> str:
+    """Text of the <title> and <h1> elements, lowercased"""
+    return ' '.join(' '.join(_TAGS.sub(' ', m.group(2)).split()) for m in _HEADINGS.finditer(body)).lower()
+
+
+def classify_response(status: Optional[int], body: Optional[str] = None,
+                      page_type: Optional[str] = None, redirected_to: Optional[str] = None) -> str:
+    """Outcome class of one HTTP response (`redirected_to` = final URL when redirects were followed)"""
+    if status is None:
+        return TRANSIENT
+    if status in PERMANENT_STATUSES:
+        return MISSING
+    if status == 200:
+        # only the title and headings: article text and sidebars may quote these phrases
+        headings = _headings(body or '')
+        if any(indicator in headings for indicator in INVALID_INDICATORS):
+            return MISSING
+        # Transfermarkt redirects page types a player doesn't have to another page
+        if page_type and page_type != 'linked' and redirected_to:
+            if page_type.lower() not in urlparse(redirected_to).path.lower().split('/'):
+                return MISSING
+        return OK
+    if status in TRANSIENT_STATUSES or status >= 500:
+        return TRANSIENT
+    if 400 <= status < 500:
+        return BLOCKED
+    return TRANSIENT
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 10.0) -> float:
+    """Full-jitter exponential backoff for retry `attempt` (1-based)"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class MissingPageCache:
+    """Persistent negative cache of pages known not to exist, with expiry"""
+
+    def __init__(self, path: str, ttl_days: float = 30.0):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self.hits = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable missing-page cache {self.path}: {e}")
+            return {}
+
+    @staticmethod
+    def key(player_id: str, page_type: str, url: str) -> str:
+        """(player_id, page_type) for player pages; the URL for anything else"""
+        return f"{player_id}:{page_type}" if player_id and page_type != 'linked' else url
+
+    def is_missing(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        if not entry:
+            return False
+        if time.time() - entry.get('at', 0) > self.ttl:
+            # pages can appear later (new club, first cap): look again
+            return False
+        self.hits += 1
+        return True
+
+    def add(self, key: str, reason: str) -> None:
+        with self._lock:
+            merged = self._load()
+            merged.update(self._entries)
+            merged[key] = {'reason': reason, 'at': int(time.time())}
+            self._entries = merged
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                atomic_write_json(self.path, merged, indent=None)
+            except Exception as e:
+                logger.error(f"Error saving missing-page cache: {e}")
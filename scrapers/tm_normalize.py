@@ -0,0 +1,204 @@
+"""Typed, columnar normalization of Transfermarkt tables.
+
+Parsers keep every cell as display text (`1.234'`, `€80.00m`, `Oct 25, 2023`,
+`-`). At scrape time each table is normalized once: every column gets a type
+and the cells are converted into a `columns` dict (header -> typed list)
+stored next to the raw `rows`, with the inferred `types`. The column type comes
+from the header name when it is a known one and otherwise from the cell values;
+the result is cached per header, so each header is inferred once per process.
+Generic headers (`col_3`, icon-only columns) are inferred from values every
+time.
+
+Types: int, minutes, float, percent, eur, date, text. "-" and empty cells are
+None.
+"""
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from .market_value import parse_eur
+
+_INT = re.compile(r'^[+-]?\d{1,3}(?:[.,]\d{3})*$|^[+-]?\d+$')
+_FLOAT = re.compile(r'^[+-]?\d+[.,]\d+$')
+_MINUTES = re.compile(r"^\d{1,3}(?:[.,]\d{3})*'$|^\d+'$")
+_PERCENT = re.compile(r'^[+-]?\d+(?:[.,]\d+)?\s*%$')
+_EUR = re.compile(r'^(?:€\s*)?\d+(?:[.,]\d+)?\s*(?:bn|m|k|th\.?|mio\.?|tsd\.?|mrd\.?)?\s*(?:€)?$', re.I)
+_DATE_FORMATS = ('%b %d, %Y', '%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d', '%d %b %Y')
+EMPTY = ('', '-', '--', '?', 'n/a')
+
+# header keyword -> type, first match wins (headers are lowercased)
+HEADER_RULES = [
+    (('minutes', 'min. played', 'einsatzminuten', 'minutes jouées'), 'minutes'),
+    (('market value', 'marktwert', 'valeur', 'fee', 'ablöse', 'indemnité', 'mv'), 'eur'),
+    (('date', 'datum'), 'date'),
+    (('%', 'percent', 'quote'), 'percent'),
+    (('average', 'ø', 'ppg', 'per game', 'per match'), 'float'),
+    (('season', 'saison', 'club', 'verein', 'competition', 'wettbewerb', 'injury', 'verletzung',
+      'name', 'position', 'nationality', 'left', 'joined', 'opponent', 'gegner', 'result', 'ergebnis'), 'text'),
+    (('appearances', 'apps', 'matches', 'spiele', 'goals', 'tore', 'assists', 'vorlagen', 'games', 'days',
+      'tage', 'yellow', 'red', 'own goals', 'substitut', 'points', 'punkte', 'age', 'alter', 'caps',
+      'wins', 'draws', 'losses', 'clean sheets', 'conceded', 'number', 'nummer', 'no.'), 'int'),
+]
+
+# order in which value-based inference tries types (most specific first)
+_VALUE_CHECKS = [
+    ('minutes', lambda v: bool(_MINUTES.match(v))),
+    ('percent', lambda v: bool(_PERCENT.match(v))),
+    ('eur', lambda v: '€' in v and bool(_EUR.match(v))),
+    ('date', lambda v: _to_date(v) is not None),
+    ('int', lambda v: bool(_INT.match(v))),
+    ('float', lambda v: bool(_FLOAT.match(v))),
+]
+
+
+_LEADING_INT = re.compile(r'^([+-]?\d{1,3}(?:[.,]\d{3})+|[+-]?\d+)(?![\d.,])')
+
+
+def _to_int(value: str) -> Optional[int]:
+    # "36 days", "3 (1)" keep their leading count
+    match = _LEADING_INT.match(value.strip())
+    if not match:
+        return None
+    return int(re.sub(r'[.,]', '', match.group(1)))
+
+
+def _to_minutes(value: str) -> Optional[int]:
+    return _to_int(value.rstrip("'").strip())
+
+
+def _to_float(value: str) -> Optional[float]:
+    try:
+        return float(value.strip().replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def _to_percent(value: str) -> Optional[float]:
+    return _to_float(value.replace('%', ''))
+
+
+def _to_date(value: str) -> Optional[str]:
+    value = value.strip()
+    # injuries/transfers sometimes append "(12 days)" or similar
+    value = value.split(' (', 1)[0]
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    'int': _to_int,
+    'minutes': _to_minutes,
+    'float': _to_float,
+    'percent': _to_percent,
+    'eur': parse_eur,
+    'date': _to_date,
+    'text': lambda v: v,
+}
+
+
+def _is_generic(header: str) -> bool:
+    return not header or bool(re.match(r'^col_\d+$', header))
+
+
+# keywords match at a word start ("age" must not hit "average")
+_HEADER_PATTERNS = [(re.compile('|'.join(r'(?<![a-zà-ÿ])' + re.escape(k) for k in keywords)), col_type)
+                    for keywords, col_type in HEADER_RULES]
+
+
+@lru_cache(maxsize=1024)
+def _header_rule(header: str) -> Optional[str]:
+    lower = header.lower()
+    for pattern, col_type in _HEADER_PATTERNS:
+        if pattern.search(lower):
+            return col_type
+    return None
+
+
+_value_cache: Dict[str, str] = {}
+
+
+def infer_from_values(values: List[str], min_share: float = 0.8) -> str:
+    """Most specific type at least `min_share` of the non-empty cells parse as"""
+    sample = [v.strip() for v in values if v and v.strip().lower() not in EMPTY][:25]
+    if not sample:
+        return 'text'
+    for col_type, check in _VALUE_CHECKS:
+        if sum(1 for v in sample if check(v)) >= min_share * len(sample):
+            return col_type
+    return 'text'
+
+
+def column_type(header: str, values: List[str]) -> str:
+    """Type of a column: header rule, cached per-header inference, or value inference"""
+    if not _is_generic(header):
+        rule = _header_rule(header)
+        if rule:
+            return rule
+        cached = _value_cache.get(header)
+        if cached:
+            return cached
+    inferred = infer_from_values(values)
+    if not _is_generic(header) and any(v and v.strip().lower() not in EMPTY for v in values):
+        _value_cache[header] = inferred
+    return inferred
+
+
+def convert(value: Any, col_type: str) -> Any:
+    if not isinstance(value, str):
+        return value
+    if value.strip().lower() in EMPTY:
+        return None
+    try:
+        return CONVERTERS[col_type](value)
+    except Exception:
+        return None
+
+
+def normalize_rows(rows: List[Dict[str, Any]], headers: Optional[List[str]] = None) -> Dict[str, Any]:
+    """{'columns': {header: typed values}, 'types': {header: type}} for a list of row dicts"""
+    if not headers:
+        headers = list(dict.fromkeys(k for row in rows if isinstance(row, dict) for k in row))
+    columns: Dict[str, List[Any]] = {}
+    types: Dict[str, str] = {}
+    for header in headers:
+        raw = [row.get(header) if isinstance(row, dict) else None for row in rows]
+        col_type = column_type(header, [v for v in raw if isinstance(v, str)])
+        types[header] = col_type
+        columns[header] = [convert(v, col_type) for v in raw]
+    return {'columns': columns, 'types': types}
+
+
+def _is_row_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(r, dict) for r in value) \
+        and all(isinstance(v, str) for r in value for v in r.values())
+
+
+def normalize_page(page_data: Any) -> Any:
+    """Add typed columnar tables next to the raw rows of a parsed page (in place).
+
+    Tables with `headers`/`rows` get `columns` and `types`; other lists of row
+    dicts (or lists of such tables) are normalized into `typed[<key>]`.
+    """
+    if not isinstance(page_data, dict):
+        return page_data
+    rows = page_data.get('rows')
+    if _is_row_list(rows):
+        page_data.update(normalize_rows(rows, page_data.get('headers')))
+    typed: Dict[str, Any] = {}
+    for key, value in list(page_data.items()):
+        if key in ('rows', 'found_urls', 'columns', 'types', 'typed', 'series'):
+            continue
+        if _is_row_list(value):
+            typed[key] = normalize_rows(value)
+        elif isinstance(value, list) and value and all(_is_row_list(t) for t in value):
+            typed[key] = [normalize_rows(t) for t in value]
+        elif isinstance(value, dict):
+            normalize_page(value)
+    if typed:
+        page_data['typed'] = typed
+    return page_data
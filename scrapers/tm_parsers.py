@@ -0,0 +1,120 @@
+"""Transfermarkt parser registry.
+
+One parser per canonical page type: the Transfermarkt URL segment (`profil`,
+`verletzungen`, `marktwertverlauf`, ...). English names used by the CLI and
+in saved file names (`profile`, `injuries`, `market_value`, ...) are aliases.
+The scraper, `transfermarkt_parser` (CLI and batch reprocessing of saved
+pages) and the built-in `parse_*_page` methods all go through `parse_page`, so
+every page is parsed exactly once, by the parser registered for its type.
+Pages of unknown type get the generic all-tables parser. Per-type counters
+(pages, seconds, errors) are kept for the run summary.
+"""
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .common import logger
+from .tm_plans import PLANS
+
+# canonical page type -> (plan, aliases)
+PAGE_PARSERS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'profil': ('profile', ('profile', 'profiles')),
+    'verletzungen': ('injuries', ('injuries',)),
+    'marktwertverlauf': ('market_value', ('market_value', 'marktwert')),
+    'transfers': ('transfers', ()),
+    'bilanz': ('balance', ('balance',)),
+    'erfolge': ('achievements', ('achievements',)),
+    'rueckennummern': ('kit_numbers', ('kit_numbers', 'ruecken')),
+    'news': ('news', ()),
+    'leistungsdaten': ('performance', ('performance',)),
+    'leistungsdatendetails': ('performance', ('performance_details',)),
+    'detaillierteleistungsdaten': ('performance', ('detailed_performance',)),
+    'leistungsdatenverein': ('performance', ('club_performance',)),
+    'leistungsdatentrainer': ('performance', ('coach_performance',)),
+    'elfmetertore': ('performance', ('penalty_goals', 'penalty')),
+    'meistetore': ('performance', ('top_goals',)),
+    'meistetorbeteiligungen': ('performance', ('goal_involvements',)),
+    'nationalmannschaft': ('performance', ('national_team',)),
+    'debuets': ('performance', ('debuts',)),
+    'siege': ('performance', ('wins',)),
+    'niederlagen': ('performance', ('losses',)),
+}
+GENERIC = 'generic'
+_NAME_SEPARATORS = re.compile(r'[_.\-]+')
+
+
+class ParserRegistry:
+    """Canonical page type -> parser, with per-type timing counters"""
+
+    def __init__(self):
+        self._parsers: Dict[str, Callable[[Any, Any], Any]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def register(self, page_type: str, parser: Callable[[Any, Any], Any], aliases: Iterable[str] = ()) -> None:
+        """parser(page, doc): page is HTML or a parsed tree, doc the tree when already parsed"""
+        self._parsers[page_type] = parser
+        self._aliases[page_type] = page_type
+        for alias in aliases:
+            self._aliases[alias] = page_type
+
+    def canonical(self, page_type: Optional[str]) -> Optional[str]:
+        """Canonical page type for a page type or alias, or None when unknown"""
+        if not page_type:
+            return None
+        return self._aliases.get(page_type.lower())
+
+    def detect(self, path: str) -> Optional[str]:
+        """Canonical page type from a saved page's file name (e.g. `lewandowski_verletzungen.html`)"""
+        # whole tokens only: 'x_newsletter.html' is not a news page
+        tokens = [t for t in _NAME_SEPARATORS.split(os.path.basename(path).lower()) if t]
+        # multi-token aliases first: 'performance_details' before 'performance'
+        for alias in sorted(self._aliases, key=lambda a: (a.count('_'), len(a)), reverse=True):
+            words = alias.split('_')
+            if any(tokens[i:i + len(words)] == words for i in range(len(tokens) - len(words) + 1)):
+                return self._aliases[alias]
+        return None
+
+    def parse(self, page_type: Optional[str], page: Any, doc: Any = None) -> Any:
+        """Parse a page with the parser registered for its type (generic tables when unknown)"""
+        key = self.canonical(page_type) or GENERIC
+        parser = self._parsers.get(key) or self._parsers[GENERIC]
+        started = time.perf_counter()
+        failed = False
+        try:
+            return parser(page, doc)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                counter = self.stats.setdefault(key, {'pages': 0, 'seconds': 0.0, 'errors': 0})
+                counter['pages'] += 1
+                counter['seconds'] += elapsed
+                if failed:
+                    counter['errors'] += 1
+
+    def log_summary(self) -> None:
+        if not self.stats:
+            return
+        total = sum(c['seconds'] for c in self.stats.values())
+        pages = sum(c['pages'] for c in self.stats.values())
+        parts = ', '.join(f"{pt} {c['pages']}x {c['seconds'] * 1000 / c['pages']:.1f}ms"
+                          + (f" ({c['errors']} errors)" if c['errors'] else '')
+                          for pt, c in sorted(self.stats.items(), key=lambda item: -item[1]['seconds']))
+        logger.info(f"Parsing: {pages} pages in {total * 1000:.0f}ms ({parts})")
+
+
+REGISTRY = ParserRegistry()
+for _page_type, (_plan, _aliases) in PAGE_PARSERS.items():
+    REGISTRY.register(_page_type, PLANS[_plan].run, _aliases)
+REGISTRY.register(GENERIC, PLANS['performance'].run, ('table',))
+
+
+def parse_page(page_type: Optional[str], page: Any, doc: Any = None) -> Any:
+    """Parse a Transfermarkt page (HTML or lxml tree) with the shared registry"""
+    return REGISTRY.parse(page_type, page, doc)
@@ -0,0 +1,426 @@
+"""Compiled extraction plans for Transfermarkt pages.
+
+Each page type has a declarative plan: which tables, columns, boxes and
+header fields to pull, written as CSS selectors. Selectors are translated to
+XPath with cssselect and compiled with lxml once per process; a plan then runs
+on a page parsed once with lxml, instead of repeated BeautifulSoup
+`find_all('table')` / `find('thead')` / per-row `find_all(['td', 'th'])` walks.
+Both parser layers (`transfermarkt_parser` and the built-in
+`TransderMarkt_Scraper.parse_*_page` methods) run these plans.
+
+Plans accept an HTML string or an already parsed lxml tree, so a page that is
+also indexed for player links is parsed only once. Selectors starting with
+`descendant::` are XPath (see `class_contains`, which matches class names
+case-insensitively; CSS `[class*=]` cannot).
+"""
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from .common import _lazy, logger
+from .market_value import MarketValueSeries, extract_market_value_series
+from .text_extract import parse_html
+
+Selectors = Union[str, Sequence[str]]
+
+
+@lru_cache(maxsize=256)
+def compile_css(css: str) -> Any:
+    """CSS selector (or `descendant::` XPath) -> compiled lxml XPath, relative to the element it is run on (cached)"""
+    if css.startswith('descendant::'):
+        return _lazy('lxml.etree').XPath(css)
+    translator = _lazy('cssselect').HTMLTranslator()
+    return _lazy('lxml.etree').XPath(translator.css_to_xpath(css, prefix='descendant::'))
+
+
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def class_contains(tag: str, *words: str) -> str:
+    """XPath selector for `tag` elements whose class contains any of `words`, ignoring case"""
+    lowered = f"translate(@class, '{_UPPER}', '{_UPPER.lower()}')"
+    return f"descendant::{tag}[{' or '.join(f'contains({lowered}, {word.lower()!r})' for word in words)}]"
+
+
+@lru_cache(maxsize=64)
+def compile_xpath(expr: str) -> Any:
+    return _lazy('lxml.etree').XPath(expr)
+
+
+def select(el: Any, css: str) -> List[Any]:
+    return compile_css(css)(el)
+
+
+def select_first(el: Any, selectors: Selectors) -> Any:
+    """First match of the first selector that matches anything (selectors tried in order)"""
+    for css in ([selectors] if isinstance(selectors, str) else selectors):
+        found = compile_css(css)(el)
+        if found:
+            return found[0]
+    return None
+
+
+def text(el: Any) -> str:
+    """Whitespace-normalized text of an element (like get_text(' ', strip=True))"""
+    if el is None:
+        return ''
+    return ' '.join(' '.join(el.itertext()).split())
+
+
+def tree(page: Any) -> Any:
+    """Parsed lxml tree of an HTML string (trees are passed through)"""
+    return parse_html(page) if isinstance(page, (str, bytes)) else page
+
+
+def _header_matches(header: str, keywords: Sequence[str]) -> bool:
+    words = re.findall(r'\w+', header.lower())
+    return any(k in words if ' ' not in k else k in header.lower() for k in keywords)
+
+
+_LAYOUT_WARNED: Set[Tuple[str, ...]] = set()
+
+
+class Table:
+    """Rows of one or more tables.
+
+    `columns` maps cells by position (None skips a cell); with `match`
+    ({column: header keywords}) each column is instead taken from the cells
+    under the header that matches, so added or removed columns do not shift
+    values (positions are the fallback for tables without recognizable
+    headers). Without `columns` rows are keyed by the `thead th` headers
+    (`col_N` for empty or missing ones). `row` builds a row from its cell
+    elements instead. `pick` is the table index, or None for every table.
+    """
+
+    def __init__(self, tables: Selectors = ('table.items', 'table'), pick: Optional[int] = 0,
+                 cells: Sequence[str] = ('td',), columns: Optional[Sequence[Optional[str]]] = None,
+                 min_cells: int = 1, row: Optional[Callable[[List[Any]], Any]] = None,
+                 match: Optional[Dict[str, Sequence[str]]] = None):
+        self.tables = (tables,) if isinstance(tables, str) else tuple(tables)
+        self.pick = pick
+        # child cell tags, so cells of tables nested in a cell are not mixed in
+        self.cells = './' + ' | ./'.join(cells)
+        self.columns = columns
+        self.min_cells = min_cells
+        self.row = row
+        self.match = match
+
+    def find_tables(self, el: Any) -> List[Any]:
+        for css in self.tables:
+            found = select(el, css)
+            if found:
+                return found
+        return []
+
+    @staticmethod
+    def headers(table: Any) -> List[str]:
+        headers: List[str] = []
+        for th in select(table, 'thead th'):
+            headers.append(text(th) or f'col_{len(headers) + 1}')
+        return headers
+
+    def positions(self, table: Any) -> List[Tuple[str, int, int]]:
+        """(column, first cell, cell count) per named column"""
+        names = [name for name in self.columns or () if name]
+        positional = [(name, i, 1) for i, name in enumerate(self.columns or ()) if name]
+        if not self.match:
+            return positional
+        spans: List[Tuple[str, int, int]] = []
+        start = 0
+        for th in select(table, 'thead th'):
+            width = int(th.get('colspan') or 1) if (th.get('colspan') or '1').isdigit() else 1
+            spans.append((text(th), start, width))
+            start += width
+        found: Dict[str, Tuple[int, int]] = {}
+        used: Set[int] = set()
+        for name in names:
+            for j, (header, first, width) in enumerate(spans):
+                if j not in used and _header_matches(header, self.match.get(name, (name,))):
+                    found[name] = (first, width)
+                    used.add(j)
+                    break
+        missing = tuple(name for name in names if name not in found)
+        if missing and spans and missing not in _LAYOUT_WARNED:
+            _LAYOUT_WARNED.add(missing)
+            logger.warning(f"Table layout changed: no header for {', '.join(missing)} "
+                           f"(headers: {', '.join(h for h, _, _ in spans)})")
+        if not found:
+            # no thead, or headers in an unknown language
+            return positional
+        # columns without a header stay in the row, empty
+        return [(name,) + found.get(name, (0, 0)) for name in names]
+
+    @staticmethod
+    def body_rows(table: Any) -> List[Any]:
+        # rows of this table only, not of tables nested in its cells
+        return compile_xpath('./tbody/tr')(table) or compile_xpath('./tr')(table)
+
+    def rows(self, table: Any, headers: Optional[List[str]] = None) -> List[Any]:
+        out: List[Any] = []
+        positions = self.positions(table) if self.columns is not None else []
+        for tr in self.body_rows(table):
+            cells = compile_xpath(self.cells)(tr)
+            if len(cells) < self.min_cells or not cells:
+                continue
+            if self.row:
+                item = self.row(cells)
+                if item:
+                    out.append(item)
+                continue
+            values = [text(c) for c in cells]
+            if self.columns is not None:
+                # a header spanning several cells (club crest + name) joins their texts
+                out.append({name: ' '.join(v for v in values[first:first + width] if v)
+                            for name, first, width in positions})
+            else:
+                headers = headers or []
+                out.append({headers[i] if i < len(headers) else f'col_{i + 1}': v for i, v in enumerate(values)})
+        return out
+
+    def run(self, el: Any) -> Any:
+        tables = self.find_tables(el)
+        if self.pick is not None:
+            if len(tables) <= self.pick:
+                return []
+            table = tables[self.pick]
+            return self.rows(table, None if self.columns or self.row else self.headers(table))
+        data: Dict[str, Any] = {}
+        for i, table in enumerate(tables, start=1):
+            headers = self.headers(table)
+            rows = self.rows(table, headers)
+            if rows:
+                data[f'table_{i}'] = {'headers': headers, 'rows': rows}
+        return data
+
+
+class Keyed(Table):
+    """Table rows as {first cell: {column: value}} (e.g. per-season totals)"""
+
+    def run(self, el: Any) -> Dict[str, Any]:
+        tables = self.find_tables(el)
+        out: Dict[str, Any] = {}
+        if len(tables) <= (self.pick or 0):
+            return out
+        for tr in self.body_rows(tables[self.pick or 0]):
+            values = [text(c) for c in compile_xpath(self.cells)(tr)]
+            if len(values) < self.min_cells or not values:
+                continue
+            out[values[0]] = {name: values[i + 1] if i + 1 < len(values) else ''
+                              for i, name in enumerate(self.columns or ())}
+        return out
+
+
+class Fields:
+    """Header fields: {name: selectors} (first match wins), with optional cleaners"""
+
+    def __init__(self, fields: Dict[str, Selectors], clean: Optional[Dict[str, Callable[[str], str]]] = None,
+                 pairs: Optional[Dict[str, str]] = None, labels: Optional[Dict[str, Tuple[str, Sequence[str]]]] = None):
+        self.fields = fields
+        self.clean = clean or {}
+        # name -> selector of "Label: value" items, collected into a dict
+        self.pairs = pairs or {}
+        # name -> (selector, label keywords): value of the first item whose text has a keyword
+        self.labels = labels or {}
+
+    def run(self, el: Any) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        for name, selectors in self.fields.items():
+            found = select_first(el, selectors)
+            if found is None:
+                continue
+            value = text(found)
+            if name in self.clean:
+                value = self.clean[name](value)
+            if value:
+                data[name] = value
+        for name, css in self.pairs.items():
+            info: Dict[str, str] = {}
+            for item in select(el, css):
+                parts = [p for p in (' '.join(s.split()) for s in item.itertext()) if p]
+                if not parts:
+                    continue
+                label, _, rest = parts[0].partition(':')
+                value = ' '.join(([rest.strip()] if rest.strip() else []) + parts[1:]).strip()
+                if label and (rest or len(parts) > 1) and value:
+                    info[label.strip()] = value
+            if info:
+                data[name] = info
+        for name, (css, keywords) in self.labels.items():
+            for item in select(el, css):
+                value = text(item)
+                if any(k in value for k in keywords):
+                    data[name] = value.split(':', 1)[-1].strip()
+                    break
+        return data
+
+
+class Boxes:
+    """Repeated containers, one item per box: {field: selectors}, `link` is the first anchor's href"""
+
+    def __init__(self, boxes: str, fields: Dict[str, Selectors], required: str = 'title',
+                 link: Optional[str] = None):
+        self.boxes = boxes
+        self.fields = fields
+        self.required = required
+        self.link = link
+
+    def run(self, el: Any) -> List[Dict[str, str]]:
+        items = []
+        for box in select(el, self.boxes):
+            item = {name: text(select_first(box, selectors)) for name, selectors in self.fields.items()}
+            if not item.get(self.required):
+                continue
+            if self.link:
+                a = select_first(box, self.link)
+                item['link'] = (a.get('href') or '') if a is not None else ''
+            items.append(item)
+        return items
+
+
+class TitledTables:
+    """{box title: rows of the box's table} for every box with a title"""
+
+    def __init__(self, boxes: str, title: Selectors, table: Table):
+        self.boxes = boxes
+        self.title = title
+        self.table = table
+
+    def run(self, el: Any) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for box in select(el, self.boxes):
+            title = text(select_first(box, self.title))
+            if not title:
+                continue
+            tables = self.table.find_tables(box)
+            out[title] = self.table.rows(tables[0]) if tables else []
+        return out
+
+
+class Plan:
+    """A page type's plan: one step (its result is the page data) or {key: step}"""
+
+    def __init__(self, steps: Any, fallback: Optional['Plan'] = None,
+                 finish: Optional[Callable[[Any, Any], Any]] = None):
+        self.steps = steps
+        self.fallback = fallback
+        # finish(result, page): post-processing that needs the raw page (e.g. chart scripts)
+        self.finish = finish
+
+    def run(self, page: Any, doc: Any = None) -> Any:
+        """Result for an HTML string or parsed tree (`doc`: the page's tree when already parsed)"""
+        doc = tree(page if doc is None else doc)
+        if isinstance(self.steps, dict):
+            result: Any = {key: step.run(doc) for key, step in self.steps.items()}
+        else:
+            result = self.steps.run(doc)
+        if self.finish:
+            result = self.finish(result, page)
+        if not result and self.fallback:
+            return self.fallback.run(page, doc)
+        return result
+
+
+def _clean_name(value: str) -> str:
+    # "#9 Robert Lewandowski"; <title> fallback "Robert Lewandowski - Player profile | Transfermarkt"
+    value = re.sub(r'^#\d+\s*', '', value)
+    return value.split(' - ')[0].split(' | ')[0].strip()
+
+
+_CLUB_LINK = re.compile(r'/startseite/verein/(\d+)')
+
+
+def _achievement_row(cells: List[Any]) -> Optional[Dict[str, Any]]:
+    season = text(cells[0])
+    target = cells[2] if len(cells) > 2 else cells[1] if len(cells) > 1 else None
+    club, club_id = '', None
+    if target is not None:
+        a = select_first(target, 'a')
+        club = text(a if a is not None else target)
+        match = _CLUB_LINK.search(a.get('href') or '') if a is not None else None
+        club_id = match.group(1) if match else None
+    if not season and not club:
+        return None
+    return {'season': season, 'club': club, 'club_id': club_id}
+
+
+def _market_value_finish(result: Dict[str, Any], page: Any) -> Dict[str, Any]:
+    # the chart is a script payload, found by substring search on the raw text
+    if isinstance(page, str):
+        raw = page
+    else:
+        raw = '\n'.join(script.text or '' for script in page.iter('script'))
+    series = extract_market_value_series(raw)
+    if not series and result['history']:
+        series = MarketValueSeries.from_points(result['history'])
+    if series:
+        result['series'] = series.to_dict()
+    return result
+
+
+# column -> header keywords (English, German, French pages); whole words, or phrases
+INJURY_HEADERS = {
+    'season': ('season', 'saison'),
+    'injury_type': ('injury', 'verletzung', 'blessure'),
+    'from_date': ('from', 'von', 'depuis'),
+    'until_date': ('until', 'bis', 'jusqu'),
+    'days_out': ('days', 'tage', 'jours'),
+    'games_missed': ('games', 'spiele', 'matchs', 'missed'),
+}
+TRANSFER_HEADERS = {
+    'season': ('season', 'saison'),
+    'date': ('date', 'datum'),
+    'from_club': ('left', 'from', 'abgebender', 'quitté'),
+    'to_club': ('joined', 'to', 'aufnehmender', 'rejoint'),
+    'market_value': ('mv', 'mw', 'vm', 'market value', 'marktwert', 'valeur'),
+    'fee': ('fee', 'ablöse', 'indemnité'),
+}
+
+TABLE = Plan(Table())
+PERFORMANCE = Plan(Table(pick=None))
+
+PLANS: Dict[str, Plan] = {
+    'profile': Plan(Fields(
+        {
+            'name': ('h1.data-header__headline-wrapper', 'h1', 'title'),
+            'current_club': ('span.data-header__club a', 'span.data-header__club'),
+            'shirt_number': 'span.data-header__shirt-number',
+            'current_market_value': 'a.data-header__market-value-wrapper',
+        },
+        clean={'name': _clean_name},
+        pairs={'basic_info': 'ul.data-header__items li'},
+        labels={'position': ('li.data-header__label', ('Position',)),
+                'preferred_foot': ('li.data-header__label', ('Pied', 'Foot'))},
+    )),
+    'injuries': Plan({
+        'injuries_list': Table(columns=('season', 'injury_type', 'from_date', 'until_date', 'days_out', 'games_missed'),
+                               match=INJURY_HEADERS),
+        'season_totals': Keyed(pick=1, columns=('total_days', 'injuries_count', 'games_missed')),
+    }),
+    'transfers': Plan(Table(columns=('season', 'date', 'from_club', 'to_club', 'market_value', 'fee'),
+                            match=TRANSFER_HEADERS)),
+    'balance': Plan(Table(columns=(None, 'club', 'appearances', 'wins', 'draws', 'losses', 'goals_conceded',
+                                   'clean_sheets', 'yellow_cards', 'yellow_red', 'red_cards'), min_cells=2)),
+    'achievements': Plan(
+        TitledTables('div.box', ('h2.content-box-headline', 'div.content-box-headline', 'h2', 'th'),
+                     Table(tables=('table.auflistung', 'table'), row=_achievement_row)),
+        fallback=PERFORMANCE,
+    ),
+    'kit_numbers': Plan(Table(tables='table', columns=('season', 'club', 'number'), cells=('td', 'th'))),
+    'market_value': Plan({'history': Table(columns=('date', 'market_value', 'club'), min_cells=2)},
+                         finish=_market_value_finish),
+    'news': Plan(
+        Boxes(class_contains('div', 'news', 'box', 'article'),
+              {'title': ('a', 'h2', 'h3'),
+               'date': class_contains('span', 'date', 'zeit', 'datum'),
+               'excerpt': 'p'},
+              link='a'),
+        fallback=TABLE,
+    ),
+    'performance': PERFORMANCE,
+    'table': TABLE,
+}
+
+
+def run_plan(name: str, page: Any, doc: Any = None) -> Any:
+    """Run a named plan on an HTML string or parsed tree"""
+    return PLANS[name].run(page, doc)
@@ -0,0 +1,143 @@
+"""Incremental refresh of stored Transfermarkt player documents.
+
+Every page type has a staleness window: market value, injuries and news move
+weekly or faster, achievements, debuts and kit numbers almost never. The
+planner reads the stored `transfermarkt_data/data/players/{slug}_{id}.json`,
+returns only the page types whose last successful fetch is older than their
+window (or that never succeeded), and merges the freshly scraped pages back
+into the stored document. Fetch times are kept per page in `page_fetched_at`.
+"""
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from .common import logger
+
+# page type -> days before it is fetched again
+STALENESS_DAYS: Dict[str, float] = {
+    'news': 1,
+    'profil': 3,
+    'verletzungen': 3,
+    'leistungsdaten': 3,
+    'marktwertverlauf': 7,
+    'leistungsdatendetails': 7,
+    'detaillierteleistungsdaten': 7,
+    'siege': 7,
+    'niederlagen': 7,
+    'transfers': 14,
+    'bilanz': 14,
+    'leistungsdatenverein': 14,
+    'nationalmannschaft': 14,
+    'elfmetertore': 14,
+    'meistetore': 14,
+    'meistetorbeteiligungen': 14,
+    'rueckennummern': 90,
+    'erfolge': 90,
+    'debuets': 180,
+    'leistungsdatentrainer': 180,
+}
+DEFAULT_STALENESS_DAYS = 7.0
+
+# errors that are a real answer about the page; any other error (failed fetch,
+# parser exception) keeps the stored copy and is retried next run
+PERMANENT_ERRORS = ('Page does not exist', 'No data extracted')
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.rstrip('Z'))
+    except ValueError:
+        return None
+
+
+def _is_transient(page: Any) -> bool:
+    if not isinstance(page, dict):
+        return False
+    error = page.get('error')
+    return bool(error) and error not in PERMANENT_ERRORS
+
+
+class RefreshPlanner:
+    """Decides which pages of a stored player document are stale and merges refreshed pages"""
+
+    def __init__(self, staleness_days: Optional[Dict[str, float]] = None):
+        self.staleness_days = dict(STALENESS_DAYS)
+        self.staleness_days.update(staleness_days or {})
+        self.stats = {'players': 0, 'fresh_players': 0, 'pages_due': 0, 'pages_fresh': 0}
+
+    def load(self, path: str) -> Optional[Dict[str, Any]]:
+        """Stored player document, or None when there is none (or it is unreadable)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+            return doc if isinstance(doc, dict) else None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable player document {path}: {e}")
+            return None
+
+    def stale_pages(self, doc: Optional[Dict[str, Any]], page_types: Iterable[str],
+                    now: Optional[datetime] = None) -> List[str]:
+        """Page types to fetch again: never fetched, failed transiently, or older than their window"""
+        page_types = list(page_types)
+        self.stats['players'] += 1
+        if not doc:
+            self.stats['pages_due'] += len(page_types)
+            return page_types
+        now = now or datetime.utcnow()
+        pages = doc.get('pages') or {}
+        fetched_at = doc.get('page_fetched_at') or {}
+        # documents written before per-page times: the whole document is as old as scraped_at
+        fallback = doc.get('scraped_at') if not fetched_at else None
+        stale = []
+        for page_type in page_types:
+            page = pages.get(page_type)
+            when = _parse_time(fetched_at.get(page_type) or fallback)
+            max_age = timedelta(days=self.staleness_days.get(page_type, DEFAULT_STALENESS_DAYS))
+            if page is None or when is None or _is_transient(page) or now - when >= max_age:
+                stale.append(page_type)
+        self.stats['pages_due'] += len(stale)
+        self.stats['pages_fresh'] += len(page_types) - len(stale)
+        if not stale:
+            self.stats['fresh_players'] += 1
+        return stale
+
+    def merge(self, doc: Optional[Dict[str, Any]], fresh: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold a partial scrape into the stored document (transient failures keep the stored page)"""
+        if not doc:
+            merged = dict(fresh)
+            merged['page_fetched_at'] = {pt: fresh['scraped_at'] for pt, page in fresh.get('pages', {}).items()
+                                         if not _is_transient(page)}
+            return merged
+        merged = dict(doc)
+        pages = dict(doc.get('pages') or {})
+        fetched_at = dict(doc.get('page_fetched_at') or {})
+        if not fetched_at and doc.get('scraped_at'):
+            fetched_at = {pt: doc['scraped_at'] for pt in pages}
+        for page_type, page in (fresh.get('pages') or {}).items():
+            if _is_transient(page) and page_type in pages:
+                continue
+            if isinstance(page, dict) and page.get('skipped') and page_type in pages \
+                    and not (isinstance(pages[page_type], dict) and pages[page_type].get('skipped')):
+                # a plan that skips the page doesn't invalidate data we already have
+                fetched_at[page_type] = fresh['scraped_at']
+                continue
+            pages[page_type] = page
+            if not _is_transient(page):
+                fetched_at[page_type] = fresh['scraped_at']
+        merged['pages'] = pages
+        merged['page_fetched_at'] = fetched_at
+        merged['scraped_at'] = fresh['scraped_at']
+        for key in ('player_id', 'slug', 'base_url'):
+            merged[key] = fresh.get(key, merged.get(key))
+        if fresh.get('name') and fresh['name'] != 'unknown':
+            merged['name'] = fresh['name']
+        return merged
+
+    def log_summary(self) -> None:
+        logger.info(f"Incremental refresh: {self.stats['pages_due']} pages due, {self.stats['pages_fresh']} still fresh, "
+                    f"{self.stats['fresh_players']}/{self.stats['players']} players fully up to date")
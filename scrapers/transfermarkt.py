@@ -0,0 +1,577 @@
+"""Transfermarkt player scraper."""
+import os
+import re
+import time
+from urllib.parse import urlparse
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from .common import PLAYWRIGHT_AVAILABLE, _green, _lazy, _soup, logger, report_backends
+from .config import Config
+from .driver import setup_driver
+from .links import canonicalize_url, extract_links
+from .market_value import GRAPH_API_URL, extract_market_value_series
+from .player_index import shared_index
+from .player_store import PlayerStore
+from .ratelimit import shared_limiter
+from .readiness import shared_policy
+from .render_profile import DEFAULT_PROFILE, apply_to_playwright, load_stats
+from .text_extract import parse_html
+from .tm_applicability import EMPTY, USEFUL, MISSING as PAGE_MISSING, PageApplicability, is_useful, profile_hints
+from .tm_fetch_policy import KNOWN_MISSING, MISSING, OK, TRANSIENT, MissingPageCache, backoff_delay, classify_response
+from .tm_normalize import normalize_page
+from .tm_parsers import REGISTRY as PARSERS, parse_page
+from .tm_refresh import RefreshPlanner
+
+
+class TransderMarkt_Scraper:
+    """Scrapes Transfermarkt data for players"""
+    
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+    }
+    
+    PAGE_TYPES = {
+        'profil': 'profiles',
+        'verletzungen': 'injuries',
+        'leistungsdaten': 'performance',
+        'leistungsdatendetails': 'performance_details',
+        'detaillierteleistungsdaten': 'detailed_performance',
+        'leistungsdatenverein': 'club_performance',
+        'leistungsdatentrainer': 'coach_performance',
+        'bilanz': 'balance',
+        'elfmetertore': 'penalty_goals',
+        'marktwertverlauf': 'market_value',
+        'transfers': 'transfers',
+        'nationalmannschaft': 'national_team',
+        'news': 'news',
+        'erfolge': 'achievements',
+        'debuets': 'debuts',
+        'siege': 'wins',
+        'niederlagen': 'losses',
+        'meistetore': 'top_goals',
+        'meistetorbeteiligungen': 'goal_involvements',
+        'rueckennummern': 'kit_numbers'
+    }
+    
+    def __init__(self, use_playwright: bool = True, use_selenium: bool = True, delay: float = 1.0,
+                 follow_links: bool = False, follow_patterns: Optional[List[str]] = None, max_follow_links: int = 20,
+                 render_profile: str = DEFAULT_PROFILE, incremental: bool = True):
+        report_backends()
+        self.conf = Config()
+        # What Playwright/Selenium fallbacks may download (see scrapers.render_profile)
+        self.render_profile = render_profile
+        self.use_playwright = use_playwright and PLAYWRIGHT_AVAILABLE
+        self.use_selenium = use_selenium
+        self.delay = delay
+        # Shared per-host token buckets; `delay` is the initial spacing for Transfermarkt
+        self.rate_limiter = shared_limiter()
+        if delay and delay > 0:
+            for host in ('transfermarkt.com', 'transfermarkt.fr', 'transfermarkt.de'):
+                self.rate_limiter.configure(host, 1.0 / delay)
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+
+        # Link-following options
+        self.follow_links = follow_links
+        self.follow_patterns = follow_patterns or []
+        self.max_follow_links = max_follow_links
+
+        # Setup directories
+        self.base_directory = os.path.join(os.getcwd(), "transfermarkt_data")
+        self.data_directory = os.path.join(self.base_directory, "data")
+        self.player_data_directory = os.path.join(self.data_directory, "players")
+        # We no longer store HTML pages on disk; parsed data will be saved as JSON per player
+        self.player_html_directory = os.path.join(self.data_directory, "html")  # kept for compatibility but unused
+        # Waits for page readiness after browser navigation instead of a fixed sleep
+        self.readiness = shared_policy()
+
+        for folder in [self.base_directory, self.data_directory, self.player_data_directory]:
+            os.makedirs(folder, exist_ok=True)
+
+        # (player_id, page_type) pairs that 404 / redirect away, skipped on later runs
+        self.missing_pages = MissingPageCache(os.path.join(self.data_directory, "missing_pages.json"))
+        self.last_fetch_outcome = None
+        # Which page types return data, per player and per role group
+        self.applicability = PageApplicability(os.path.join(self.data_directory, "page_applicability.json"))
+        # Re-fetch only stale pages of players already on disk and merge them in
+        self.incremental = incremental
+        self.refresh = RefreshPlanner()
+        # Player documents shared by all match processes, with per-player scrape locks
+        self.store = PlayerStore(self.player_data_directory)
+        # Name -> Transfermarkt ID index, fed from every scraped page
+        self.player_index = shared_index()
+
+    def _normalize_and_filter_link(self, href: str, base_url: str) -> Optional[str]:
+        """Canonical absolute URL for an href, if it is a Transfermarkt page worth following."""
+        full = canonicalize_url(href, base_url or 'https://www.transfermarkt.com/')
+        return full if full and self._follow_allowed(full) else None
+
+    def _follow_allowed(self, url: str) -> bool:
+        """Whether a canonical URL is a Transfermarkt page worth following (not navigation noise)"""
+        parsed = urlparse(url)
+        # only follow transfermarkt domain by default
+        if 'transfermarkt.' not in parsed.netloc:
+            return False
+
+        # allow if explicit follow_patterns match
+        patterns = [p.lower() for p in (getattr(self, 'follow_patterns', []) or [])]
+        if patterns and any(pat in url.lower() for pat in patterns):
+            return True
+
+        # avoid large navigation sections by simple heuristics (keep statistik out of blanket exclusion)
+        lower = parsed.path.lower()
+        return not any(prefix in lower for prefix in ['/navigation', '/detailsuche', '/aktuell', '/rumour-mill', '/betting', '/intern'])
+
+    def parse_generic_page(self, html: str, url: str) -> Dict[str, Any]:
+        """Basic generic parser for followed linked pages (title, h1, paragraphs, small tables)."""
+        soup = _soup(html)
+        try:
+            # remove scripts/styles/navigation
+            for el in soup.find_all(['script', 'style', 'nav', 'footer', 'header']):
+                el.decompose()
+
+            title = soup.title.string.strip() if soup.title and soup.title.string else ''
+            h1s = [h.get_text(' ', strip=True) for h in soup.find_all('h1')][:3]
+            paragraphs = [p.get_text(' ', strip=True) for p in soup.find_all('p')][:3]
+
+            tables = []
+            for table in soup.find_all('table')[:3]:
+                rows = []
+                for tr in table.find_all('tr')[:20]:
+                    cols = [td.get_text(' ', strip=True) for td in tr.find_all(['td', 'th'])]
+                    if cols:
+                        rows.append(cols)
+                if rows:
+                    tables.append(rows)
+
+            return {
+                'url': url,
+                'title': title,
+                'h1': h1s,
+                'paragraphs': paragraphs,
+                'tables': tables
+            }
+        except Exception as e:
+            logger.debug(f"Generic parse error for {url}: {e}")
+            return {'url': url, 'error': str(e)}
+    
+    def extract_player_id_from_url(self, url: str) -> Optional[str]:
+        """Extract player ID from Transfermarkt URL"""
+        match = re.search(r'/spieler/(\d+)', url)
+        return match.group(1) if match else None
+    
+    def extract_slug_from_url(self, url: str) -> str:
+        """Extract slug from URL"""
+        try:
+            parsed = urlparse(url)
+            segments = [s for s in parsed.path.split('/') if s]
+            if segments:
+                return segments[0]
+        except Exception:
+            pass
+        return "unknown"
+    
+    def build_all_page_urls(self, base_url: str, page_types: Optional[List[str]] = None) -> Dict[str, str]:
+        """Build URLs for all page types (or only `page_types`, e.g. an applicability plan)"""
+        urls = {}
+        base = base_url.rstrip('/')
+        
+        # Add all page types
+        for page_type in (page_types if page_types is not None else self.PAGE_TYPES.keys()):
+            if page_type == 'profil':
+                urls[page_type] = base
+            else:
+                urls[page_type] = f"{base}/{page_type}"
+        
+        return urls
+    
+    def fetch_with_playwright(self, url: str) -> Optional[str]:
+        """Fetch page using Playwright"""
+        if not PLAYWRIGHT_AVAILABLE:
+            return None
+        
+        try:
+            logger.info(_green(f"Playwright fetching: {url[:80]}"))
+            with _lazy('playwright.sync_api', 'sync_playwright')() as p:
+                browser = p.chromium.launch(headless=True)
+                page = browser.new_page()
+                apply_to_playwright(page, self.render_profile)
+                self.rate_limiter.acquire(url)
+                started = time.monotonic()
+                response = page.goto(url, timeout=30000)
+                self.rate_limiter.feedback(url, response.status if response else None,
+                                           response.headers if response else None)
+                self.readiness.wait_playwright(page, url)
+                load_stats.record(self.render_profile, time.monotonic() - started)
+                content = page.content()
+                browser.close()
+                return content
+        except Exception as e:
+            logger.error(f"Playwright error: {e}")
+            return None
+    
+    def fetch_page(self, url: str, page_type: str, player_id: str, slug: str) -> Optional[str]:
+        """Fetch page from URL or cache"""
+        # Do not use on-disk caching; fetch and return HTML for immediate parsing.
+        # Pacing is done per host by the shared rate limiter
+        html_content = None
+        missing_key = self.missing_pages.key(player_id, page_type, url)
+        if self.missing_pages.is_missing(missing_key):
+            logger.info(f"Skipping {page_type} for {player_id}: known to be missing")
+            self.last_fetch_outcome = KNOWN_MISSING
+            return None
+
+        # Only transient failures are retried, with jittered exponential backoff;
+        # 429/503 pacing (Retry-After) is handled by the rate limiter itself
+        outcome, status = TRANSIENT, None
+        attempts = getattr(self, 'max_retries', 3)
+        for attempt in range(1, attempts + 1):
+            try:
+                logger.info(f"Downloading {url} (attempt {attempt})")
+                response = self.rate_limiter.get(self.session, url, timeout=getattr(self, 'timeout', 30))
+                status = getattr(response, 'status_code', None)
+                redirected_to = response.url if getattr(response, 'history', None) else None
+                outcome = classify_response(status, response.text if status == 200 else None,
+                                            page_type, redirected_to)
+                if outcome == OK:
+                    html_content = response.text
+                    break
+                logger.warning(f"{outcome.capitalize()} response {status} for {url}")
+            except Exception as e:
+                outcome, status = TRANSIENT, None
+                logger.debug(f"Requests fetch failed for {url} attempt {attempt}: {e}")
+
+            if outcome != TRANSIENT:
+                break
+            if attempt < attempts:
+                time.sleep(backoff_delay(attempt))
+
+        self.last_fetch_outcome = outcome
+        if outcome == MISSING:
+            # dead URL: no browser fallback, and later runs skip it outright
+            self.missing_pages.add(missing_key, f"HTTP {status}" if status != 200 else 'not found / redirected')
+            return None
+
+        # Playwright fallback (no disk writes)
+        if not html_content and self.use_playwright and page_type not in ['news']:
+            try:
+                html_content = self.fetch_with_playwright(url)
+            except Exception as e:
+                logger.debug(f"Playwright fetch failed for {url}: {e}")
+
+        return html_content
+    
+    def _parse(self, page_type: str, html: Any, empty: Any) -> Any:
+        """Parse with the registry parser for the page type, logging parser errors"""
+        try:
+            return parse_page(page_type, html)
+        except Exception as e:
+            logger.error(f"Error parsing {page_type}: {e}")
+            return empty
+
+    def parse_profile_page(self, html: Any) -> Dict[str, Any]:
+        """Parse player profile page"""
+        return self._parse('profil', html, {})
+    
+    def parse_injuries_page(self, html: Any) -> Dict[str, Any]:
+        """Parse injuries page"""
+        return self._parse('verletzungen', html, {'injuries_list': [], 'season_totals': {}})
+    
+    def parse_market_value_page(self, html: Any) -> Dict[str, Any]:
+        """Parse market value page"""
+        return self._parse('marktwertverlauf', html, {'history': []})
+    
+    def fetch_market_value_series(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """Market value series from the chart's JSON endpoint (pages that load the chart client-side)"""
+        url = GRAPH_API_URL.format(player_id=player_id)
+        try:
+            response = self.rate_limiter.get(self.session, url, timeout=getattr(self, 'timeout', 30))
+            if getattr(response, 'status_code', None) == 200:
+                series = extract_market_value_series(response.text)
+                if series:
+                    return series.to_dict()
+        except Exception as e:
+            logger.debug(f"Market value API fetch failed for {player_id}: {e}")
+        return None
+    
+    def parse_transfers_page(self, html: Any) -> List[Dict[str, str]]:
+        """Parse transfers page"""
+        return self._parse('transfers', html, [])
+    
+    def parse_balance_page(self, html: Any) -> List[Dict[str, Any]]:
+        """Parse balance page"""
+        return self._parse('bilanz', html, [])
+    
+    def parse_achievements_page(self, html: Any) -> Dict[str, Any]:
+        """Parse achievements page"""
+        return self._parse('erfolge', html, {})
+    
+    def parse_performance_page(self, html: Any, page_type: str) -> Any:
+        """Parse performance pages"""
+        return self._parse(page_type, html, {})
+    
+    def player_json_path(self, slug: str, player_id: str) -> str:
+        """Path of a player's stored JSON document"""
+        return self.store.path(slug, player_id)
+
+    def save_player_json(self, player_data: Dict, slug: str, player_id: str) -> None:
+        """Save player data to JSON file"""
+        try:
+            filepath = self.store.save(player_data, slug, player_id)
+            logger.info(f"Player data saved: {filepath}")
+        except Exception as e:
+            logger.error(f"Error saving player data: {e}")
+    
+    def scrape_page(self, url: str, page_type: str, player_id: str, slug: str) -> Any:
+        """Fetch and parse one player page"""
+        html = self.fetch_page(url, page_type, player_id, slug)
+        if not html:
+            if self.last_fetch_outcome in (MISSING, KNOWN_MISSING):
+                return {'error': 'Page does not exist'}
+            return {'error': 'Failed to fetch page'}
+        # parsed once: the player index and the extraction plans share the lxml tree
+        try:
+            doc = parse_html(html)
+        except Exception as e:
+            logger.debug(f"lxml could not parse {page_type}: {e}")
+            doc = html
+        # every profile link on the page (squads, teammates, transfers) feeds the name -> ID index
+        self.player_index.add_from_html(doc)
+        
+        # one parser per canonical page type (scrapers.tm_parsers), shared with the CLI
+        page_data = parse_page(page_type, html, doc)
+        
+        # links found on the page: canonical, deduplicated, capped (scrapers.links), from the same tree
+        try:
+            links = extract_links(doc, url, limit=200, with_text=True)
+        except Exception:
+            links = []
+
+        if page_type == 'marktwertverlauf' and isinstance(page_data, dict) and not page_data.get('series'):
+            series = self.fetch_market_value_series(player_id)
+            if series:
+                page_data['series'] = series
+
+        if page_type == 'profil' and isinstance(page_data, dict) and page_data.get('name'):
+            self.player_index.add(player_id, slug, re.sub(r'^#\d+\s*', '', page_data['name']),
+                                  page_data.get('current_club'))
+
+        if page_data:
+            if isinstance(page_data, dict):
+                page_data['found_urls'] = links
+            else:
+                page_data = {'data': page_data, 'found_urls': links}
+        else:
+            page_data = {'error': 'No data extracted', 'found_urls': links}
+
+        # typed columns next to the raw cell text, so consumers don't re-parse strings
+        try:
+            normalize_page(page_data)
+        except Exception as e:
+            logger.debug(f"Table normalization failed for {page_type}: {e}")
+
+        return page_data
+    
+    def _scrape_page_safe(self, url: str, page_type: str, player_id: str, slug: str) -> Any:
+        """scrape_page, with errors recorded as the page's data"""
+        try:
+            return self.scrape_page(url, page_type, player_id, slug)
+        except Exception as e:
+            logger.error(f"Error scraping {page_type}: {e}")
+            self.last_fetch_outcome = None
+            return {'error': str(e)}
+    
+    def scrape_player(self, base_url: str, player_name: str, player_id: str, slug: str,
+                      requested_at: Optional[float] = None) -> Dict[str, Any]:
+        """Scrape (or incrementally refresh) one player and store the merged document"""
+        # (read under the player lock: another process may just have refreshed it)
+        stored = self.refresh.load(self.player_json_path(slug, player_id))
+        if stored and requested_at and self.store.saved_since(slug, player_id, requested_at):
+            logger.info(f"{player_name}: scraped by another match meanwhile, reusing it")
+            return stored
+        if not self.incremental:
+            stored = None
+
+        player_data = {
+            'player_id': player_id,
+            'slug': slug,
+            'name': player_name,
+            'base_url': base_url,
+            'scraped_at': datetime.utcnow().isoformat() + 'Z',
+            'pages': {}
+        }
+        
+        # Only pages past their staleness window are fetched again (scrapers.tm_refresh)
+        stale = self.refresh.stale_pages(stored, self.PAGE_TYPES)
+        if not stale:
+            logger.info(f"{player_name}: all pages fresh, nothing to fetch")
+            return stored
+        if stored:
+            logger.info(f"{player_name}: refreshing {len(stale)} stale pages: {stale}")
+
+        # Profile first: its role / national-team hints decide which other pages apply
+        hints = profile_hints((stored or {}).get('pages', {}).get('profil'))
+        if 'profil' in stale:
+            page_data = self._scrape_page_safe(self.build_all_page_urls(base_url, ['profil'])['profil'],
+                                               'profil', player_id, slug)
+            player_data['pages']['profil'] = page_data
+            hints = profile_hints(page_data)
+        fetch, skipped = self.applicability.plan(player_id, [pt for pt in stale if pt != 'profil'], hints)
+        if skipped:
+            logger.info(f"Skipping {len(skipped)} non-applicable pages for {player_name}: {skipped}")
+
+        for page_type, url in self.build_all_page_urls(base_url, fetch).items():
+            page_data = self._scrape_page_safe(url, page_type, player_id, slug)
+            player_data['pages'][page_type] = page_data
+            if is_useful(page_data):
+                self.applicability.record(player_id, page_type, USEFUL, hints)
+            elif self.last_fetch_outcome in (MISSING, KNOWN_MISSING):
+                self.applicability.record(player_id, page_type, PAGE_MISSING, hints)
+            elif self.last_fetch_outcome == OK:
+                # fetched fine but nothing to extract
+                self.applicability.record(player_id, page_type, EMPTY, hints)
+
+        for page_type, reason in skipped.items():
+            player_data['pages'][page_type] = {'skipped': reason}
+        self.applicability.save()
+
+        # Optionally follow selected links found on the player's pages and parse them
+        if getattr(self, 'follow_links', False):
+            try:
+                seen = set()
+                linked_results = []
+                patterns = [p.lower() for p in (self.follow_patterns or [])]
+
+                # collect candidate hrefs from all pages' found_urls
+                candidates = []
+                for page_obj in player_data.get('pages', {}).values():
+                    if isinstance(page_obj, dict):
+                        furls = page_obj.get('found_urls') or []
+                    else:
+                        furls = []
+                    if isinstance(furls, list):
+                        for fu in furls:
+                            if isinstance(fu, dict):
+                                href = fu.get('href')
+                            else:
+                                href = fu
+                            if href:
+                                candidates.append(href)
+
+                for href in candidates:
+                    # found_urls are canonical already; older stored pages may still hold raw hrefs
+                    if href.startswith(('http://', 'https://')):
+                        full = href if self._follow_allowed(href) else None
+                    else:
+                        full = self._normalize_and_filter_link(href, base_url)
+                    if not full:
+                        continue
+                    if full in seen:
+                        continue
+                    # if patterns are provided, require at least one to match
+                    if patterns and not any(pat in full.lower() for pat in patterns):
+                        continue
+                    seen.add(full)
+                    logger.info(f"Following linked URL: {full}")
+                    linked_html = self.fetch_page(full, 'linked', player_id, slug)
+                    dead_link = self.last_fetch_outcome in (MISSING, KNOWN_MISSING)
+                    # fallback: try Playwright if available
+                    if not linked_html and not dead_link and getattr(self, 'use_playwright', False):
+                        try:
+                            logger.info(f"Requests failed, trying Playwright for {full}")
+                            linked_html = self.fetch_with_playwright(full)
+                        except Exception as e:
+                            logger.debug(f"Playwright fallback failed for {full}: {e}")
+                    # fallback: try Selenium if available
+                    if not linked_html and not dead_link and getattr(self, 'use_selenium', False):
+                        try:
+                            logger.info(f"Trying Selenium for linked page {full}")
+                            drv = setup_driver(headless=True, render_profile=self.render_profile)
+                            if drv:
+                                try:
+                                    self.rate_limiter.acquire(full)
+                                    started = time.monotonic()
+                                    drv.get(full)
+                                    self.readiness.wait_selenium(drv, full)
+                                    load_stats.record(self.render_profile, time.monotonic() - started)
+                                    linked_html = drv.page_source
+                                finally:
+                                    try:
+                                        drv.quit()
+                                    except:
+                                        pass
+                        except Exception as e:
+                            logger.debug(f"Selenium fallback failed for {full}: {e}")
+
+                    if not linked_html:
+                        logger.info(f"Could not fetch linked URL: {full}")
+                        continue
+
+                    parsed = self.parse_generic_page(linked_html, full)
+                    linked_results.append(parsed)
+                    if len(linked_results) >= int(getattr(self, 'max_follow_links', 20)):
+                        break
+
+                if linked_results:
+                    player_data['pages']['linked_pages'] = linked_results
+            except Exception as e:
+                logger.error(f"Error following links for {slug}: {e}")
+
+        self.player_index.save()
+        player_data = self.refresh.merge(stored, player_data)
+        self.save_player_json(player_data, slug, player_id)
+        logger.info(f"Completed player: {player_name} ({player_id})")
+        return player_data
+    
+    def execution_url_agentent(self, driver: Any, players: List[Dict]) -> List[Dict]:
+        """Execute Transfermarkt scraping for all players"""
+        all_player_data = []
+        scraped: Dict[str, Dict] = {}
+        
+        for player in players:
+            if isinstance(player, dict):
+                base_url = player.get('url')
+                player_name = player.get('name', 'unknown')
+            else:
+                base_url = player
+                player_name = 'unknown'
+            
+            if not base_url:
+                continue
+            
+            logger.info(f"Processing player: {player_name}")
+            
+            player_id = self.extract_player_id_from_url(base_url)
+            slug = self.extract_slug_from_url(base_url)
+            
+            if not player_id:
+                logger.error(f"Invalid URL, cannot extract ID: {base_url}")
+                continue
+            
+            if player_id in scraped:
+                logger.info(f"{player_name} already scraped in this run")
+                all_player_data.append(scraped[player_id])
+                continue
+            
+            # One scrape per player at a time across matches/processes; waiters reuse its result
+            requested_at = time.time()
+            with self.store.lock(player_id, player_name):
+                player_data = self.scrape_player(base_url, player_name, player_id, slug, requested_at)
+            scraped[player_id] = player_data
+            all_player_data.append(player_data)
+        
+        if self.missing_pages.hits:
+            logger.info(f"Skipped {self.missing_pages.hits} known-missing pages")
+        self.applicability.log_summary()
+        self.refresh.log_summary()
+        load_stats.log_summary()
+        self.readiness.log_summary()
+        PARSERS.log_summary()
+        return all_player_data
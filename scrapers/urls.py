@@ -0,0 +1,326 @@
+"""URL content extraction through Selenium."""
+import os
+import re
+import time
+from urllib.parse import urlparse
+from typing import Any, Dict, List, Optional
+
+from .checkpoint import CheckpointJournal
+from .common import _lazy, logger
+from .config import Config
+from .driver import ensure_driver_alive, setup_driver
+from .ratelimit import shared_limiter
+from .readiness import shared_policy
+from .render_profile import DEFAULT_PROFILE, apply_to_selenium, load_stats
+from .text_extract import extract_page
+
+
+class Urls_Extraction:
+    """Extracts content from URLs"""
+    
+    def __init__(self, render_profile: str = DEFAULT_PROFILE):
+        self.conf = Config()
+        # What the browser may download (see scrapers.render_profile)
+        self.render_profile = render_profile
+        # Optional per-match journal (set by MatchOrchestrator); a default one
+        # under the output directory is used otherwise
+        self.checkpoint: Optional[CheckpointJournal] = None
+        # Waits for page readiness instead of a fixed sleep (learns per domain)
+        self.readiness = shared_policy()
+        self.rate_limiter = shared_limiter()
+        
+    def ensure_driver_alive(self, driver: Any) -> Any:
+        """Ensure driver is still alive, restart if needed"""
+        return ensure_driver_alive(driver, self.render_profile)
+    
+    def extract_domain(self, driver: Any, url: str) -> Dict[str, Any]:
+        """Extract content from a single URL"""
+        WebDriverException = _lazy('selenium.common.exceptions', 'WebDriverException')
+        try:
+            apply_to_selenium(driver, self.render_profile)
+            # per-host pacing shared with every other scraper and process
+            self.rate_limiter.acquire(url)
+            started = time.monotonic()
+            driver.get(url)
+            self.readiness.wait_selenium(driver, url)
+            load_stats.record(self.render_profile, time.monotonic() - started)
+            
+            page_source = driver.page_source
+            # one lxml pass up to the text cap: boilerplate removal, text, counts and links
+            page = extract_page(page_source, max_chars=self.conf.max_content_length, count_all=False,
+                                base_url=url)
+            title = page['title']
+            content_text = page['content']
+            word_count = page['word_count']
+            line_count = page['line_count']
+            found_urls = page['found_urls']
+            
+            # Convert to markdown if content is too short
+            if len(content_text) < 200:
+                h = _lazy('html2text').HTML2Text()
+                h.ignore_links = True
+                h.ignore_images = True
+                content_text = re.sub(r'\s+', ' ', h.handle(page_source)).strip()
+                line_count = len([s for s in content_text.split('. ') if s.strip()])
+                word_count = len(content_text.split())
+                content_text = content_text[:self.conf.max_content_length]
+            
+            return {
+                'url': url,
+                'title': title[:200],
+                'content': content_text,
+                'word_count': word_count,
+                'line_count': line_count,
+                'domain': urlparse(url).netloc,
+                'found_urls': found_urls,  # canonical, deduplicated, first 100
+                'success': True
+            }
+            
+        except WebDriverException as e:
+            logger.error(f"Selenium error for {url}: {e}")
+            return {'url': url, 'success': False, 'error': str(e)}
+        except Exception as e:
+            logger.error(f"Extract error for {url}: {e}")
+            return {'url': url, 'success': False, 'error': str(e)}
+    
+    def stats_dictonary_category(self, urls_data: List[Dict]) -> Dict[str, List]:
+        """Group URLs by category"""
+        dictonary_category = {}
+        for entry in urls_data:
+            if isinstance(entry, dict):
+                category = entry.get('category', 'uncategorized')
+                if category not in dictonary_category:
+                    dictonary_category[category] = []
+                dictonary_category[category].append(entry)
+        return dictonary_category
+    
+    def process_url(self, driver: Any, url_dict: List[Dict], all_results: List, 
+                    stats: Dict, output_dir: str, timestamp: int) -> None:
+        """Process a list of URLs"""
+        WebDriverException = _lazy('selenium.common.exceptions', 'WebDriverException')
+        try:
+            start_index = len(all_results)
+            
+            for i, url_info in enumerate(url_dict, 1):
+                driver = self.ensure_driver_alive(driver)
+                
+                if isinstance(url_info, dict):
+                    url_to_fetch = url_info.get('url')
+                    category = url_info.get('category', '')
+                else:
+                    url_to_fetch = url_info
+                    category = ''
+                
+                # Already extracted by a previous (crashed) run of this match
+                restored = self.checkpoint.get('url', url_to_fetch) if self.checkpoint else None
+                if restored is not None:
+                    result = restored
+                else:
+                    # Extract content with retry
+                    try:
+                        result = self.extract_domain(driver, url_to_fetch)
+                    except WebDriverException as e:
+                        logger.error(f"Selenium error: {str(e)[:80]}")
+                        driver = self.ensure_driver_alive(driver)
+                        try:
+                            result = self.extract_domain(driver, url_to_fetch)
+                        except Exception as e2:
+                            logger.error(f"Second attempt failed: {str(e2)[:80]}")
+                            result = {'url': url_to_fetch, 'success': False, 'error': str(e2)}
+                    except KeyboardInterrupt:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Error processing URL: {str(e)[:80]}")
+                        result = {'url': url_to_fetch, 'success': False, 'error': str(e)}
+                    
+                    # Only successful extractions are journaled; failures are retried on restart
+                    if self.checkpoint and result.get('success'):
+                        self.checkpoint.record('url', url_to_fetch, result)
+                
+                if category:
+                    result['category'] = category
+                
+                all_results.append(result)
+                self.conf.generate_report(result, stats)
+                
+                # Save batch if needed
+                if self.conf.batch_size > 0 and i % self.conf.batch_size == 0:
+                    start_idx = i - self.conf.batch_size + 1
+                    end_idx = i
+                    batch = all_results[start_idx-1:end_idx]
+                    self.conf.save_batch(batch, output_dir, start_idx, end_idx, timestamp)
+                
+            
+            # Save remaining results
+            new_count = len(all_results) - start_index
+            if new_count > 0 and new_count < self.conf.batch_size:
+                self.conf.save_batch(all_results[start_index:], output_dir, 
+                                     start_index + 1, len(all_results), timestamp)
+                
+        except KeyboardInterrupt:
+            logger.info("Keyboard interrupt received, stopping early...")
+            raise
+    
+    def execution_url_agentent(self, driver: Any, urls_data: List) -> List[Dict]:
+        """Main execution method for URL extraction"""
+        logger.info("URL AGENT STARTING URL SCRAPING...")
+        
+        all_results = []
+        stats = {'success': 0, 'failed': 0, 'total_words': 0, 'total_lines': 0}
+        
+        # Setup driver if not provided; only quit drivers we created so a
+        # caller (e.g. a pool worker) can keep its browser warm across matches
+        owns_driver = not driver
+        if not driver:
+            driver = setup_driver(render_profile=self.render_profile)
+            if not driver:
+                logger.error("Failed to setup driver")
+                return []
+        
+        output_dir = self.conf.output_directory
+        if self.checkpoint is None:
+            self.checkpoint = CheckpointJournal(os.path.join(output_dir, 'checkpoints'), 'urls')
+        
+        try:
+            dictonary_category = self.stats_dictonary_category(urls_data)
+            logger.info(f"Found categories: {list(dictonary_category.keys())}")
+            
+            timestamp = int(time.time())
+            
+            for category, urls in dictonary_category.items():
+                logger.info(f"\nProcessing category: {category} ({len(urls)} URLs)")
+                self.process_url(driver, urls, all_results, stats, output_dir, timestamp)
+            
+            logger.info(f"\nScraping complete: {stats['success']} successful, {stats['failed']} failed")
+            logger.info(f"Total words: {stats['total_words']}, Total lines: {stats['total_lines']}")
+            load_stats.log_summary()
+            self.readiness.log_summary()
+            
+            # Every URL was processed: the next run should start from scratch
+            self.checkpoint.finish()
+            self.checkpoint = None
+            
+        except KeyboardInterrupt:
+            logger.info("Interrupted by user")
+        finally:
+            if owns_driver:
+                try:
+                    driver.quit()
+                except:
+                    pass
+        
+        return all_results
+
+    def scrape_found_urls_universal(self, driver: Any, source_item: Dict, max_depth: int = 1, max_urls: int = 30) -> Dict:
+        """
+        Universal method to scrape found URLs from any source item (URL extraction or news extraction)
+
+        Args:
+            driver: Selenium WebDriver instance
+            source_item: The source item containing found_urls (from either scraper)
+            max_depth: Maximum depth to follow links
+            max_urls: Maximum number of URLs to scrape
+
+        Returns:
+            Dict: Enhanced item with nested scraped data
+        """
+        # Check if the item has found_urls (works for both URL and News results)
+        if not source_item.get('found_urls'):
+            return source_item
+
+        # Initialize the enhanced result
+        enhanced_item = source_item.copy()
+        enhanced_item['scraped_urls'] = []
+        enhanced_item['scraping_stats'] = {
+            'total_attempted': 0,
+            'successful': 0,
+            'failed': 0,
+            'filtered_out': 0
+        }
+
+        # Track visited URLs to avoid duplicates
+        visited_urls = set()
+
+        # Get source information
+        source_url = source_item.get('url', 'unknown')
+        source_category = source_item.get('category', source_item.get('source_label', 'unknown'))
+        source_title = source_item.get('title', '')
+
+        urls_to_scrape = source_item['found_urls'][:max_urls]
+
+        logger.info(f"Scraping {len(urls_to_scrape)} found URLs from: {source_url[:80]}...")
+
+        # Patterns to filter out (common non-article URLs)
+        skip_patterns = [
+            'facebook.com', 'twitter.com', 'x.com', 'instagram.com', 'youtube.com',
+            'tiktok.com', 'reddit.com', 'linkedin.com', 'pinterest.com',
+            'login', 'signin', 'register', 'signup', 'subscribe',
+            'privacy', 'terms', 'cookie', 'gdpr',
+            '.pdf', '.jpg', '.png', '.gif', '.mp4',
+            'shop.', 'store.', 'checkout', 'cart',
+            'javascript:', 'mailto:', 'tel:',
+            '#comments', '#respond', '#reply'
+        ]
+
+        for i, url in enumerate(urls_to_scrape, 1):
+            if url in visited_urls:
+                continue
+            visited_urls.add(url)
+
+            # Skip non-http URLs and unwanted patterns
+            if not url.startswith('http'):
+                enhanced_item['scraping_stats']['filtered_out'] += 1
+                continue
+
+            if any(pattern in url.lower() for pattern in skip_patterns):
+                enhanced_item['scraping_stats']['filtered_out'] += 1
+                continue
+
+            # Prefer same-domain URLs (more likely to be relevant articles)
+            source_domain = urlparse(source_url).netloc
+            url_domain = urlparse(url).netloc
+
+            enhanced_item['scraping_stats']['total_attempted'] += 1
+
+            try:
+                # Extract content from the found URL
+                result = self.extract_domain(driver, url)
+
+                # Add reference information
+                result['found_from'] = {
+                    'url': source_url,
+                    'title': source_title[:100] if source_title else '',
+                    'category': source_category
+                }
+                result['depth'] = 1
+                result['is_same_domain'] = (source_domain == url_domain)
+
+                # Add to scraped_urls list
+                enhanced_item['scraped_urls'].append(result)
+
+                if result.get('success'):
+                    enhanced_item['scraping_stats']['successful'] += 1
+                else:
+                    enhanced_item['scraping_stats']['failed'] += 1
+
+                logger.info(f"  [{i}/{len(urls_to_scrape)}] Scraped: {url[:60]}... ({'✓' if result.get('success') else '✗'})")
+
+            except Exception as e:
+                logger.error(f"  Error scraping {url[:60]}...: {str(e)[:50]}")
+                enhanced_item['scraped_urls'].append({
+                    'url': url,
+                    'found_from': {
+                        'url': source_url,
+                        'title': source_title[:100] if source_title else '',
+                        'category': source_category
+                    },
+                    'success': False,
+                    'error': str(e)
+                })
+                enhanced_item['scraping_stats']['failed'] += 1
+
+        logger.info(f"Completed: {enhanced_item['scraping_stats']['successful']} successful, "
+                    f"{enhanced_item['scraping_stats']['failed']} failed, "
+                    f"{enhanced_item['scraping_stats']['filtered_out']} filtered")
+
+        return enhanced_item
@@ -0,0 +1,34 @@
+"""EUR amounts as Transfermarkt displays them."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.market_value import parse_eur  # noqa: E402
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('€80.00m', 80_000_000),
+    ('€1.50m', 1_500_000),
+    ('€2.5bn', 2_500_000_000),
+    ('€800k', 800_000),
+    ('500 Tsd. €', 500_000),
+    ('12,50 Mio. €', 12_500_000),
+    ('1,500 Mio. €', 1_500_000),
+    ('1.500.000 €', 1_500_000),
+    ('1,500,000', 1_500_000),
+    ('€15.000.000', 15_000_000),
+    ('1.000 €', 1_000),
+    ('€1,500k', 1_500_000),
+    ('€1,500 k', 1_500_000),
+    ('€2,500Th.', 2_500_000),
+    ('€1,250m', 1_250_000_000),
+    ('100', 100),
+    ('-', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_eur(text, expected):
+    assert parse_eur(text) == expected
@@ -0,0 +1,49 @@
+"""Resuming the news scraper from its checkpoint journal."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.checkpoint import CheckpointJournal  # noqa: E402
+from scrapers.news import resolve_pending  # noqa: E402
+
+GOOGLE_URL = 'https://news.google.com/rss/articles/CBMiexample?oc=5'
+REAL_URL = 'https://www.example.com/football/article'
+
+
+class FakeResolver:
+    """resolve_many stand-in that resolves only the URLs it was given answers for"""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def resolve_many(self, google_urls, browser_fallback=None):
+        self.calls.append(list(google_urls))
+        return {url: self.answers[url] for url in google_urls if url in self.answers}
+
+
+def test_failed_resolution_is_retried_after_restart(tmp_path):
+    journal = CheckpointJournal(str(tmp_path), 'news')
+    failing = FakeResolver({})
+    resolve_pending(journal, failing, [GOOGLE_URL])
+    assert failing.calls == [[GOOGLE_URL]]
+    assert not journal.is_done('resolved', GOOGLE_URL)
+
+    # restarted process: replays the journal from disk
+    journal = CheckpointJournal(str(tmp_path), 'news')
+    working = FakeResolver({GOOGLE_URL: REAL_URL})
+    resolve_pending(journal, working, [GOOGLE_URL])
+    assert working.calls == [[GOOGLE_URL]]
+    assert journal.get('resolved', GOOGLE_URL) == REAL_URL
+
+
+def test_resolved_url_is_not_resolved_again_after_restart(tmp_path):
+    journal = CheckpointJournal(str(tmp_path), 'news')
+    resolve_pending(journal, FakeResolver({GOOGLE_URL: REAL_URL}), [GOOGLE_URL])
+
+    journal = CheckpointJournal(str(tmp_path), 'news')
+    resolver = FakeResolver({GOOGLE_URL: REAL_URL})
+    resolve_pending(journal, resolver, [GOOGLE_URL])
+    assert resolver.calls == []
+    assert journal.get('resolved', GOOGLE_URL) == REAL_URL